@@ -4,6 +4,8 @@
 # $ENVIRONMENT = The environment (production/release/staging).
 # $REPO_URI = The URI of the ECR repo to push to.
 # $CLUSTER = The name of the ECS cluster to deploy to.
+# $FARGATE_BURST = Set to "true" when the stack runs in the ec2-fargate-burst compute mode.
+# $SCHEDULER_MODE = Set to "eventbridge" when the scheduler runs as EventBridge scheduled tasks.
 # $AWS_ACCESS_KEY_ID = The AWS access key.
 # $AWS_SECRET_ACCESS_KEY = The AWS secret access key.
 # $AWS_DEFAULT_REGION = The AWS region.
@@ -22,5 +24,20 @@ export ENV_SECRET_ID=".env.api.${ENVIRONMENT}"
 
 # Deploy the update to the services.
 SERVICE="api" ./docker/deploy.sh
-SERVICE="scheduler" ./docker/deploy.sh
-SERVICE="queue-worker" ./docker/deploy.sh
+SERVICE="queue-worker-default" ./docker/deploy.sh
+SERVICE="queue-worker-notifications" ./docker/deploy.sh
+SERVICE="queue-worker-search" ./docker/deploy.sh
+SERVICE="image-worker" ./docker/deploy.sh
+
+# The scheduled tasks pull the latest image on each run, so there is no service to update.
+if [[ "${SCHEDULER_MODE}" != "eventbridge" ]]; then
+    SERVICE="scheduler" ./docker/deploy.sh
+fi
+
+# Deploy the update to the Fargate burst services.
+if [[ "${FARGATE_BURST}" == "true" ]]; then
+    SERVICE="api-burst" ./docker/deploy.sh
+    SERVICE="queue-worker-default-burst" ./docker/deploy.sh
+    SERVICE="queue-worker-notifications-burst" ./docker/deploy.sh
+    SERVICE="queue-worker-search-burst" ./docker/deploy.sh
+fi
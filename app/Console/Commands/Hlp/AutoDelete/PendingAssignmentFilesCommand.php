@@ -31,7 +31,9 @@ class PendingAssignmentFilesCommand extends Command
         $days = File::PEDNING_ASSIGNMENT_AUTO_DELETE_DAYS;
 
         $this->line("Deleting file created {$days} day(s) ago...");
-        $count = File::pendingAssignmentDueForDeletion()->delete();
-        $this->info("Deleted {$count} file(s).");
+        // Delete each model so the observer also removes the resized versions and the files on disk.
+        $files = File::pendingAssignmentDueForDeletion()->get();
+        $files->each->delete();
+        $this->info("Deleted {$files->count()} file(s).");
     }
 }
@@ -0,0 +1,102 @@
+<?php
+
+namespace App\Console\Commands\Hlp;
+
+use App\Models\File;
+use Exception;
+use Illuminate\Console\Command;
+use Illuminate\Database\Eloquent\ModelNotFoundException;
+use Illuminate\Support\Facades\Queue;
+
+class ProcessImageUploadsCommand extends Command
+{
+    /**
+     * The name and signature of the console command.
+     *
+     * @var string
+     */
+    protected $signature = 'hlp:process-image-uploads {--once : Only process a single batch of messages}';
+
+    /**
+     * The console command description.
+     *
+     * @var string
+     */
+    protected $description = 'Starts an infinite loop for creating resized versions of uploaded images';
+
+    /**
+     * Execute the console command.
+     *
+     * @return mixed
+     */
+    public function handle()
+    {
+        /** @var \Illuminate\Queue\SqsQueue $connection */
+        $connection = Queue::connection('sqs');
+        $queueUrl = $connection->getQueue(config('hlp.image_uploads_queue'));
+
+        do {
+            $result = $connection->getSqs()->receiveMessage([
+                'QueueUrl' => $queueUrl,
+                'MaxNumberOfMessages' => 10,
+                'WaitTimeSeconds' => 20,
+            ]);
+
+            foreach ($result->get('Messages') ?? [] as $message) {
+                try {
+                    $this->processMessage($message['Body']);
+                } catch (ModelNotFoundException $exception) {
+                    // The file is uploaded before its row is committed, so retry shortly instead of reporting.
+                    $connection->getSqs()->changeMessageVisibility([
+                        'QueueUrl' => $queueUrl,
+                        'ReceiptHandle' => $message['ReceiptHandle'],
+                        'VisibilityTimeout' => 10,
+                    ]);
+
+                    continue;
+                } catch (Exception $exception) {
+                    // Leave the message on the queue to be retried, or moved to the dead-letter queue.
+                    report($exception);
+
+                    continue;
+                }
+
+                $connection->getSqs()->deleteMessage([
+                    'QueueUrl' => $queueUrl,
+                    'ReceiptHandle' => $message['ReceiptHandle'],
+                ]);
+            }
+        } while (!$this->option('once'));
+    }
+
+    /**
+     * Create the resized versions for each file in an S3 event notification.
+     *
+     * @param string $body
+     */
+    public function processMessage(string $body)
+    {
+        $event = json_decode($body, true);
+
+        // The test event sent when the notification is configured has no records.
+        foreach ($event['Records'] ?? [] as $record) {
+            if (strpos($record['eventName'], 'ObjectCreated:') !== 0) {
+                continue;
+            }
+
+            // File paths are in the format "files/{visibility}/{id}-{filename}".
+            $key = urldecode($record['s3']['object']['key']);
+            $fileId = substr(basename($key), 0, 36);
+
+            /** @var \App\Models\File $file */
+            $file = File::findOrFail($fileId);
+
+            // Resized versions are also uploaded to the bucket, so skip them.
+            if ($file->isResizedImage() || !$file->isImage()) {
+                continue;
+            }
+
+            $file->createCachedResizedVersions();
+        }
+    }
+}
@@ -101,13 +101,7 @@ class LocationController extends Controller
             $location->updateCoordinate()->save();
 
             if ($request->filled('image_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->image_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->image_file_id)->assigned();
             }
 
             event(EndpointHit::onCreate($request, "Created location [{$location->id}]", $location));
@@ -164,13 +158,7 @@ class LocationController extends Controller
             $location->updateCoordinate()->save();
 
             if ($request->filled('image_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->image_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->image_file_id)->assigned();
             }
 
             event(EndpointHit::onUpdate($request, "Updated location [{$location->id}]", $location));
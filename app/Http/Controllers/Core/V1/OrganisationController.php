@@ -89,13 +89,7 @@ class OrganisationController extends Controller
             ]);
 
             if ($request->filled('logo_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->logo_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->logo_file_id)->assigned();
             }
 
             if ($request->filled('social_medias')) {
@@ -173,13 +167,7 @@ class OrganisationController extends Controller
             }
 
             if ($request->filled('logo_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->logo_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->logo_file_id)->assigned();
             }
 
             event(EndpointHit::onUpdate($request, "Updated organisation [{$organisation->id}]", $organisation));
@@ -180,24 +180,12 @@ class ServiceController extends Controller
 
             if ($request->filled('gallery_items')) {
                 foreach ($request->gallery_items as $galleryItem) {
-                    /** @var \App\Models\File $file */
-                    $file = File::findOrFail($galleryItem['file_id'])->assigned();
-
-                    // Create resized version for common dimensions.
-                    foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                        $file->resizedVersion($maxDimension);
-                    }
+                    File::findOrFail($galleryItem['file_id'])->assigned();
                 }
             }
 
             if ($request->filled('logo_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->logo_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->logo_file_id)->assigned();
             }
 
             event(EndpointHit::onCreate($request, "Created support listing [{$service->id}]", $service));
@@ -347,13 +335,7 @@ class ServiceController extends Controller
 
             if ($request->filled('gallery_items')) {
                 foreach ($request->gallery_items as $galleryItem) {
-                    /** @var \App\Models\File $file */
-                    $file = File::findOrFail($galleryItem['file_id'])->assigned();
-
-                    // Create resized version for common dimensions.
-                    foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                        $file->resizedVersion($maxDimension);
-                    }
+                    File::findOrFail($galleryItem['file_id'])->assigned();
                 }
             }
 
@@ -364,13 +346,7 @@ class ServiceController extends Controller
             }
 
             if ($request->filled('logo_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->logo_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->logo_file_id)->assigned();
             }
 
             event(EndpointHit::onUpdate($request, "Updated service [{$service->id}]", $service));
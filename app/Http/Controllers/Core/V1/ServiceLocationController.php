@@ -105,13 +105,7 @@ class ServiceLocationController extends Controller
             }
 
             if ($request->filled('image_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->image_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->image_file_id)->assigned();
             }
 
             event(EndpointHit::onCreate($request, "Created support listing location [{$serviceLocation->id}]", $serviceLocation));
@@ -186,13 +180,7 @@ class ServiceLocationController extends Controller
             }
 
             if ($request->filled('image_file_id')) {
-                /** @var \App\Models\File $file */
-                $file = File::findOrFail($request->image_file_id)->assigned();
-
-                // Create resized version for common dimensions.
-                foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
-                    $file->resizedVersion($maxDimension);
-                }
+                File::findOrFail($request->image_file_id)->assigned();
             }
 
             event(EndpointHit::onUpdate($request, "Updated support listing location [{$serviceLocation->id}]", $serviceLocation));
@@ -0,0 +1,33 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use Illuminate\Http\Middleware\SetCacheHeaders;
+
+class SetGuestCacheHeaders extends SetCacheHeaders
+{
+    /**
+     * Add cache related HTTP headers for guests, as authenticated users
+     * can see content (such as inactive services) that guests cannot.
+     *
+     * @param \Illuminate\Http\Request $request
+     * @param \Closure $next
+     * @param string|array $options
+     * @throws \InvalidArgumentException
+     * @return \Symfony\Component\HttpFoundation\Response
+     */
+    public function handle($request, Closure $next, $options = [])
+    {
+        if (auth('api')->guest()) {
+            $response = parent::handle($request, $next, $options);
+        } else {
+            $response = $next($request);
+            $response->headers->set('Cache-Control', 'private, no-cache');
+        }
+
+        $response->setVary('Authorization', false);
+
+        return $response;
+    }
+}
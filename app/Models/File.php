@@ -186,6 +186,40 @@ class File extends Model implements Responsable
         return $file;
     }
 
+    /**
+     * Create resized versions of the current instance for the common dimensions.
+     *
+     * @return \App\Models\File
+     */
+    public function createCachedResizedVersions(): self
+    {
+        foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
+            $this->resizedVersion($maxDimension);
+        }
+
+        return $this;
+    }
+
+    /**
+     * @return bool
+     */
+    public function isImage(): bool
+    {
+        return in_array($this->mime_type, [
+            static::MIME_TYPE_PNG,
+            static::MIME_TYPE_JPG,
+            static::MIME_TYPE_JPEG,
+        ]);
+    }
+
+    /**
+     * @return bool
+     */
+    public function isResizedImage(): bool
+    {
+        return ($this->meta['type'] ?? null) === static::META_TYPE_RESIZED_IMAGE;
+    }
+
     /**
      * Get a file record which is a resized version of the specified placeholder.
      *
@@ -16,6 +16,8 @@ class FileObserver
         File::query()
             ->whereRaw('`meta`->>"$.type" = ?', [File::META_TYPE_RESIZED_IMAGE])
             ->whereRaw('`meta`->>"$.data.file_id" = ?', [$file->id])
+            ->get()
+            ->each
             ->delete();
     }
 
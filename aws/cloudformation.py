@@ -2,17 +2,85 @@ import uuid
 from template import create_template
 from parameters import create_uuid_parameter, create_environment_parameter, create_certificate_arn_parameter, create_vpc_parameter, \
     create_subnets_parameter, create_database_password_parameter, create_database_class_parameter, \
-    create_database_allocated_storage_parameter, create_redis_node_class_parameter, create_redis_nodes_count_parameter, \
-    create_api_instance_class_parameter, create_api_instance_count_parameter, create_api_task_count_parameter, \
-    create_scheduler_task_count_parameter, create_queue_worker_task_count_parameter, \
-    create_elasticsearch_instance_class_parameter, create_elasticsearch_instance_count_parameter
+    create_database_allocated_storage_parameter, create_redis_node_class_parameter, create_redis_shards_count_parameter, \
+    create_redis_replicas_per_shard_parameter, create_api_instance_class_parameter, create_api_instance_min_count_parameter, \
+    create_api_instance_max_count_parameter, create_api_instance_target_capacity_parameter, create_api_task_count_parameter, \
+    create_scheduler_task_count_parameter, create_scheduler_mode_parameter, \
+    create_scheduler_schedule_expression_parameter, create_queue_worker_task_count_parameter, \
+    create_elasticsearch_instance_class_parameter, create_elasticsearch_instance_count_parameter, \
+    create_api_task_min_count_parameter, create_api_task_max_count_parameter, \
+    create_api_task_target_request_count_parameter, create_api_task_target_cpu_utilisation_parameter, \
+    create_api_task_target_memory_utilisation_parameter, create_queue_worker_task_min_count_parameter, \
+    create_queue_worker_task_max_count_parameter, create_queue_worker_target_backlog_parameter, \
+    create_queue_worker_max_message_age_parameter, create_queue_worker_memory_reservation_parameter, \
+    create_queue_worker_sleep_parameter, create_queue_worker_delay_parameter, \
+    create_queue_worker_timeout_parameter, create_queue_worker_memory_limit_parameter, \
+    create_database_read_replica_count_parameter, create_database_read_replica_class_parameter, \
+    create_database_engine_mode_parameter, create_database_cluster_instance_class_parameter, \
+    create_database_cluster_reader_min_count_parameter, create_database_cluster_reader_max_count_parameter, \
+    create_database_cluster_reader_scaling_metric_parameter, create_database_cluster_reader_target_value_parameter, \
+    create_api_domain_name_parameter, create_cdn_certificate_arn_parameter, \
+    create_elasticsearch_availability_zone_count_parameter, create_elasticsearch_dedicated_master_count_parameter, \
+    create_elasticsearch_dedicated_master_class_parameter, create_performance_profile_parameter, \
+    create_queue_worker_cpu_parameter, create_queue_worker_memory_hard_limit_parameter, \
+    create_queue_worker_nofile_limit_parameter, create_api_task_cpu_parameter, create_api_task_memory_reservation_parameter, \
+    create_api_task_memory_hard_limit_parameter, create_api_task_nofile_limit_parameter, \
+    create_api_php_fpm_max_children_parameter, create_api_opcache_memory_parameter, create_scheduler_task_cpu_parameter, \
+    create_scheduler_task_memory_reservation_parameter, create_scheduler_task_memory_hard_limit_parameter, \
+    create_scheduler_task_nofile_limit_parameter, create_compute_mode_parameter, \
+    create_fargate_burst_task_cpu_parameter, create_fargate_burst_task_memory_parameter, \
+    create_fargate_burst_spot_weight_parameter, create_fargate_burst_traffic_percentage_parameter, \
+    create_api_health_check_path_parameter, create_api_health_check_interval_parameter, \
+    create_api_healthy_threshold_count_parameter, create_api_unhealthy_threshold_count_parameter, \
+    create_api_deregistration_delay_parameter, create_api_load_balancing_algorithm_parameter, \
+    create_api_slow_start_duration_parameter, create_load_balancer_idle_timeout_parameter, \
+    create_access_logs_retention_days_parameter, create_api_latency_alarm_threshold_parameter, \
+    create_api_5xx_alarm_threshold_parameter, create_database_cpu_alarm_threshold_parameter, \
+    create_database_free_storage_alarm_threshold_parameter, create_database_replica_lag_alarm_threshold_parameter, \
+    create_redis_cpu_alarm_threshold_parameter, create_redis_evictions_alarm_threshold_parameter, \
+    create_elasticsearch_jvm_pressure_alarm_threshold_parameter, create_queue_message_age_alarm_threshold_parameter, \
+    create_tracing_sidecar_parameter, create_database_max_connections_parameter, \
+    create_database_innodb_buffer_pool_percentage_parameter, create_database_long_query_time_parameter, \
+    create_database_performance_insights_parameter, create_database_monitoring_interval_parameter, \
+    create_database_max_allocated_storage_parameter, create_database_iops_parameter, \
+    create_database_storage_throughput_parameter, create_api_volume_size_parameter, create_api_volume_iops_parameter, \
+    create_api_volume_throughput_parameter, create_elasticsearch_volume_type_parameter, \
+    create_api_image_id_parameter, create_api_image_pull_behavior_parameter, \
+    create_api_instance_warm_pool_parameter, create_api_instance_warm_pool_min_size_parameter, \
+    create_elasticsearch_volume_size_parameter, create_elasticsearch_volume_iops_parameter, \
+    create_queue_receive_wait_time_parameter, create_queue_visibility_timeout_parameter, \
+    create_queue_message_retention_parameter, create_queue_max_receive_count_parameter, \
+    create_image_worker_task_count_parameter, create_image_worker_task_cpu_parameter, \
+    create_image_worker_task_memory_reservation_parameter, create_image_worker_task_memory_hard_limit_parameter, \
+    create_route_tables_parameter, create_vpc_endpoint_parameter
+from mappings import create_performance_profiles_mapping, create_fargate_burst_traffic_weights_mapping, \
+    create_elb_account_ids_mapping, create_instance_counts_mapping
+from conditions import create_is_mysql_database_condition, create_is_aurora_database_condition, \
+    create_database_read_replica_condition, create_has_database_read_hosts_condition, create_has_cdn_condition, \
+    create_is_elasticsearch_zone_aware_condition, create_has_three_elasticsearch_zones_condition, \
+    create_has_elasticsearch_dedicated_masters_condition, create_overridden_condition, \
+    create_has_fargate_burst_condition, create_is_api_round_robin_condition, create_has_tracing_sidecar_condition, \
+    create_has_database_enhanced_monitoring_condition, create_is_elasticsearch_gp3_condition, \
+    create_enabled_condition, create_has_interface_vpc_endpoints_condition, create_has_redis_shard_conditions, \
+    create_is_scheduler_eventbridge_condition, create_is_scheduler_service_condition, \
+    create_is_api_instance_count_fixed_condition
+from rules import create_elasticsearch_instance_count_rule, create_api_slow_start_duration_rule, \
+    create_queue_visibility_timeout_rule, create_profiled_parameter_range_rule, create_route_tables_rule, \
+    create_memory_hard_limit_rule
 from variables import create_default_queue_name_variable, create_notifications_queue_name_variable, \
     create_search_queue_name_variable, create_uploads_bucket_name_variable, create_api_launch_template_name_variable, \
     create_docker_repository_name_variable, create_api_log_group_name_variable, create_queue_worker_log_group_name_variable, \
     create_scheduler_log_group_name_variable, create_api_task_definition_family_variable, \
     create_queue_worker_task_definition_family_variable, create_scheduler_task_definition_family_variable, \
     create_api_user_name_variable, create_ci_user_name_variable, create_database_name_variable, create_database_username_variable, \
-    create_elasticsearch_domain_name_variable
+    create_elasticsearch_domain_name_variable, create_queue_worker_service_name_variable, \
+    create_api_cache_policy_name_variable, create_uploads_origin_access_control_name_variable, \
+    create_profiled_variable, create_api_burst_task_definition_family_variable, \
+    create_queue_worker_burst_task_definition_family_variable, create_queue_worker_burst_service_name_variable, \
+    create_fargate_burst_traffic_weight_variable, create_access_logs_bucket_name_variable, \
+    create_access_logs_database_name_variable, create_dashboard_name_variable, create_dead_letter_queue_name_variable, \
+    create_image_worker_task_definition_family_variable, create_images_queue_name_variable, \
+    create_cache_table_name_variable, create_api_instance_min_in_service_variable
 from resources import create_load_balancer_security_group_resource, create_api_security_group_resource, \
     create_database_security_group_resource, create_redis_security_group_resource, create_database_subnet_group_resource, \
     create_database_resource, create_redis_subnet_group_resource, create_redis_resource, create_default_queue_resource, \
@@ -23,13 +91,43 @@ from resources import create_load_balancer_security_group_resource, create_api_s
     create_queue_worker_task_definition_resource, create_scheduler_task_definition_resource, create_load_balancer_resource, \
     create_api_tarcreate_group_resource, create_load_balancer_listener_resource, create_ecs_service_role_resource, \
     create_api_service_resource, create_queue_worker_service_resource, create_scheduler_service_resource, \
-    create_autoscaling_group_resource, create_api_user_resource, create_ci_user_resource, \
-    create_elasticsearch_security_group_resource, create_elasticsearch_resource
-
+    create_autoscaling_group_resource, create_ecs_capacity_provider_resource, \
+    create_ecs_cluster_capacity_provider_associations_resource, create_database_read_replica_resource, \
+    create_database_cluster_resource, create_database_cluster_writer_resource, \
+    create_database_cluster_scalable_target_resource, create_database_cluster_reader_scaling_policy_resource, \
+    create_api_cache_policy_resource, create_uploads_origin_access_control_resource, create_cdn_resource, \
+    create_uploads_bucket_policy_resource, create_api_user_resource, create_ci_user_resource, \
+    create_elasticsearch_security_group_resource, create_elasticsearch_resource, create_api_scalable_target_resource, \
+    create_api_request_count_scaling_policy_resource, create_api_cpu_scaling_policy_resource, \
+    create_api_memory_scaling_policy_resource, create_queue_worker_scalable_target_resource, \
+    create_queue_backlog_scaling_policy_resource, create_queue_worker_message_age_scaling_policy_resource, \
+    create_queue_message_age_alarm_resource, \
+    create_api_burst_tarcreate_group_resource, create_ecs_task_execution_role_resource, \
+    create_api_burst_task_definition_resource, create_queue_worker_burst_task_definition_resource, \
+    create_api_burst_service_resource, create_api_burst_scalable_target_resource, \
+    create_api_burst_request_count_scaling_policy_resource, create_queue_worker_burst_service_resource, \
+    create_queue_worker_burst_scalable_target_resource, create_queue_burst_backlog_scaling_policy_resource, \
+    create_access_logs_bucket_resource, create_access_logs_bucket_policy_resource, \
+    create_access_logs_database_resource, create_access_logs_table_resource, create_dashboard_resource, \
+    create_alarm_topic_resource, create_api_latency_alarm_resource, create_api_5xx_alarm_resource, \
+    create_database_cpu_alarm_resource, create_database_free_storage_alarm_resource, \
+    create_database_read_replica_lag_alarm_resource, create_database_cluster_replica_lag_alarm_resource, \
+    create_redis_cpu_alarm_resources, create_redis_evictions_alarm_resources, \
+    create_elasticsearch_jvm_pressure_alarm_resource, create_elasticsearch_cluster_status_alarm_resource, \
+    create_queue_oldest_message_alarm_resource, create_ecs_task_role_resource, \
+    create_database_parameter_group_resource, create_database_cluster_parameter_group_resource, \
+    create_database_cluster_instance_parameter_group_resource, create_database_monitoring_role_resource, \
+    create_dead_letter_queue_resource, create_dead_letter_queue_alarm_resource, create_images_queue_resource, \
+    create_images_queue_policy_resource, create_image_worker_task_definition_resource, \
+    create_image_worker_service_resource, create_vpc_endpoint_security_group_resource, \
+    create_s3_vpc_endpoint_resource, create_interface_vpc_endpoint_resource, create_cache_table_resource, \
+    create_scheduler_events_role_resource, create_scheduler_rule_resource, create_autoscaling_group_warm_pool_resource
 from outputs import create_database_name_output, create_database_username_output, create_database_host_output, \
     create_database_port_output, create_redis_host_output, create_redis_port_output, create_default_queue_output, \
     create_notifications_queue_output, create_load_balancer_domain_output, create_elasticsearch_host_output, \
-    create_docker_repository_uri_output, create_docker_cluster_name_output
+    create_docker_repository_uri_output, create_docker_cluster_name_output, create_database_read_hosts_output, \
+    create_cdn_domain_output, create_access_logs_bucket_output, create_access_logs_table_output, \
+    create_alarm_topic_output, create_dead_letter_queue_output, create_cache_table_output
 
 # UUID.
 uuid = str(uuid.uuid4())
@@ -40,121 +138,903 @@ template = create_template()
 # Parameters.
 uuid_parameter = create_uuid_parameter(template, uuid)
 environment_parameter = create_environment_parameter(template)
+performance_profile_parameter = create_performance_profile_parameter(template)
 certificate_arn_parameter = create_certificate_arn_parameter(template)
 vpc_parameter = create_vpc_parameter(template)
 subnets_parameter = create_subnets_parameter(template)
+route_tables_parameter = create_route_tables_parameter(template)
+s3_vpc_endpoint_parameter = create_vpc_endpoint_parameter(template, 'S3', 'S3')
+sqs_vpc_endpoint_parameter = create_vpc_endpoint_parameter(template, 'Sqs', 'SQS')
+ecr_vpc_endpoint_parameter = create_vpc_endpoint_parameter(template, 'Ecr', 'ECR API and Docker registry')
+logs_vpc_endpoint_parameter = create_vpc_endpoint_parameter(template, 'Logs', 'CloudWatch Logs')
+secrets_manager_vpc_endpoint_parameter = create_vpc_endpoint_parameter(template, 'SecretsManager', 'Secrets Manager')
+api_domain_name_parameter = create_api_domain_name_parameter(template)
+cdn_certificate_arn_parameter = create_cdn_certificate_arn_parameter(template)
 database_password_parameter = create_database_password_parameter(template)
 database_class_parameter = create_database_class_parameter(template)
 database_allocated_storage_parameter = create_database_allocated_storage_parameter(template)
+database_max_allocated_storage_parameter = create_database_max_allocated_storage_parameter(template)
+database_iops_parameter = create_database_iops_parameter(template)
+database_storage_throughput_parameter = create_database_storage_throughput_parameter(template)
+database_read_replica_count_parameter = create_database_read_replica_count_parameter(template)
+database_read_replica_class_parameter = create_database_read_replica_class_parameter(template)
+database_engine_mode_parameter = create_database_engine_mode_parameter(template)
+database_cluster_instance_class_parameter = create_database_cluster_instance_class_parameter(template)
+database_cluster_reader_min_count_parameter = create_database_cluster_reader_min_count_parameter(template)
+database_cluster_reader_max_count_parameter = create_database_cluster_reader_max_count_parameter(template)
+database_cluster_reader_scaling_metric_parameter = create_database_cluster_reader_scaling_metric_parameter(template)
+database_cluster_reader_target_value_parameter = create_database_cluster_reader_target_value_parameter(template)
+database_max_connections_parameter = create_database_max_connections_parameter(template)
+database_innodb_buffer_pool_percentage_parameter = create_database_innodb_buffer_pool_percentage_parameter(template)
+database_long_query_time_parameter = create_database_long_query_time_parameter(template)
+database_performance_insights_parameter = create_database_performance_insights_parameter(template)
+database_monitoring_interval_parameter = create_database_monitoring_interval_parameter(template)
 redis_node_class_parameter = create_redis_node_class_parameter(template)
-redis_nodes_count_parameter = create_redis_nodes_count_parameter(template)
+redis_shards_count_parameter = create_redis_shards_count_parameter(template)
+redis_replicas_per_shard_parameter = create_redis_replicas_per_shard_parameter(template)
 api_instance_class_parameter = create_api_instance_class_parameter(template)
-api_instance_count_parameter = create_api_instance_count_parameter(template)
+api_instance_min_count_parameter = create_api_instance_min_count_parameter(template)
+api_instance_max_count_parameter = create_api_instance_max_count_parameter(template)
+api_instance_target_capacity_parameter = create_api_instance_target_capacity_parameter(template)
+api_volume_size_parameter = create_api_volume_size_parameter(template)
+api_volume_iops_parameter = create_api_volume_iops_parameter(template)
+api_volume_throughput_parameter = create_api_volume_throughput_parameter(template)
+api_image_id_parameter = create_api_image_id_parameter(template)
+api_image_pull_behavior_parameter = create_api_image_pull_behavior_parameter(template)
+api_instance_warm_pool_parameter = create_api_instance_warm_pool_parameter(template)
+api_instance_warm_pool_min_size_parameter = create_api_instance_warm_pool_min_size_parameter(template)
 api_task_count_parameter = create_api_task_count_parameter(template)
 scheduler_task_count_parameter = create_scheduler_task_count_parameter(template)
-queue_worker_task_count_parameter = create_queue_worker_task_count_parameter(template)
+scheduler_mode_parameter = create_scheduler_mode_parameter(template)
+scheduler_schedule_expression_parameter = create_scheduler_schedule_expression_parameter(template)
+api_task_cpu_parameter = create_api_task_cpu_parameter(template)
+api_task_memory_reservation_parameter = create_api_task_memory_reservation_parameter(template)
+api_task_memory_hard_limit_parameter = create_api_task_memory_hard_limit_parameter(template)
+api_task_nofile_limit_parameter = create_api_task_nofile_limit_parameter(template)
+api_php_fpm_max_children_parameter = create_api_php_fpm_max_children_parameter(template)
+api_opcache_memory_parameter = create_api_opcache_memory_parameter(template)
+scheduler_task_cpu_parameter = create_scheduler_task_cpu_parameter(template)
+scheduler_task_memory_reservation_parameter = create_scheduler_task_memory_reservation_parameter(template)
+scheduler_task_memory_hard_limit_parameter = create_scheduler_task_memory_hard_limit_parameter(template)
+scheduler_task_nofile_limit_parameter = create_scheduler_task_nofile_limit_parameter(template)
+image_worker_task_count_parameter = create_image_worker_task_count_parameter(template)
+image_worker_task_cpu_parameter = create_image_worker_task_cpu_parameter(template)
+image_worker_task_memory_reservation_parameter = create_image_worker_task_memory_reservation_parameter(template)
+image_worker_task_memory_hard_limit_parameter = create_image_worker_task_memory_hard_limit_parameter(template)
 elasticsearch_instance_class_parameter = create_elasticsearch_instance_class_parameter(template)
+elasticsearch_volume_type_parameter = create_elasticsearch_volume_type_parameter(template)
+elasticsearch_volume_size_parameter = create_elasticsearch_volume_size_parameter(template)
+elasticsearch_volume_iops_parameter = create_elasticsearch_volume_iops_parameter(template)
 elasticsearch_instance_count_parameter = create_elasticsearch_instance_count_parameter(template)
+elasticsearch_availability_zone_count_parameter = create_elasticsearch_availability_zone_count_parameter(template)
+elasticsearch_dedicated_master_count_parameter = create_elasticsearch_dedicated_master_count_parameter(template)
+elasticsearch_dedicated_master_class_parameter = create_elasticsearch_dedicated_master_class_parameter(template)
+api_task_min_count_parameter = create_api_task_min_count_parameter(template)
+api_task_max_count_parameter = create_api_task_max_count_parameter(template)
+api_task_target_request_count_parameter = create_api_task_target_request_count_parameter(template)
+api_task_target_cpu_utilisation_parameter = create_api_task_target_cpu_utilisation_parameter(template)
+api_task_target_memory_utilisation_parameter = create_api_task_target_memory_utilisation_parameter(template)
+default_queue_worker_task_count_parameter = create_queue_worker_task_count_parameter(template, 'default')
+default_queue_worker_task_min_count_parameter = create_queue_worker_task_min_count_parameter(template, 'default')
+default_queue_worker_task_max_count_parameter = create_queue_worker_task_max_count_parameter(template, 'default')
+default_queue_worker_memory_reservation_parameter = create_queue_worker_memory_reservation_parameter(template, 'default')
+default_queue_worker_sleep_parameter = create_queue_worker_sleep_parameter(template, 'default')
+default_queue_worker_delay_parameter = create_queue_worker_delay_parameter(template, 'default')
+default_queue_worker_timeout_parameter = create_queue_worker_timeout_parameter(template, 'default')
+default_queue_receive_wait_time_parameter = create_queue_receive_wait_time_parameter(template, 'default')
+default_queue_visibility_timeout_parameter = create_queue_visibility_timeout_parameter(template, 'default')
+default_queue_message_retention_parameter = create_queue_message_retention_parameter(template, 'default')
+default_queue_max_receive_count_parameter = create_queue_max_receive_count_parameter(template, 'default')
+default_queue_worker_memory_limit_parameter = create_queue_worker_memory_limit_parameter(template, 'default')
+default_queue_worker_cpu_parameter = create_queue_worker_cpu_parameter(template, 'default')
+default_queue_worker_memory_hard_limit_parameter = create_queue_worker_memory_hard_limit_parameter(template, 'default')
+default_queue_worker_nofile_limit_parameter = create_queue_worker_nofile_limit_parameter(template, 'default')
+notifications_queue_worker_task_count_parameter = create_queue_worker_task_count_parameter(template, 'notifications')
+notifications_queue_worker_task_min_count_parameter = create_queue_worker_task_min_count_parameter(template,
+                                                                                                  'notifications')
+notifications_queue_worker_task_max_count_parameter = create_queue_worker_task_max_count_parameter(template,
+                                                                                                  'notifications')
+notifications_queue_worker_memory_reservation_parameter = create_queue_worker_memory_reservation_parameter(
+    template, 'notifications')
+notifications_queue_worker_sleep_parameter = create_queue_worker_sleep_parameter(template, 'notifications')
+notifications_queue_worker_delay_parameter = create_queue_worker_delay_parameter(template, 'notifications')
+notifications_queue_worker_timeout_parameter = create_queue_worker_timeout_parameter(template, 'notifications')
+notifications_queue_receive_wait_time_parameter = create_queue_receive_wait_time_parameter(template, 'notifications')
+notifications_queue_visibility_timeout_parameter = create_queue_visibility_timeout_parameter(template, 'notifications')
+notifications_queue_message_retention_parameter = create_queue_message_retention_parameter(template, 'notifications')
+notifications_queue_max_receive_count_parameter = create_queue_max_receive_count_parameter(template, 'notifications')
+notifications_queue_worker_memory_limit_parameter = create_queue_worker_memory_limit_parameter(template,
+                                                                                              'notifications')
+notifications_queue_worker_cpu_parameter = create_queue_worker_cpu_parameter(template, 'notifications')
+notifications_queue_worker_memory_hard_limit_parameter = create_queue_worker_memory_hard_limit_parameter(
+    template, 'notifications')
+notifications_queue_worker_nofile_limit_parameter = create_queue_worker_nofile_limit_parameter(
+    template, 'notifications')
+search_queue_worker_task_count_parameter = create_queue_worker_task_count_parameter(template, 'search')
+search_queue_worker_task_min_count_parameter = create_queue_worker_task_min_count_parameter(template, 'search')
+search_queue_worker_task_max_count_parameter = create_queue_worker_task_max_count_parameter(template, 'search')
+search_queue_worker_memory_reservation_parameter = create_queue_worker_memory_reservation_parameter(template, 'search')
+search_queue_worker_sleep_parameter = create_queue_worker_sleep_parameter(template, 'search')
+search_queue_worker_delay_parameter = create_queue_worker_delay_parameter(template, 'search')
+search_queue_worker_timeout_parameter = create_queue_worker_timeout_parameter(template, 'search')
+search_queue_receive_wait_time_parameter = create_queue_receive_wait_time_parameter(template, 'search')
+search_queue_visibility_timeout_parameter = create_queue_visibility_timeout_parameter(template, 'search')
+search_queue_message_retention_parameter = create_queue_message_retention_parameter(template, 'search')
+search_queue_max_receive_count_parameter = create_queue_max_receive_count_parameter(template, 'search')
+images_queue_receive_wait_time_parameter = create_queue_receive_wait_time_parameter(template, 'images')
+images_queue_visibility_timeout_parameter = create_queue_visibility_timeout_parameter(template, 'images')
+images_queue_message_retention_parameter = create_queue_message_retention_parameter(template, 'images')
+images_queue_max_receive_count_parameter = create_queue_max_receive_count_parameter(template, 'images')
+search_queue_worker_memory_limit_parameter = create_queue_worker_memory_limit_parameter(template, 'search')
+search_queue_worker_cpu_parameter = create_queue_worker_cpu_parameter(template, 'search')
+search_queue_worker_memory_hard_limit_parameter = create_queue_worker_memory_hard_limit_parameter(template, 'search')
+search_queue_worker_nofile_limit_parameter = create_queue_worker_nofile_limit_parameter(template, 'search')
+queue_worker_target_backlog_parameter = create_queue_worker_target_backlog_parameter(template)
+queue_worker_max_message_age_parameter = create_queue_worker_max_message_age_parameter(template)
+compute_mode_parameter = create_compute_mode_parameter(template)
+fargate_burst_task_cpu_parameter = create_fargate_burst_task_cpu_parameter(template)
+fargate_burst_task_memory_parameter = create_fargate_burst_task_memory_parameter(template)
+fargate_burst_spot_weight_parameter = create_fargate_burst_spot_weight_parameter(template)
+fargate_burst_traffic_percentage_parameter = create_fargate_burst_traffic_percentage_parameter(template)
+api_health_check_path_parameter = create_api_health_check_path_parameter(template)
+api_health_check_interval_parameter = create_api_health_check_interval_parameter(template)
+api_healthy_threshold_count_parameter = create_api_healthy_threshold_count_parameter(template)
+api_unhealthy_threshold_count_parameter = create_api_unhealthy_threshold_count_parameter(template)
+api_deregistration_delay_parameter = create_api_deregistration_delay_parameter(template)
+api_load_balancing_algorithm_parameter = create_api_load_balancing_algorithm_parameter(template)
+api_slow_start_duration_parameter = create_api_slow_start_duration_parameter(template)
+load_balancer_idle_timeout_parameter = create_load_balancer_idle_timeout_parameter(template)
+access_logs_retention_days_parameter = create_access_logs_retention_days_parameter(template)
+api_latency_alarm_threshold_parameter = create_api_latency_alarm_threshold_parameter(template)
+api_5xx_alarm_threshold_parameter = create_api_5xx_alarm_threshold_parameter(template)
+database_cpu_alarm_threshold_parameter = create_database_cpu_alarm_threshold_parameter(template)
+database_free_storage_alarm_threshold_parameter = create_database_free_storage_alarm_threshold_parameter(template)
+database_replica_lag_alarm_threshold_parameter = create_database_replica_lag_alarm_threshold_parameter(template)
+redis_cpu_alarm_threshold_parameter = create_redis_cpu_alarm_threshold_parameter(template)
+redis_evictions_alarm_threshold_parameter = create_redis_evictions_alarm_threshold_parameter(template)
+elasticsearch_jvm_pressure_alarm_threshold_parameter = create_elasticsearch_jvm_pressure_alarm_threshold_parameter(
+    template)
+queue_message_age_alarm_threshold_parameter = create_queue_message_age_alarm_threshold_parameter(template)
+tracing_sidecar_parameter = create_tracing_sidecar_parameter(template)
+
+# Mappings.
+performance_profiles_mapping = create_performance_profiles_mapping(template)
+fargate_burst_traffic_weights_mapping = create_fargate_burst_traffic_weights_mapping(template)
+elb_account_ids_mapping = create_elb_account_ids_mapping(template)
+instance_counts_mapping = create_instance_counts_mapping(template)
+
+# Conditions.
+is_mysql_database_condition = create_is_mysql_database_condition(template, database_engine_mode_parameter)
+is_aurora_database_condition = create_is_aurora_database_condition(template, database_engine_mode_parameter)
+database_read_replica_1_condition = create_database_read_replica_condition(template, 1,
+                                                                           database_read_replica_count_parameter,
+                                                                           is_mysql_database_condition)
+database_read_replica_2_condition = create_database_read_replica_condition(template, 2,
+                                                                           database_read_replica_count_parameter,
+                                                                           is_mysql_database_condition)
+database_read_replica_3_condition = create_database_read_replica_condition(template, 3,
+                                                                           database_read_replica_count_parameter,
+                                                                           is_mysql_database_condition)
+has_database_read_hosts_condition = create_has_database_read_hosts_condition(template, is_aurora_database_condition,
+                                                                             database_read_replica_1_condition)
+has_cdn_condition = create_has_cdn_condition(template, api_domain_name_parameter, cdn_certificate_arn_parameter)
+is_elasticsearch_zone_aware_condition = create_is_elasticsearch_zone_aware_condition(
+    template, elasticsearch_availability_zone_count_parameter)
+has_three_elasticsearch_zones_condition = create_has_three_elasticsearch_zones_condition(
+    template, elasticsearch_availability_zone_count_parameter)
+has_elasticsearch_dedicated_masters_condition = create_has_elasticsearch_dedicated_masters_condition(
+    template, elasticsearch_dedicated_master_count_parameter)
+database_class_overridden_condition = create_overridden_condition(template, database_class_parameter)
+database_read_replica_class_overridden_condition = create_overridden_condition(
+    template, database_read_replica_class_parameter)
+database_cluster_instance_class_overridden_condition = create_overridden_condition(
+    template, database_cluster_instance_class_parameter)
+database_max_connections_overridden_condition = create_overridden_condition(
+    template, database_max_connections_parameter)
+database_performance_insights_overridden_condition = create_overridden_condition(
+    template, database_performance_insights_parameter)
+has_database_enhanced_monitoring_condition = create_has_database_enhanced_monitoring_condition(
+    template, database_monitoring_interval_parameter)
+database_iops_overridden_condition = create_overridden_condition(template, database_iops_parameter)
+database_storage_throughput_overridden_condition = create_overridden_condition(
+    template, database_storage_throughput_parameter)
+is_elasticsearch_gp3_condition = create_is_elasticsearch_gp3_condition(template, elasticsearch_volume_type_parameter)
+redis_node_class_overridden_condition = create_overridden_condition(template, redis_node_class_parameter)
+redis_shards_count_overridden_condition = create_overridden_condition(template, redis_shards_count_parameter)
+redis_replicas_per_shard_overridden_condition = create_overridden_condition(
+    template, redis_replicas_per_shard_parameter)
+api_instance_class_overridden_condition = create_overridden_condition(template, api_instance_class_parameter)
+api_instance_min_count_overridden_condition = create_overridden_condition(template, api_instance_min_count_parameter)
+api_instance_max_count_overridden_condition = create_overridden_condition(template, api_instance_max_count_parameter)
+api_task_min_count_overridden_condition = create_overridden_condition(template, api_task_min_count_parameter)
+api_task_max_count_overridden_condition = create_overridden_condition(template, api_task_max_count_parameter)
+default_queue_worker_task_min_count_overridden_condition = create_overridden_condition(
+    template, default_queue_worker_task_min_count_parameter)
+default_queue_worker_task_max_count_overridden_condition = create_overridden_condition(
+    template, default_queue_worker_task_max_count_parameter)
+notifications_queue_worker_task_min_count_overridden_condition = create_overridden_condition(
+    template, notifications_queue_worker_task_min_count_parameter)
+notifications_queue_worker_task_max_count_overridden_condition = create_overridden_condition(
+    template, notifications_queue_worker_task_max_count_parameter)
+search_queue_worker_task_min_count_overridden_condition = create_overridden_condition(
+    template, search_queue_worker_task_min_count_parameter)
+search_queue_worker_task_max_count_overridden_condition = create_overridden_condition(
+    template, search_queue_worker_task_max_count_parameter)
+elasticsearch_instance_class_overridden_condition = create_overridden_condition(
+    template, elasticsearch_instance_class_parameter)
+elasticsearch_instance_count_overridden_condition = create_overridden_condition(
+    template, elasticsearch_instance_count_parameter)
+has_fargate_burst_condition = create_has_fargate_burst_condition(template, compute_mode_parameter)
+is_api_round_robin_condition = create_is_api_round_robin_condition(template, api_load_balancing_algorithm_parameter)
+has_tracing_sidecar_condition = create_has_tracing_sidecar_condition(template, tracing_sidecar_parameter)
+is_scheduler_eventbridge_condition = create_is_scheduler_eventbridge_condition(template, scheduler_mode_parameter)
+is_scheduler_service_condition = create_is_scheduler_service_condition(template, scheduler_mode_parameter)
+api_instance_warm_pool_enabled_condition = create_enabled_condition(template, api_instance_warm_pool_parameter)
+s3_vpc_endpoint_enabled_condition = create_enabled_condition(template, s3_vpc_endpoint_parameter)
+sqs_vpc_endpoint_enabled_condition = create_enabled_condition(template, sqs_vpc_endpoint_parameter)
+ecr_vpc_endpoint_enabled_condition = create_enabled_condition(template, ecr_vpc_endpoint_parameter)
+logs_vpc_endpoint_enabled_condition = create_enabled_condition(template, logs_vpc_endpoint_parameter)
+secrets_manager_vpc_endpoint_enabled_condition = create_enabled_condition(template,
+                                                                          secrets_manager_vpc_endpoint_parameter)
+has_interface_vpc_endpoints_condition = create_has_interface_vpc_endpoints_condition(
+    template, [sqs_vpc_endpoint_enabled_condition, ecr_vpc_endpoint_enabled_condition,
+               logs_vpc_endpoint_enabled_condition, secrets_manager_vpc_endpoint_enabled_condition])
+has_redis_shard_conditions = create_has_redis_shard_conditions(template, redis_shards_count_parameter,
+                                                               redis_shards_count_overridden_condition,
+                                                               performance_profile_parameter,
+                                                               performance_profiles_mapping, 90)
+is_api_instance_count_fixed_condition = create_is_api_instance_count_fixed_condition(
+    template, api_instance_min_count_parameter, api_instance_max_count_parameter,
+    api_instance_min_count_overridden_condition, api_instance_max_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+
+# Rules.
+create_elasticsearch_instance_count_rule(template, elasticsearch_availability_zone_count_parameter,
+                                         elasticsearch_instance_count_parameter, performance_profile_parameter,
+                                         performance_profiles_mapping, 2)
+create_elasticsearch_instance_count_rule(template, elasticsearch_availability_zone_count_parameter,
+                                         elasticsearch_instance_count_parameter, performance_profile_parameter,
+                                         performance_profiles_mapping, 3)
+create_api_slow_start_duration_rule(template, api_slow_start_duration_parameter)
+create_route_tables_rule(template, s3_vpc_endpoint_parameter, route_tables_parameter)
+create_memory_hard_limit_rule(template, 'ApiTask', api_task_memory_reservation_parameter,
+                              api_task_memory_hard_limit_parameter)
+create_memory_hard_limit_rule(template, 'SchedulerTask', scheduler_task_memory_reservation_parameter,
+                              scheduler_task_memory_hard_limit_parameter)
+create_memory_hard_limit_rule(template, 'ImageWorkerTask', image_worker_task_memory_reservation_parameter,
+                              image_worker_task_memory_hard_limit_parameter)
+create_memory_hard_limit_rule(template, 'DefaultQueueWorker', default_queue_worker_memory_reservation_parameter,
+                              default_queue_worker_memory_hard_limit_parameter)
+create_memory_hard_limit_rule(template, 'NotificationsQueueWorker',
+                              notifications_queue_worker_memory_reservation_parameter,
+                              notifications_queue_worker_memory_hard_limit_parameter)
+create_memory_hard_limit_rule(template, 'SearchQueueWorker', search_queue_worker_memory_reservation_parameter,
+                              search_queue_worker_memory_hard_limit_parameter)
+create_queue_visibility_timeout_rule(template, 'default', default_queue_worker_timeout_parameter,
+                                     default_queue_visibility_timeout_parameter)
+create_queue_visibility_timeout_rule(template, 'notifications', notifications_queue_worker_timeout_parameter,
+                                     notifications_queue_visibility_timeout_parameter)
+create_queue_visibility_timeout_rule(template, 'search', search_queue_worker_timeout_parameter,
+                                     search_queue_visibility_timeout_parameter)
+create_profiled_parameter_range_rule(template, redis_shards_count_parameter, 1, 90,
+                                     'The Redis shards count must be between 1 and 90.')
+create_profiled_parameter_range_rule(template, redis_replicas_per_shard_parameter, 0, 5,
+                                     'The Redis replicas per shard must be between 0 and 5.')
+create_profiled_parameter_range_rule(template, elasticsearch_instance_count_parameter, 1, 40,
+                                     'The Elasticsearch instance count must be between 1 and 40.')
+create_profiled_parameter_range_rule(template, api_instance_min_count_parameter, 0, 50,
+                                     'The API instance min count must be between 0 and 50.')
+create_profiled_parameter_range_rule(template, api_instance_max_count_parameter, 1, 50,
+                                     'The API instance max count must be between 1 and 50.')
+create_profiled_parameter_range_rule(template, api_task_min_count_parameter, 0, 100,
+                                     'The API task min count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, api_task_max_count_parameter, 0, 100,
+                                     'The API task max count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, default_queue_worker_task_min_count_parameter, 0, 100,
+                                     'The default queue worker task min count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, default_queue_worker_task_max_count_parameter, 0, 100,
+                                     'The default queue worker task max count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, notifications_queue_worker_task_min_count_parameter, 0, 100,
+                                     'The notifications queue worker task min count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, notifications_queue_worker_task_max_count_parameter, 0, 100,
+                                     'The notifications queue worker task max count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, search_queue_worker_task_min_count_parameter, 0, 100,
+                                     'The search queue worker task min count must be between 0 and 100.')
+create_profiled_parameter_range_rule(template, search_queue_worker_task_max_count_parameter, 0, 100,
+                                     'The search queue worker task max count must be between 0 and 100.')
 
 # Variables.
+database_class_variable = create_profiled_variable(
+    database_class_parameter, database_class_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+database_read_replica_class_variable = create_profiled_variable(
+    database_read_replica_class_parameter, database_read_replica_class_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+database_cluster_instance_class_variable = create_profiled_variable(
+    database_cluster_instance_class_parameter, database_cluster_instance_class_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+database_max_connections_variable = create_profiled_variable(
+    database_max_connections_parameter, database_max_connections_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+database_performance_insights_variable = create_profiled_variable(
+    database_performance_insights_parameter, database_performance_insights_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+redis_node_class_variable = create_profiled_variable(
+    redis_node_class_parameter, redis_node_class_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+redis_shards_count_variable = create_profiled_variable(
+    redis_shards_count_parameter, redis_shards_count_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+redis_replicas_per_shard_variable = create_profiled_variable(
+    redis_replicas_per_shard_parameter, redis_replicas_per_shard_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+api_instance_class_variable = create_profiled_variable(
+    api_instance_class_parameter, api_instance_class_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+api_instance_min_count_variable = create_profiled_variable(
+    api_instance_min_count_parameter, api_instance_min_count_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+api_instance_max_count_variable = create_profiled_variable(
+    api_instance_max_count_parameter, api_instance_max_count_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+api_instance_min_in_service_variable = create_api_instance_min_in_service_variable(
+    is_api_instance_count_fixed_condition, api_instance_min_count_variable, api_instance_min_count_parameter,
+    api_instance_min_count_overridden_condition, performance_profile_parameter, performance_profiles_mapping,
+    instance_counts_mapping)
+api_task_min_count_variable = create_profiled_variable(
+    api_task_min_count_parameter, api_task_min_count_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+api_task_max_count_variable = create_profiled_variable(
+    api_task_max_count_parameter, api_task_max_count_overridden_condition, performance_profile_parameter,
+    performance_profiles_mapping)
+default_queue_worker_task_min_count_variable = create_profiled_variable(
+    default_queue_worker_task_min_count_parameter, default_queue_worker_task_min_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+default_queue_worker_task_max_count_variable = create_profiled_variable(
+    default_queue_worker_task_max_count_parameter, default_queue_worker_task_max_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+notifications_queue_worker_task_min_count_variable = create_profiled_variable(
+    notifications_queue_worker_task_min_count_parameter, notifications_queue_worker_task_min_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+notifications_queue_worker_task_max_count_variable = create_profiled_variable(
+    notifications_queue_worker_task_max_count_parameter, notifications_queue_worker_task_max_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+search_queue_worker_task_min_count_variable = create_profiled_variable(
+    search_queue_worker_task_min_count_parameter, search_queue_worker_task_min_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+search_queue_worker_task_max_count_variable = create_profiled_variable(
+    search_queue_worker_task_max_count_parameter, search_queue_worker_task_max_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+elasticsearch_instance_class_variable = create_profiled_variable(
+    elasticsearch_instance_class_parameter, elasticsearch_instance_class_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
+elasticsearch_instance_count_variable = create_profiled_variable(
+    elasticsearch_instance_count_parameter, elasticsearch_instance_count_overridden_condition,
+    performance_profile_parameter, performance_profiles_mapping)
 default_queue_name_variable = create_default_queue_name_variable(environment_parameter, uuid_parameter)
 notifications_queue_name_variable = create_notifications_queue_name_variable(environment_parameter, uuid_parameter)
 search_queue_name_variable = create_search_queue_name_variable(environment_parameter, uuid_parameter)
+default_dead_letter_queue_name_variable = create_dead_letter_queue_name_variable(default_queue_name_variable)
+notifications_dead_letter_queue_name_variable = create_dead_letter_queue_name_variable(
+    notifications_queue_name_variable)
+search_dead_letter_queue_name_variable = create_dead_letter_queue_name_variable(search_queue_name_variable)
+images_queue_name_variable = create_images_queue_name_variable(environment_parameter, uuid_parameter)
+images_dead_letter_queue_name_variable = create_dead_letter_queue_name_variable(images_queue_name_variable)
 uploads_bucket_name_variable = create_uploads_bucket_name_variable(environment_parameter, uuid_parameter)
+cache_table_name_variable = create_cache_table_name_variable(environment_parameter, uuid_parameter)
+access_logs_bucket_name_variable = create_access_logs_bucket_name_variable(environment_parameter, uuid_parameter)
+access_logs_database_name_variable = create_access_logs_database_name_variable(environment_parameter, uuid_parameter)
+dashboard_name_variable = create_dashboard_name_variable(environment_parameter)
 api_launch_template_name_variable = create_api_launch_template_name_variable(environment_parameter)
 docker_repository_name_variable = create_docker_repository_name_variable(environment_parameter, uuid_parameter)
 api_log_group_name_variable = create_api_log_group_name_variable(environment_parameter)
 queue_worker_log_group_name_variable = create_queue_worker_log_group_name_variable(environment_parameter)
 scheduler_log_group_name_variable = create_scheduler_log_group_name_variable(environment_parameter)
 api_task_definition_family_variable = create_api_task_definition_family_variable(environment_parameter)
-queue_worker_task_definition_family_variable = create_queue_worker_task_definition_family_variable(environment_parameter)
+default_queue_worker_task_definition_family_variable = create_queue_worker_task_definition_family_variable(
+    environment_parameter, 'default')
+notifications_queue_worker_task_definition_family_variable = create_queue_worker_task_definition_family_variable(
+    environment_parameter, 'notifications')
+search_queue_worker_task_definition_family_variable = create_queue_worker_task_definition_family_variable(
+    environment_parameter, 'search')
+default_queue_worker_service_name_variable = create_queue_worker_service_name_variable('default')
+notifications_queue_worker_service_name_variable = create_queue_worker_service_name_variable('notifications')
+search_queue_worker_service_name_variable = create_queue_worker_service_name_variable('search')
 scheduler_task_definition_family_variable = create_scheduler_task_definition_family_variable(environment_parameter)
+image_worker_task_definition_family_variable = create_image_worker_task_definition_family_variable(
+    environment_parameter)
+api_burst_task_definition_family_variable = create_api_burst_task_definition_family_variable(environment_parameter)
+default_queue_worker_burst_task_definition_family_variable = create_queue_worker_burst_task_definition_family_variable(
+    environment_parameter, 'default')
+notifications_queue_worker_burst_task_definition_family_variable = \
+    create_queue_worker_burst_task_definition_family_variable(environment_parameter, 'notifications')
+search_queue_worker_burst_task_definition_family_variable = create_queue_worker_burst_task_definition_family_variable(
+    environment_parameter, 'search')
+default_queue_worker_burst_service_name_variable = create_queue_worker_burst_service_name_variable('default')
+notifications_queue_worker_burst_service_name_variable = create_queue_worker_burst_service_name_variable(
+    'notifications')
+search_queue_worker_burst_service_name_variable = create_queue_worker_burst_service_name_variable('search')
+ec2_traffic_weight_variable = create_fargate_burst_traffic_weight_variable(fargate_burst_traffic_percentage_parameter,
+                                                                           fargate_burst_traffic_weights_mapping, 'Ec2')
+fargate_traffic_weight_variable = create_fargate_burst_traffic_weight_variable(
+    fargate_burst_traffic_percentage_parameter, fargate_burst_traffic_weights_mapping, 'Fargate')
 api_user_name_variable = create_api_user_name_variable(environment_parameter)
 ci_user_name_variable = create_ci_user_name_variable(environment_parameter)
 database_name_variable = create_database_name_variable()
 database_username_variable = create_database_username_variable()
 elasticsearch_domain_name_variable = create_elasticsearch_domain_name_variable(environment_parameter)
+api_cache_policy_name_variable = create_api_cache_policy_name_variable(environment_parameter)
+uploads_origin_access_control_name_variable = create_uploads_origin_access_control_name_variable(environment_parameter)
 
 # Resources.
 load_balancer_security_group_resource = create_load_balancer_security_group_resource(template)
 api_security_group_resource = create_api_security_group_resource(template, load_balancer_security_group_resource)
 database_security_group_resource = create_database_security_group_resource(template, api_security_group_resource)
 redis_security_group_resource = create_redis_security_group_resource(template, api_security_group_resource)
+vpc_endpoint_security_group_resource = create_vpc_endpoint_security_group_resource(
+    template, has_interface_vpc_endpoints_condition, vpc_parameter, api_security_group_resource)
+s3_vpc_endpoint_resource = create_s3_vpc_endpoint_resource(template, s3_vpc_endpoint_enabled_condition, vpc_parameter,
+                                                           route_tables_parameter)
+sqs_vpc_endpoint_resource = create_interface_vpc_endpoint_resource(
+    template, 'Sqs', 'sqs', sqs_vpc_endpoint_enabled_condition, vpc_parameter, subnets_parameter,
+    vpc_endpoint_security_group_resource)
+ecr_api_vpc_endpoint_resource = create_interface_vpc_endpoint_resource(
+    template, 'EcrApi', 'ecr.api', ecr_vpc_endpoint_enabled_condition, vpc_parameter, subnets_parameter,
+    vpc_endpoint_security_group_resource)
+ecr_dkr_vpc_endpoint_resource = create_interface_vpc_endpoint_resource(
+    template, 'EcrDkr', 'ecr.dkr', ecr_vpc_endpoint_enabled_condition, vpc_parameter, subnets_parameter,
+    vpc_endpoint_security_group_resource)
+logs_vpc_endpoint_resource = create_interface_vpc_endpoint_resource(
+    template, 'Logs', 'logs', logs_vpc_endpoint_enabled_condition, vpc_parameter, subnets_parameter,
+    vpc_endpoint_security_group_resource)
+secrets_manager_vpc_endpoint_resource = create_interface_vpc_endpoint_resource(
+    template, 'SecretsManager', 'secretsmanager', secrets_manager_vpc_endpoint_enabled_condition, vpc_parameter,
+    subnets_parameter, vpc_endpoint_security_group_resource)
 database_subnet_group_resource = create_database_subnet_group_resource(template, subnets_parameter)
+database_parameter_group_resource = create_database_parameter_group_resource(
+    template, is_mysql_database_condition, database_innodb_buffer_pool_percentage_parameter,
+    database_max_connections_variable, database_long_query_time_parameter)
+database_cluster_parameter_group_resource = create_database_cluster_parameter_group_resource(
+    template, is_aurora_database_condition, database_long_query_time_parameter)
+database_cluster_instance_parameter_group_resource = create_database_cluster_instance_parameter_group_resource(
+    template, is_aurora_database_condition, database_max_connections_variable)
+database_monitoring_role_resource = create_database_monitoring_role_resource(
+    template, has_database_enhanced_monitoring_condition)
 database_resource = create_database_resource(template, database_name_variable, database_allocated_storage_parameter,
-                                          database_class_parameter, database_username_variable,
+                                          database_class_variable, database_username_variable,
                                           database_password_parameter, database_security_group_resource,
-                                          database_subnet_group_resource)
+                                          database_subnet_group_resource, is_mysql_database_condition,
+                                          database_parameter_group_resource, database_performance_insights_variable,
+                                          database_monitoring_interval_parameter,
+                                          has_database_enhanced_monitoring_condition,
+                                          database_monitoring_role_resource, database_max_allocated_storage_parameter,
+                                          database_iops_parameter, database_iops_overridden_condition,
+                                          database_storage_throughput_parameter,
+                                          database_storage_throughput_overridden_condition)
+database_read_replica_1_resource = create_database_read_replica_resource(
+    template, 1, database_read_replica_1_condition, database_resource, database_read_replica_class_variable,
+    database_security_group_resource, database_parameter_group_resource, database_performance_insights_variable,
+    database_monitoring_interval_parameter, has_database_enhanced_monitoring_condition,
+    database_monitoring_role_resource)
+database_read_replica_2_resource = create_database_read_replica_resource(
+    template, 2, database_read_replica_2_condition, database_resource, database_read_replica_class_variable,
+    database_security_group_resource, database_parameter_group_resource, database_performance_insights_variable,
+    database_monitoring_interval_parameter, has_database_enhanced_monitoring_condition,
+    database_monitoring_role_resource)
+database_read_replica_3_resource = create_database_read_replica_resource(
+    template, 3, database_read_replica_3_condition, database_resource, database_read_replica_class_variable,
+    database_security_group_resource, database_parameter_group_resource, database_performance_insights_variable,
+    database_monitoring_interval_parameter, has_database_enhanced_monitoring_condition,
+    database_monitoring_role_resource)
+database_cluster_resource = create_database_cluster_resource(template, is_aurora_database_condition,
+                                                             database_name_variable, database_username_variable,
+                                                             database_password_parameter,
+                                                             database_security_group_resource,
+                                                             database_subnet_group_resource,
+                                                             database_cluster_parameter_group_resource)
+database_cluster_writer_resource = create_database_cluster_writer_resource(
+    template, is_aurora_database_condition, database_cluster_resource, database_cluster_instance_class_variable,
+    database_subnet_group_resource, database_cluster_instance_parameter_group_resource,
+    database_performance_insights_variable, database_monitoring_interval_parameter,
+    has_database_enhanced_monitoring_condition, database_monitoring_role_resource)
+database_cluster_scalable_target_resource = create_database_cluster_scalable_target_resource(
+    template, is_aurora_database_condition, database_cluster_resource, database_cluster_writer_resource,
+    database_cluster_reader_min_count_parameter, database_cluster_reader_max_count_parameter)
+database_cluster_reader_scaling_policy_resource = create_database_cluster_reader_scaling_policy_resource(
+    template, is_aurora_database_condition, database_cluster_scalable_target_resource,
+    database_cluster_reader_scaling_metric_parameter, database_cluster_reader_target_value_parameter)
 redis_subnet_group_resource = create_redis_subnet_group_resource(template, subnets_parameter)
-redis_resource = create_redis_resource(template, redis_node_class_parameter, redis_nodes_count_parameter,
-                                    redis_security_group_resource, redis_subnet_group_resource)
-default_queue_resource = create_default_queue_resource(template, default_queue_name_variable)
-notifications_queue_resource = create_notifications_queue_resource(template, notifications_queue_name_variable)
-search_queue_resource = create_search_queue_resource(template, search_queue_name_variable)
-uploads_bucket_resource = create_uploads_bucket_resource(template, uploads_bucket_name_variable)
+redis_resource = create_redis_resource(template, redis_node_class_variable, redis_shards_count_variable,
+                                    redis_replicas_per_shard_variable, redis_security_group_resource,
+                                    redis_subnet_group_resource)
+default_dead_letter_queue_resource = create_dead_letter_queue_resource(template, 'default',
+                                                                       default_dead_letter_queue_name_variable)
+notifications_dead_letter_queue_resource = create_dead_letter_queue_resource(
+    template, 'notifications', notifications_dead_letter_queue_name_variable)
+search_dead_letter_queue_resource = create_dead_letter_queue_resource(template, 'search',
+                                                                      search_dead_letter_queue_name_variable)
+default_queue_resource = create_default_queue_resource(
+    template, default_queue_name_variable, default_queue_receive_wait_time_parameter,
+    default_queue_visibility_timeout_parameter, default_queue_message_retention_parameter,
+    default_queue_max_receive_count_parameter, default_dead_letter_queue_resource)
+notifications_queue_resource = create_notifications_queue_resource(
+    template, notifications_queue_name_variable, notifications_queue_receive_wait_time_parameter,
+    notifications_queue_visibility_timeout_parameter, notifications_queue_message_retention_parameter,
+    notifications_queue_max_receive_count_parameter, notifications_dead_letter_queue_resource)
+search_queue_resource = create_search_queue_resource(
+    template, search_queue_name_variable, search_queue_receive_wait_time_parameter,
+    search_queue_visibility_timeout_parameter, search_queue_message_retention_parameter,
+    search_queue_max_receive_count_parameter, search_dead_letter_queue_resource)
+images_dead_letter_queue_resource = create_dead_letter_queue_resource(template, 'images',
+                                                                      images_dead_letter_queue_name_variable)
+images_queue_resource = create_images_queue_resource(
+    template, images_queue_name_variable, images_queue_receive_wait_time_parameter,
+    images_queue_visibility_timeout_parameter, images_queue_message_retention_parameter,
+    images_queue_max_receive_count_parameter, images_dead_letter_queue_resource)
+images_queue_policy_resource = create_images_queue_policy_resource(template, images_queue_resource,
+                                                                   uploads_bucket_name_variable)
+uploads_bucket_resource = create_uploads_bucket_resource(template, uploads_bucket_name_variable, images_queue_resource,
+                                                         images_queue_policy_resource)
+cache_table_resource = create_cache_table_resource(template, cache_table_name_variable)
 ecs_cluster_role_resource = create_ecs_cluster_role_resource(template)
 ec2_instance_profile_resource = create_ec2_instance_profile_resource(template, ecs_cluster_role_resource)
 ecs_cluster_resource = create_ecs_cluster_resource(template)
 launch_template_resource = create_launch_template_resource(template, api_launch_template_name_variable,
-                                                        api_instance_class_parameter, ec2_instance_profile_resource,
-                                                        api_security_group_resource, ecs_cluster_resource)
+                                                        api_instance_class_variable, ec2_instance_profile_resource,
+                                                        api_security_group_resource, ecs_cluster_resource,
+                                                        api_volume_size_parameter, api_volume_iops_parameter,
+                                                        api_volume_throughput_parameter, api_image_id_parameter,
+                                                        api_image_pull_behavior_parameter)
 docker_repository_resource = create_docker_repository_resource(template, docker_repository_name_variable)
 api_log_group_resource = create_api_log_group_resource(template, api_log_group_name_variable)
 queue_worker_log_group_resource = create_queue_worker_log_group_resource(template, queue_worker_log_group_name_variable)
 scheduler_log_group_resource = create_scheduler_log_group_resource(template, scheduler_log_group_name_variable)
+ecs_task_role_resource = create_ecs_task_role_resource(template, has_tracing_sidecar_condition)
 api_task_definition_resource = create_api_task_definition_resource(template, api_task_definition_family_variable,
-                                                                docker_repository_resource, api_log_group_resource)
-queue_worker_task_definition_resource = create_queue_worker_task_definition_resource(template,
-                                                                                  queue_worker_task_definition_family_variable,
-                                                                                  docker_repository_resource,
-                                                                                  queue_worker_log_group_resource,
-                                                                                  default_queue_name_variable,
-                                                                                  notifications_queue_name_variable,
-                                                                                  search_queue_name_variable)
+                                                                docker_repository_resource, api_log_group_resource,
+                                                                api_task_cpu_parameter,
+                                                                api_task_memory_reservation_parameter,
+                                                                api_task_memory_hard_limit_parameter,
+                                                                api_task_nofile_limit_parameter,
+                                                                api_php_fpm_max_children_parameter,
+                                                                api_opcache_memory_parameter,
+                                                                has_tracing_sidecar_condition, ecs_task_role_resource)
+default_queue_worker_task_definition_resource = create_queue_worker_task_definition_resource(
+    template, 'default', default_queue_worker_task_definition_family_variable, docker_repository_resource,
+    queue_worker_log_group_resource, default_queue_worker_memory_reservation_parameter,
+    default_queue_worker_sleep_parameter, default_queue_worker_delay_parameter, default_queue_worker_timeout_parameter,
+    default_queue_worker_memory_limit_parameter, default_queue_worker_cpu_parameter,
+    default_queue_worker_memory_hard_limit_parameter, default_queue_worker_nofile_limit_parameter,
+    has_tracing_sidecar_condition, ecs_task_role_resource)
+notifications_queue_worker_task_definition_resource = create_queue_worker_task_definition_resource(
+    template, 'notifications', notifications_queue_worker_task_definition_family_variable, docker_repository_resource,
+    queue_worker_log_group_resource, notifications_queue_worker_memory_reservation_parameter,
+    notifications_queue_worker_sleep_parameter, notifications_queue_worker_delay_parameter,
+    notifications_queue_worker_timeout_parameter, notifications_queue_worker_memory_limit_parameter,
+    notifications_queue_worker_cpu_parameter, notifications_queue_worker_memory_hard_limit_parameter,
+    notifications_queue_worker_nofile_limit_parameter, has_tracing_sidecar_condition, ecs_task_role_resource)
+search_queue_worker_task_definition_resource = create_queue_worker_task_definition_resource(
+    template, 'search', search_queue_worker_task_definition_family_variable, docker_repository_resource,
+    queue_worker_log_group_resource, search_queue_worker_memory_reservation_parameter,
+    search_queue_worker_sleep_parameter, search_queue_worker_delay_parameter, search_queue_worker_timeout_parameter,
+    search_queue_worker_memory_limit_parameter, search_queue_worker_cpu_parameter,
+    search_queue_worker_memory_hard_limit_parameter, search_queue_worker_nofile_limit_parameter,
+    has_tracing_sidecar_condition, ecs_task_role_resource)
 scheduler_task_definition_resource = create_scheduler_task_definition_resource(template,
                                                                             scheduler_task_definition_family_variable,
                                                                             docker_repository_name_variable,
-                                                                            scheduler_log_group_resource)
-load_balancer_resource = create_load_balancer_resource(template, load_balancer_security_group_resource, subnets_parameter)
-api_tarcreate_group_resource = create_api_tarcreate_group_resource(template, vpc_parameter, load_balancer_resource)
+                                                                            scheduler_log_group_resource,
+                                                                            scheduler_task_cpu_parameter,
+                                                                            scheduler_task_memory_reservation_parameter,
+                                                                            scheduler_task_memory_hard_limit_parameter,
+                                                                            scheduler_task_nofile_limit_parameter,
+                                                                            is_scheduler_eventbridge_condition)
+image_worker_task_definition_resource = create_image_worker_task_definition_resource(
+    template, image_worker_task_definition_family_variable, docker_repository_resource, queue_worker_log_group_resource,
+    image_worker_task_cpu_parameter, image_worker_task_memory_reservation_parameter,
+    image_worker_task_memory_hard_limit_parameter)
+ecs_task_execution_role_resource = create_ecs_task_execution_role_resource(template, has_fargate_burst_condition)
+api_burst_task_definition_resource = create_api_burst_task_definition_resource(
+    template, has_fargate_burst_condition, api_burst_task_definition_family_variable, docker_repository_resource,
+    api_log_group_resource, ecs_task_execution_role_resource, fargate_burst_task_cpu_parameter,
+    fargate_burst_task_memory_parameter, api_task_nofile_limit_parameter, api_php_fpm_max_children_parameter,
+    api_opcache_memory_parameter, has_tracing_sidecar_condition, ecs_task_role_resource)
+default_queue_worker_burst_task_definition_resource = create_queue_worker_burst_task_definition_resource(
+    template, 'default', has_fargate_burst_condition, default_queue_worker_burst_task_definition_family_variable,
+    docker_repository_resource, queue_worker_log_group_resource, ecs_task_execution_role_resource,
+    fargate_burst_task_cpu_parameter, fargate_burst_task_memory_parameter, default_queue_worker_sleep_parameter,
+    default_queue_worker_delay_parameter, default_queue_worker_timeout_parameter,
+    default_queue_worker_memory_limit_parameter, default_queue_worker_nofile_limit_parameter,
+    has_tracing_sidecar_condition, ecs_task_role_resource)
+notifications_queue_worker_burst_task_definition_resource = create_queue_worker_burst_task_definition_resource(
+    template, 'notifications', has_fargate_burst_condition,
+    notifications_queue_worker_burst_task_definition_family_variable, docker_repository_resource,
+    queue_worker_log_group_resource, ecs_task_execution_role_resource, fargate_burst_task_cpu_parameter,
+    fargate_burst_task_memory_parameter, notifications_queue_worker_sleep_parameter,
+    notifications_queue_worker_delay_parameter, notifications_queue_worker_timeout_parameter,
+    notifications_queue_worker_memory_limit_parameter, notifications_queue_worker_nofile_limit_parameter,
+    has_tracing_sidecar_condition, ecs_task_role_resource)
+search_queue_worker_burst_task_definition_resource = create_queue_worker_burst_task_definition_resource(
+    template, 'search', has_fargate_burst_condition, search_queue_worker_burst_task_definition_family_variable,
+    docker_repository_resource, queue_worker_log_group_resource, ecs_task_execution_role_resource,
+    fargate_burst_task_cpu_parameter, fargate_burst_task_memory_parameter, search_queue_worker_sleep_parameter,
+    search_queue_worker_delay_parameter, search_queue_worker_timeout_parameter,
+    search_queue_worker_memory_limit_parameter, search_queue_worker_nofile_limit_parameter,
+    has_tracing_sidecar_condition, ecs_task_role_resource)
+access_logs_bucket_resource = create_access_logs_bucket_resource(template, access_logs_bucket_name_variable,
+                                                                 access_logs_retention_days_parameter)
+access_logs_bucket_policy_resource = create_access_logs_bucket_policy_resource(template, access_logs_bucket_resource,
+                                                                               elb_account_ids_mapping)
+access_logs_database_resource = create_access_logs_database_resource(template, access_logs_database_name_variable)
+access_logs_table_resource = create_access_logs_table_resource(template, access_logs_database_resource,
+                                                               access_logs_bucket_resource)
+load_balancer_resource = create_load_balancer_resource(template, load_balancer_security_group_resource,
+                                                       subnets_parameter, load_balancer_idle_timeout_parameter,
+                                                       access_logs_bucket_resource, access_logs_bucket_policy_resource)
+api_tarcreate_group_resource = create_api_tarcreate_group_resource(
+    template, vpc_parameter, load_balancer_resource, api_health_check_path_parameter,
+    api_health_check_interval_parameter, api_healthy_threshold_count_parameter, api_unhealthy_threshold_count_parameter,
+    api_deregistration_delay_parameter, api_load_balancing_algorithm_parameter, api_slow_start_duration_parameter,
+    is_api_round_robin_condition)
+api_burst_tarcreate_group_resource = create_api_burst_tarcreate_group_resource(
+    template, has_fargate_burst_condition, vpc_parameter, load_balancer_resource, api_health_check_path_parameter,
+    api_health_check_interval_parameter, api_healthy_threshold_count_parameter, api_unhealthy_threshold_count_parameter,
+    api_deregistration_delay_parameter, api_load_balancing_algorithm_parameter, api_slow_start_duration_parameter,
+    is_api_round_robin_condition)
 load_balancer_listener_resource = create_load_balancer_listener_resource(template, load_balancer_resource,
                                                                       api_tarcreate_group_resource,
-                                                                      certificate_arn_parameter)
+                                                                      certificate_arn_parameter,
+                                                                      has_fargate_burst_condition,
+                                                                      api_burst_tarcreate_group_resource,
+                                                                      ec2_traffic_weight_variable,
+                                                                      fargate_traffic_weight_variable)
 ecs_service_role_resource = create_ecs_service_role_resource(template)
+autoscaling_group_resource = create_autoscaling_group_resource(template, api_instance_min_count_variable,
+                                                            api_instance_max_count_variable,
+                                                            api_instance_min_in_service_variable,
+                                                            launch_template_resource)
+autoscaling_group_warm_pool_resource = create_autoscaling_group_warm_pool_resource(
+    template, autoscaling_group_resource, api_instance_warm_pool_min_size_parameter,
+    api_instance_warm_pool_enabled_condition)
+ecs_capacity_provider_resource = create_ecs_capacity_provider_resource(template, autoscaling_group_resource,
+                                                                       api_instance_target_capacity_parameter)
+ecs_cluster_capacity_provider_associations_resource = create_ecs_cluster_capacity_provider_associations_resource(
+    template, ecs_cluster_resource, ecs_capacity_provider_resource, has_fargate_burst_condition)
 api_service_resource = create_api_service_resource(template, ecs_cluster_resource, api_task_definition_resource,
                                                 api_task_count_parameter, api_tarcreate_group_resource,
-                                                ecs_service_role_resource, load_balancer_listener_resource)
-queue_worker_service_resource = create_queue_worker_service_resource(template, ecs_cluster_resource,
-                                                                  queue_worker_task_definition_resource,
-                                                                  queue_worker_task_count_parameter)
+                                                ecs_service_role_resource, load_balancer_listener_resource,
+                                                ecs_capacity_provider_resource,
+                                                ecs_cluster_capacity_provider_associations_resource)
+default_queue_worker_service_resource = create_queue_worker_service_resource(
+    template, 'default', default_queue_worker_service_name_variable, ecs_cluster_resource,
+    default_queue_worker_task_definition_resource, default_queue_worker_task_count_parameter,
+    ecs_capacity_provider_resource, ecs_cluster_capacity_provider_associations_resource)
+notifications_queue_worker_service_resource = create_queue_worker_service_resource(
+    template, 'notifications', notifications_queue_worker_service_name_variable, ecs_cluster_resource,
+    notifications_queue_worker_task_definition_resource, notifications_queue_worker_task_count_parameter,
+    ecs_capacity_provider_resource, ecs_cluster_capacity_provider_associations_resource)
+search_queue_worker_service_resource = create_queue_worker_service_resource(
+    template, 'search', search_queue_worker_service_name_variable, ecs_cluster_resource,
+    search_queue_worker_task_definition_resource, search_queue_worker_task_count_parameter,
+    ecs_capacity_provider_resource, ecs_cluster_capacity_provider_associations_resource)
 scheduler_service_resource = create_scheduler_service_resource(template, ecs_cluster_resource,
                                                             scheduler_task_definition_resource,
-                                                            scheduler_task_count_parameter)
-autoscaling_group_resource = create_autoscaling_group_resource(template, api_instance_count_parameter,
-                                                            launch_template_resource)
+                                                            scheduler_task_count_parameter,
+                                                            ecs_capacity_provider_resource,
+                                                            ecs_cluster_capacity_provider_associations_resource,
+                                                            is_scheduler_service_condition)
+scheduler_events_role_resource = create_scheduler_events_role_resource(template, ecs_cluster_resource,
+                                                                    scheduler_task_definition_resource,
+                                                                    is_scheduler_eventbridge_condition)
+scheduler_rule_resource = create_scheduler_rule_resource(template, ecs_cluster_resource,
+                                                      scheduler_task_definition_resource,
+                                                      scheduler_events_role_resource,
+                                                      scheduler_schedule_expression_parameter,
+                                                      ecs_capacity_provider_resource,
+                                                      is_scheduler_eventbridge_condition)
+image_worker_service_resource = create_image_worker_service_resource(
+    template, ecs_cluster_resource, image_worker_task_definition_resource, image_worker_task_count_parameter,
+    ecs_capacity_provider_resource, ecs_cluster_capacity_provider_associations_resource)
 api_user_resource = create_api_user_resource(template, api_user_name_variable, uploads_bucket_resource,
-                                          default_queue_resource, notifications_queue_resource, search_queue_resource)
+                                          default_queue_resource, notifications_queue_resource, search_queue_resource,
+                                          images_queue_resource, cache_table_resource)
 ci_user_resource = create_ci_user_resource(template, ci_user_name_variable)
 elasticsearch_security_group_resource = create_elasticsearch_security_group_resource(template, api_security_group_resource)
 elasticsearch_resource = create_elasticsearch_resource(template, elasticsearch_domain_name_variable,
-                                                       elasticsearch_instance_count_parameter,
-                                                       elasticsearch_instance_class_parameter,
+                                                       elasticsearch_instance_count_variable,
+                                                       elasticsearch_instance_class_variable,
                                                        elasticsearch_security_group_resource,
-                                                       subnets_parameter)
+                                                       subnets_parameter,
+                                                       elasticsearch_availability_zone_count_parameter,
+                                                       elasticsearch_dedicated_master_count_parameter,
+                                                       elasticsearch_dedicated_master_class_parameter,
+                                                       is_elasticsearch_zone_aware_condition,
+                                                       has_three_elasticsearch_zones_condition,
+                                                       has_elasticsearch_dedicated_masters_condition,
+                                                       elasticsearch_volume_type_parameter,
+                                                       elasticsearch_volume_size_parameter,
+                                                       elasticsearch_volume_iops_parameter,
+                                                       is_elasticsearch_gp3_condition)
+api_scalable_target_resource = create_api_scalable_target_resource(template, ecs_cluster_resource, api_service_resource,
+                                                                   api_task_min_count_variable,
+                                                                   api_task_max_count_variable)
+api_request_count_scaling_policy_resource = create_api_request_count_scaling_policy_resource(
+    template, api_scalable_target_resource, api_task_target_request_count_parameter, load_balancer_resource,
+    api_tarcreate_group_resource)
+api_cpu_scaling_policy_resource = create_api_cpu_scaling_policy_resource(template, api_scalable_target_resource,
+                                                                         api_task_target_cpu_utilisation_parameter)
+api_memory_scaling_policy_resource = create_api_memory_scaling_policy_resource(
+    template, api_scalable_target_resource, api_task_target_memory_utilisation_parameter)
+default_queue_worker_scalable_target_resource = create_queue_worker_scalable_target_resource(
+    template, 'default', ecs_cluster_resource, default_queue_worker_service_resource,
+    default_queue_worker_task_min_count_variable, default_queue_worker_task_max_count_variable)
+notifications_queue_worker_scalable_target_resource = create_queue_worker_scalable_target_resource(
+    template, 'notifications', ecs_cluster_resource, notifications_queue_worker_service_resource,
+    notifications_queue_worker_task_min_count_variable, notifications_queue_worker_task_max_count_variable)
+search_queue_worker_scalable_target_resource = create_queue_worker_scalable_target_resource(
+    template, 'search', ecs_cluster_resource, search_queue_worker_service_resource,
+    search_queue_worker_task_min_count_variable, search_queue_worker_task_max_count_variable)
+default_queue_backlog_scaling_policy_resource = create_queue_backlog_scaling_policy_resource(
+    template, 'default', default_queue_resource, default_queue_worker_scalable_target_resource, ecs_cluster_resource,
+    default_queue_worker_service_resource, queue_worker_target_backlog_parameter)
+notifications_queue_backlog_scaling_policy_resource = create_queue_backlog_scaling_policy_resource(
+    template, 'notifications', notifications_queue_resource, notifications_queue_worker_scalable_target_resource,
+    ecs_cluster_resource, notifications_queue_worker_service_resource, queue_worker_target_backlog_parameter)
+search_queue_backlog_scaling_policy_resource = create_queue_backlog_scaling_policy_resource(
+    template, 'search', search_queue_resource, search_queue_worker_scalable_target_resource, ecs_cluster_resource,
+    search_queue_worker_service_resource, queue_worker_target_backlog_parameter)
+default_queue_worker_message_age_scaling_policy_resource = create_queue_worker_message_age_scaling_policy_resource(
+    template, 'default', default_queue_worker_scalable_target_resource)
+notifications_queue_worker_message_age_scaling_policy_resource = create_queue_worker_message_age_scaling_policy_resource(
+    template, 'notifications', notifications_queue_worker_scalable_target_resource)
+search_queue_worker_message_age_scaling_policy_resource = create_queue_worker_message_age_scaling_policy_resource(
+    template, 'search', search_queue_worker_scalable_target_resource)
+default_queue_message_age_alarm_resource = create_queue_message_age_alarm_resource(
+    template, 'default', default_queue_resource, queue_worker_max_message_age_parameter,
+    default_queue_worker_message_age_scaling_policy_resource)
+notifications_queue_message_age_alarm_resource = create_queue_message_age_alarm_resource(
+    template, 'notifications', notifications_queue_resource, queue_worker_max_message_age_parameter,
+    notifications_queue_worker_message_age_scaling_policy_resource)
+search_queue_message_age_alarm_resource = create_queue_message_age_alarm_resource(
+    template, 'search', search_queue_resource, queue_worker_max_message_age_parameter,
+    search_queue_worker_message_age_scaling_policy_resource)
+api_burst_service_resource = create_api_burst_service_resource(
+    template, has_fargate_burst_condition, ecs_cluster_resource, api_burst_task_definition_resource,
+    api_burst_tarcreate_group_resource, api_security_group_resource, subnets_parameter,
+    fargate_burst_spot_weight_parameter, load_balancer_listener_resource,
+    ecs_cluster_capacity_provider_associations_resource)
+api_burst_scalable_target_resource = create_api_burst_scalable_target_resource(
+    template, has_fargate_burst_condition, ecs_cluster_resource, api_burst_service_resource,
+    api_task_max_count_variable)
+api_burst_request_count_scaling_policy_resource = create_api_burst_request_count_scaling_policy_resource(
+    template, has_fargate_burst_condition, api_burst_scalable_target_resource, api_task_target_request_count_parameter,
+    load_balancer_resource, api_burst_tarcreate_group_resource)
+default_queue_worker_burst_service_resource = create_queue_worker_burst_service_resource(
+    template, 'default', has_fargate_burst_condition, default_queue_worker_burst_service_name_variable,
+    ecs_cluster_resource, default_queue_worker_burst_task_definition_resource, api_security_group_resource,
+    subnets_parameter, fargate_burst_spot_weight_parameter, ecs_cluster_capacity_provider_associations_resource)
+default_queue_worker_burst_scalable_target_resource = create_queue_worker_burst_scalable_target_resource(
+    template, 'default', has_fargate_burst_condition, ecs_cluster_resource, default_queue_worker_burst_service_resource,
+    default_queue_worker_task_max_count_variable)
+default_queue_burst_backlog_scaling_policy_resource = create_queue_burst_backlog_scaling_policy_resource(
+    template, 'default', has_fargate_burst_condition, default_queue_resource,
+    default_queue_worker_burst_scalable_target_resource, ecs_cluster_resource,
+    default_queue_worker_burst_service_resource, queue_worker_target_backlog_parameter)
+notifications_queue_worker_burst_service_resource = create_queue_worker_burst_service_resource(
+    template, 'notifications', has_fargate_burst_condition, notifications_queue_worker_burst_service_name_variable,
+    ecs_cluster_resource, notifications_queue_worker_burst_task_definition_resource, api_security_group_resource,
+    subnets_parameter, fargate_burst_spot_weight_parameter, ecs_cluster_capacity_provider_associations_resource)
+notifications_queue_worker_burst_scalable_target_resource = create_queue_worker_burst_scalable_target_resource(
+    template, 'notifications', has_fargate_burst_condition, ecs_cluster_resource,
+    notifications_queue_worker_burst_service_resource, notifications_queue_worker_task_max_count_variable)
+notifications_queue_burst_backlog_scaling_policy_resource = create_queue_burst_backlog_scaling_policy_resource(
+    template, 'notifications', has_fargate_burst_condition, notifications_queue_resource,
+    notifications_queue_worker_burst_scalable_target_resource, ecs_cluster_resource,
+    notifications_queue_worker_burst_service_resource, queue_worker_target_backlog_parameter)
+search_queue_worker_burst_service_resource = create_queue_worker_burst_service_resource(
+    template, 'search', has_fargate_burst_condition, search_queue_worker_burst_service_name_variable,
+    ecs_cluster_resource, search_queue_worker_burst_task_definition_resource, api_security_group_resource,
+    subnets_parameter, fargate_burst_spot_weight_parameter, ecs_cluster_capacity_provider_associations_resource)
+search_queue_worker_burst_scalable_target_resource = create_queue_worker_burst_scalable_target_resource(
+    template, 'search', has_fargate_burst_condition, ecs_cluster_resource, search_queue_worker_burst_service_resource,
+    search_queue_worker_task_max_count_variable)
+search_queue_burst_backlog_scaling_policy_resource = create_queue_burst_backlog_scaling_policy_resource(
+    template, 'search', has_fargate_burst_condition, search_queue_resource,
+    search_queue_worker_burst_scalable_target_resource, ecs_cluster_resource,
+    search_queue_worker_burst_service_resource, queue_worker_target_backlog_parameter)
+api_cache_policy_resource = create_api_cache_policy_resource(template, has_cdn_condition, api_cache_policy_name_variable)
+uploads_origin_access_control_resource = create_uploads_origin_access_control_resource(
+    template, has_cdn_condition, uploads_origin_access_control_name_variable)
+cdn_resource = create_cdn_resource(template, has_cdn_condition, api_domain_name_parameter, cdn_certificate_arn_parameter,
+                                   load_balancer_resource, uploads_bucket_resource, api_cache_policy_resource,
+                                   uploads_origin_access_control_resource)
+uploads_bucket_policy_resource = create_uploads_bucket_policy_resource(template, has_cdn_condition,
+                                                                       uploads_bucket_resource, cdn_resource)
+dashboard_resource = create_dashboard_resource(
+    template, dashboard_name_variable, load_balancer_resource, ecs_cluster_resource, api_service_resource,
+    is_scheduler_service_condition, scheduler_service_resource, default_queue_worker_service_resource,
+    notifications_queue_worker_service_resource, search_queue_worker_service_resource, image_worker_service_resource,
+    is_aurora_database_condition, database_resource, database_cluster_resource, redis_resource, elasticsearch_resource,
+    default_queue_resource, notifications_queue_resource, search_queue_resource, images_queue_resource)
+alarm_topic_resource = create_alarm_topic_resource(template)
+api_latency_alarm_resource = create_api_latency_alarm_resource(template, load_balancer_resource,
+                                                               api_latency_alarm_threshold_parameter,
+                                                               alarm_topic_resource)
+api_5xx_alarm_resource = create_api_5xx_alarm_resource(template, load_balancer_resource,
+                                                       api_5xx_alarm_threshold_parameter, alarm_topic_resource)
+database_cpu_alarm_resource = create_database_cpu_alarm_resource(template, is_aurora_database_condition,
+                                                                 database_resource, database_cluster_resource,
+                                                                 database_cpu_alarm_threshold_parameter,
+                                                                 alarm_topic_resource)
+database_free_storage_alarm_resource = create_database_free_storage_alarm_resource(
+    template, is_mysql_database_condition, database_resource, database_free_storage_alarm_threshold_parameter,
+    alarm_topic_resource)
+database_read_replica_1_lag_alarm_resource = create_database_read_replica_lag_alarm_resource(
+    template, 1, database_read_replica_1_condition, database_read_replica_1_resource,
+    database_replica_lag_alarm_threshold_parameter, alarm_topic_resource)
+database_read_replica_2_lag_alarm_resource = create_database_read_replica_lag_alarm_resource(
+    template, 2, database_read_replica_2_condition, database_read_replica_2_resource,
+    database_replica_lag_alarm_threshold_parameter, alarm_topic_resource)
+database_read_replica_3_lag_alarm_resource = create_database_read_replica_lag_alarm_resource(
+    template, 3, database_read_replica_3_condition, database_read_replica_3_resource,
+    database_replica_lag_alarm_threshold_parameter, alarm_topic_resource)
+database_cluster_replica_lag_alarm_resource = create_database_cluster_replica_lag_alarm_resource(
+    template, is_aurora_database_condition, database_cluster_resource, database_replica_lag_alarm_threshold_parameter,
+    alarm_topic_resource)
+redis_cpu_alarm_resources = create_redis_cpu_alarm_resources(template, has_redis_shard_conditions, redis_resource,
+                                                             redis_cpu_alarm_threshold_parameter, alarm_topic_resource)
+redis_evictions_alarm_resources = create_redis_evictions_alarm_resources(template, has_redis_shard_conditions,
+                                                                         redis_resource,
+                                                                         redis_evictions_alarm_threshold_parameter,
+                                                                         alarm_topic_resource)
+elasticsearch_jvm_pressure_alarm_resource = create_elasticsearch_jvm_pressure_alarm_resource(
+    template, elasticsearch_resource, elasticsearch_jvm_pressure_alarm_threshold_parameter, alarm_topic_resource)
+elasticsearch_cluster_status_alarm_resource = create_elasticsearch_cluster_status_alarm_resource(
+    template, elasticsearch_resource, alarm_topic_resource)
+default_queue_oldest_message_alarm_resource = create_queue_oldest_message_alarm_resource(
+    template, 'default', default_queue_resource, queue_message_age_alarm_threshold_parameter, alarm_topic_resource)
+notifications_queue_oldest_message_alarm_resource = create_queue_oldest_message_alarm_resource(
+    template, 'notifications', notifications_queue_resource, queue_message_age_alarm_threshold_parameter,
+    alarm_topic_resource)
+search_queue_oldest_message_alarm_resource = create_queue_oldest_message_alarm_resource(
+    template, 'search', search_queue_resource, queue_message_age_alarm_threshold_parameter, alarm_topic_resource)
+default_dead_letter_queue_alarm_resource = create_dead_letter_queue_alarm_resource(
+    template, 'default', default_dead_letter_queue_resource, alarm_topic_resource)
+notifications_dead_letter_queue_alarm_resource = create_dead_letter_queue_alarm_resource(
+    template, 'notifications', notifications_dead_letter_queue_resource, alarm_topic_resource)
+search_dead_letter_queue_alarm_resource = create_dead_letter_queue_alarm_resource(
+    template, 'search', search_dead_letter_queue_resource, alarm_topic_resource)
+images_dead_letter_queue_alarm_resource = create_dead_letter_queue_alarm_resource(
+    template, 'images', images_dead_letter_queue_resource, alarm_topic_resource)
 
 # Outputs.
 create_database_name_output(template, database_username_variable)
 create_database_username_output(template, database_username_variable)
-create_database_host_output(template, database_resource)
-create_database_port_output(template, database_resource)
+create_database_host_output(template, is_aurora_database_condition, database_resource, database_cluster_resource)
+create_database_port_output(template, is_aurora_database_condition, database_resource, database_cluster_resource)
+create_database_read_hosts_output(template, has_database_read_hosts_condition, is_aurora_database_condition,
+                                  database_cluster_resource,
+                                  [database_read_replica_1_condition, database_read_replica_2_condition,
+                                   database_read_replica_3_condition],
+                                  [database_read_replica_1_resource, database_read_replica_2_resource,
+                                   database_read_replica_3_resource])
 create_redis_host_output(template, redis_resource)
 create_redis_port_output(template, redis_resource)
+create_cache_table_output(template, cache_table_resource)
 create_default_queue_output(template, default_queue_name_variable)
 create_notifications_queue_output(template, notifications_queue_name_variable)
+create_dead_letter_queue_output(template, 'default', default_dead_letter_queue_name_variable)
+create_dead_letter_queue_output(template, 'notifications', notifications_dead_letter_queue_name_variable)
+create_dead_letter_queue_output(template, 'search', search_dead_letter_queue_name_variable)
+create_dead_letter_queue_output(template, 'images', images_dead_letter_queue_name_variable)
 create_load_balancer_domain_output(template, load_balancer_resource)
 create_elasticsearch_host_output(template, elasticsearch_resource)
 create_docker_repository_uri_output(template, docker_repository_resource)
 create_docker_cluster_name_output(template, ecs_cluster_resource)
+create_cdn_domain_output(template, has_cdn_condition, cdn_resource)
+create_access_logs_bucket_output(template, access_logs_bucket_resource)
+create_access_logs_table_output(template, access_logs_database_resource, access_logs_table_resource)
+create_alarm_topic_output(template, alarm_topic_resource)
 
-# Print the generated template in JSON.
-print(template.to_json())
+# Print the generated template in compact JSON, as the per-shard Redis alarms make it too large to indent.
+print(template.to_json(indent=None, separators=(',', ':')))
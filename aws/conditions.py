@@ -0,0 +1,183 @@
+from troposphere import And, Condition, Equals, FindInMap, Not, Or, Ref
+
+
+def create_is_mysql_database_condition(template, database_engine_mode_parameter):
+    return template.add_condition(
+        'IsMysqlDatabase',
+        Equals(Ref(database_engine_mode_parameter), 'mysql')
+    )
+
+
+def create_is_aurora_database_condition(template, database_engine_mode_parameter):
+    return template.add_condition(
+        'IsAuroraDatabase',
+        Equals(Ref(database_engine_mode_parameter), 'aurora-mysql')
+    )
+
+
+def create_database_read_replica_condition(template, number, database_read_replica_count_parameter,
+                                           is_mysql_database_condition):
+    counts = [Equals(Ref(database_read_replica_count_parameter), str(count)) for count in range(number, 4)]
+
+    return template.add_condition(
+        'HasDatabaseReadReplica{}'.format(number),
+        And(Condition(is_mysql_database_condition), Or(*counts) if len(counts) > 1 else counts[0])
+    )
+
+
+def create_has_database_read_hosts_condition(template, is_aurora_database_condition, database_read_replica_1_condition):
+    return template.add_condition(
+        'HasDatabaseReadHosts',
+        Or(Condition(is_aurora_database_condition), Condition(database_read_replica_1_condition))
+    )
+
+
+def create_has_cdn_condition(template, api_domain_name_parameter, cdn_certificate_arn_parameter):
+    return template.add_condition(
+        'HasCdn',
+        And(Not(Equals(Ref(api_domain_name_parameter), '')), Not(Equals(Ref(cdn_certificate_arn_parameter), '')))
+    )
+
+
+def create_is_elasticsearch_zone_aware_condition(template, elasticsearch_availability_zone_count_parameter):
+    return template.add_condition(
+        'IsElasticsearchZoneAware',
+        Not(Equals(Ref(elasticsearch_availability_zone_count_parameter), '1'))
+    )
+
+
+def create_has_three_elasticsearch_zones_condition(template, elasticsearch_availability_zone_count_parameter):
+    return template.add_condition(
+        'HasThreeElasticsearchZones',
+        Equals(Ref(elasticsearch_availability_zone_count_parameter), '3')
+    )
+
+
+def create_has_elasticsearch_dedicated_masters_condition(template, elasticsearch_dedicated_master_count_parameter):
+    return template.add_condition(
+        'HasElasticsearchDedicatedMasters',
+        Not(Equals(Ref(elasticsearch_dedicated_master_count_parameter), '0'))
+    )
+
+
+def create_overridden_condition(template, parameter):
+    return template.add_condition(
+        '{}Overridden'.format(parameter.title),
+        Not(Equals(Ref(parameter), ''))
+    )
+
+
+def create_has_database_enhanced_monitoring_condition(template, database_monitoring_interval_parameter):
+    return template.add_condition(
+        'HasDatabaseEnhancedMonitoring',
+        Not(Equals(Ref(database_monitoring_interval_parameter), '0'))
+    )
+
+
+def create_is_elasticsearch_gp3_condition(template, elasticsearch_volume_type_parameter):
+    return template.add_condition(
+        'IsElasticsearchGp3',
+        Equals(Ref(elasticsearch_volume_type_parameter), 'gp3')
+    )
+
+
+def create_has_fargate_burst_condition(template, compute_mode_parameter):
+    return template.add_condition(
+        'HasFargateBurst',
+        Equals(Ref(compute_mode_parameter), 'ec2-fargate-burst')
+    )
+
+
+def create_is_api_round_robin_condition(template, api_load_balancing_algorithm_parameter):
+    return template.add_condition(
+        'IsApiRoundRobin',
+        Equals(Ref(api_load_balancing_algorithm_parameter), 'round_robin')
+    )
+
+
+def create_has_tracing_sidecar_condition(template, tracing_sidecar_parameter):
+    return template.add_condition(
+        'HasTracingSidecar',
+        Equals(Ref(tracing_sidecar_parameter), 'enabled')
+    )
+
+
+def create_is_scheduler_eventbridge_condition(template, scheduler_mode_parameter):
+    return template.add_condition(
+        'IsSchedulerEventBridge',
+        Equals(Ref(scheduler_mode_parameter), 'eventbridge')
+    )
+
+
+def create_is_scheduler_service_condition(template, scheduler_mode_parameter):
+    return template.add_condition(
+        'IsSchedulerService',
+        Equals(Ref(scheduler_mode_parameter), 'service')
+    )
+
+
+def create_enabled_condition(template, parameter):
+    return template.add_condition(
+        '{}Enabled'.format(parameter.title),
+        Equals(Ref(parameter), 'enabled')
+    )
+
+
+def create_has_interface_vpc_endpoints_condition(template, vpc_endpoint_enabled_conditions):
+    return template.add_condition(
+        'HasInterfaceVpcEndpoints',
+        Or(*[Condition(condition) for condition in vpc_endpoint_enabled_conditions])
+    )
+
+
+def create_has_redis_shard_conditions(template, redis_shards_count_parameter, redis_shards_count_overridden_condition,
+                                      performance_profile_parameter, performance_profiles_mapping,
+                                      max_redis_shards_count):
+    # The first shard always exists. Each later shard exists when the one before it does and the count is not the
+    # one before it, or when the count is blank and the performance profile has at least that many shards.
+    conditions = [None]
+    for shard in range(2, max_redis_shards_count + 1):
+        overridden = [Condition(redis_shards_count_overridden_condition),
+                      Not(Equals(Ref(redis_shards_count_parameter), str(shard - 1)))]
+        if conditions[-1] is not None:
+            overridden.append(Condition(conditions[-1]))
+        profiles = [Equals(Ref(performance_profile_parameter), profile)
+                    for profile, values in template.mappings[performance_profiles_mapping].items()
+                    if int(values[redis_shards_count_parameter.title]) >= shard]
+        condition = And(*overridden)
+        if profiles:
+            condition = Or(condition, And(Not(Condition(redis_shards_count_overridden_condition)),
+                                          Or(*profiles) if len(profiles) > 1 else profiles[0]))
+        conditions.append(template.add_condition('HasRedisShard{}'.format(shard), condition))
+
+    return conditions
+
+
+def create_is_api_instance_count_fixed_condition(template, api_instance_min_count_parameter,
+                                                 api_instance_max_count_parameter,
+                                                 api_instance_min_count_overridden_condition,
+                                                 api_instance_max_count_overridden_condition,
+                                                 performance_profile_parameter, performance_profiles_mapping):
+    # Each count is either its parameter or the performance profile's value, so compare each pairing.
+    profile_min_count = FindInMap(performance_profiles_mapping, Ref(performance_profile_parameter),
+                                  api_instance_min_count_parameter.title)
+    profile_max_count = FindInMap(performance_profiles_mapping, Ref(performance_profile_parameter),
+                                  api_instance_max_count_parameter.title)
+    fixed_profiles = [
+        Equals(Ref(performance_profile_parameter), profile)
+        for profile, values in template.mappings[performance_profiles_mapping].items()
+        if values[api_instance_min_count_parameter.title] == values[api_instance_max_count_parameter.title]
+    ]
+    min_overridden = Condition(api_instance_min_count_overridden_condition)
+    max_overridden = Condition(api_instance_max_count_overridden_condition)
+    pairings = [
+        And(min_overridden, max_overridden,
+            Equals(Ref(api_instance_min_count_parameter), Ref(api_instance_max_count_parameter))),
+        And(min_overridden, Not(max_overridden), Equals(Ref(api_instance_min_count_parameter), profile_max_count)),
+        And(Not(min_overridden), max_overridden, Equals(profile_min_count, Ref(api_instance_max_count_parameter)))
+    ]
+    if fixed_profiles:
+        pairings.append(And(Not(min_overridden), Not(max_overridden),
+                            Or(*fixed_profiles) if len(fixed_profiles) > 1 else fixed_profiles[0]))
+
+    return template.add_condition('IsApiInstanceCountFixed', Or(*pairings))
@@ -0,0 +1,146 @@
+def create_performance_profiles_mapping(template):
+    template.add_mapping('PerformanceProfiles', {
+        'dev': {
+            'DatabaseClass': 'db.t3.micro',
+            'DatabaseReadReplicaClass': 'db.t3.micro',
+            'DatabaseClusterInstanceClass': 'db.t3.medium',
+            'DatabaseMaxConnections': '60',
+            'DatabasePerformanceInsights': 'false',
+            'RedisNodeClass': 'cache.t2.micro',
+            'RedisShardsCount': '1',
+            'RedisReplicasPerShard': '1',
+            'ApiInstanceClass': 't3.micro',
+            'ApiInstanceMinCount': '1',
+            'ApiInstanceMaxCount': '4',
+            'ApiTaskMinCount': '1',
+            'ApiTaskMaxCount': '10',
+            'DefaultQueueWorkerTaskMinCount': '1',
+            'DefaultQueueWorkerTaskMaxCount': '10',
+            'NotificationsQueueWorkerTaskMinCount': '1',
+            'NotificationsQueueWorkerTaskMaxCount': '10',
+            'SearchQueueWorkerTaskMinCount': '1',
+            'SearchQueueWorkerTaskMaxCount': '10',
+            'ElasticsearchInstanceClass': 't2.small.elasticsearch',
+            'ElasticsearchInstanceCount': '2'
+        },
+        'staging': {
+            'DatabaseClass': 'db.t3.small',
+            'DatabaseReadReplicaClass': 'db.t3.small',
+            'DatabaseClusterInstanceClass': 'db.t3.medium',
+            'DatabaseMaxConnections': '120',
+            'DatabasePerformanceInsights': 'false',
+            'RedisNodeClass': 'cache.t3.small',
+            'RedisShardsCount': '1',
+            'RedisReplicasPerShard': '1',
+            'ApiInstanceClass': 't3.small',
+            'ApiInstanceMinCount': '1',
+            'ApiInstanceMaxCount': '4',
+            'ApiTaskMinCount': '1',
+            'ApiTaskMaxCount': '10',
+            'DefaultQueueWorkerTaskMinCount': '1',
+            'DefaultQueueWorkerTaskMaxCount': '10',
+            'NotificationsQueueWorkerTaskMinCount': '1',
+            'NotificationsQueueWorkerTaskMaxCount': '10',
+            'SearchQueueWorkerTaskMinCount': '1',
+            'SearchQueueWorkerTaskMaxCount': '10',
+            'ElasticsearchInstanceClass': 't2.medium.elasticsearch',
+            'ElasticsearchInstanceCount': '2'
+        },
+        'production': {
+            'DatabaseClass': 'db.m5.large',
+            'DatabaseReadReplicaClass': 'db.m5.large',
+            'DatabaseClusterInstanceClass': 'db.r5.large',
+            'DatabaseMaxConnections': '600',
+            'DatabasePerformanceInsights': 'true',
+            'RedisNodeClass': 'cache.m5.large',
+            'RedisShardsCount': '2',
+            'RedisReplicasPerShard': '1',
+            'ApiInstanceClass': 'c5.large',
+            'ApiInstanceMinCount': '2',
+            'ApiInstanceMaxCount': '8',
+            'ApiTaskMinCount': '2',
+            'ApiTaskMaxCount': '20',
+            'DefaultQueueWorkerTaskMinCount': '1',
+            'DefaultQueueWorkerTaskMaxCount': '20',
+            'NotificationsQueueWorkerTaskMinCount': '1',
+            'NotificationsQueueWorkerTaskMaxCount': '20',
+            'SearchQueueWorkerTaskMinCount': '1',
+            'SearchQueueWorkerTaskMaxCount': '20',
+            'ElasticsearchInstanceClass': 'm5.large.elasticsearch',
+            'ElasticsearchInstanceCount': '4'
+        },
+        'peak': {
+            'DatabaseClass': 'db.r5.xlarge',
+            'DatabaseReadReplicaClass': 'db.r5.large',
+            'DatabaseClusterInstanceClass': 'db.r5.xlarge',
+            'DatabaseMaxConnections': '2000',
+            'DatabasePerformanceInsights': 'true',
+            'RedisNodeClass': 'cache.r5.large',
+            'RedisShardsCount': '3',
+            'RedisReplicasPerShard': '2',
+            'ApiInstanceClass': 'c5.xlarge',
+            'ApiInstanceMinCount': '3',
+            'ApiInstanceMaxCount': '12',
+            'ApiTaskMinCount': '4',
+            'ApiTaskMaxCount': '40',
+            'DefaultQueueWorkerTaskMinCount': '2',
+            'DefaultQueueWorkerTaskMaxCount': '40',
+            'NotificationsQueueWorkerTaskMinCount': '2',
+            'NotificationsQueueWorkerTaskMaxCount': '40',
+            'SearchQueueWorkerTaskMinCount': '2',
+            'SearchQueueWorkerTaskMaxCount': '40',
+            'ElasticsearchInstanceClass': 'r5.large.elasticsearch',
+            'ElasticsearchInstanceCount': '6'
+        }
+    })
+
+    return 'PerformanceProfiles'
+
+
+def create_fargate_burst_traffic_weights_mapping(template):
+    template.add_mapping('FargateBurstTrafficWeights', {
+        '10': {'Ec2': '90', 'Fargate': '10'},
+        '20': {'Ec2': '80', 'Fargate': '20'},
+        '30': {'Ec2': '70', 'Fargate': '30'},
+        '40': {'Ec2': '60', 'Fargate': '40'},
+        '50': {'Ec2': '50', 'Fargate': '50'}
+    })
+
+    return 'FargateBurstTrafficWeights'
+
+
+def create_elb_account_ids_mapping(template):
+    template.add_mapping('ElbAccountIds', {
+        'us-east-1': {'AccountId': '127311923021'},
+        'us-east-2': {'AccountId': '033677994240'},
+        'us-west-1': {'AccountId': '027434742980'},
+        'us-west-2': {'AccountId': '797873946194'},
+        'af-south-1': {'AccountId': '098369216593'},
+        'ap-east-1': {'AccountId': '754344448648'},
+        'ap-south-1': {'AccountId': '718504428378'},
+        'ap-northeast-1': {'AccountId': '582318560864'},
+        'ap-northeast-2': {'AccountId': '600734575887'},
+        'ap-northeast-3': {'AccountId': '383597477331'},
+        'ap-southeast-1': {'AccountId': '114774131450'},
+        'ap-southeast-2': {'AccountId': '783225319266'},
+        'ap-southeast-3': {'AccountId': '589379963580'},
+        'ca-central-1': {'AccountId': '985666609251'},
+        'eu-central-1': {'AccountId': '054676820928'},
+        'eu-west-1': {'AccountId': '156460612806'},
+        'eu-west-2': {'AccountId': '652711504416'},
+        'eu-west-3': {'AccountId': '009996457667'},
+        'eu-south-1': {'AccountId': '635631232127'},
+        'eu-north-1': {'AccountId': '897822967062'},
+        'me-south-1': {'AccountId': '076674570225'},
+        'sa-east-1': {'AccountId': '507241528517'}
+    })
+
+    return 'ElbAccountIds'
+
+
+def create_instance_counts_mapping(template):
+    template.add_mapping('InstanceCounts', {
+        str(count): {'OneFewer': str(count - 1)} for count in range(1, 51)
+    })
+
+    return 'InstanceCounts'
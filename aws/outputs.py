@@ -1,4 +1,4 @@
-from troposphere import Output, Ref, GetAtt, Sub
+from troposphere import Output, Ref, GetAtt, Sub, Join, If
 
 
 def create_database_name_output(template, database_username_variable):
@@ -21,22 +21,44 @@ def create_database_username_output(template, database_username_variable):
     )
 
 
-def create_database_host_output(template, database_resource):
+def create_database_host_output(template, is_aurora_database_condition, database_resource, database_cluster_resource):
     return template.add_output(
         Output(
             'DatabaseHost',
-            Description='The host of the RDS instance',
-            Value=GetAtt(database_resource, 'Endpoint.Address')
+            Description='The host of the RDS instance or Aurora writer',
+            Value=If(is_aurora_database_condition,
+                     GetAtt(database_cluster_resource, 'Endpoint.Address'),
+                     GetAtt(database_resource, 'Endpoint.Address'))
         )
     )
 
 
-def create_database_port_output(template, database_resource):
+def create_database_port_output(template, is_aurora_database_condition, database_resource, database_cluster_resource):
     return template.add_output(
         Output(
             'DatabasePort',
-            Description='The port of the RDS instance',
-            Value=GetAtt(database_resource, 'Endpoint.Port')
+            Description='The port of the RDS instance or Aurora cluster',
+            Value=If(is_aurora_database_condition,
+                     GetAtt(database_cluster_resource, 'Endpoint.Port'),
+                     GetAtt(database_resource, 'Endpoint.Port'))
+        )
+    )
+
+
+def create_database_read_hosts_output(template, has_database_read_hosts_condition, is_aurora_database_condition,
+                                      database_cluster_resource, database_read_replica_conditions,
+                                      database_read_replica_resources):
+    hosts = [GetAtt(resource, 'Endpoint.Address') for resource in database_read_replica_resources]
+    value = Join(',', hosts)
+    for count in reversed(range(1, len(hosts))):
+        value = If(database_read_replica_conditions[count], value, Join(',', hosts[:count]))
+
+    return template.add_output(
+        Output(
+            'DatabaseReadHosts',
+            Description='The comma separated hosts of the RDS read replicas or the Aurora reader endpoint',
+            Condition=has_database_read_hosts_condition,
+            Value=If(is_aurora_database_condition, GetAtt(database_cluster_resource, 'ReadEndpoint.Address'), value)
         )
     )
 
@@ -45,8 +67,8 @@ def create_redis_host_output(template, redis_resource):
     return template.add_output(
         Output(
             'RedisHost',
-            Description='The host of the Redis instance',
-            Value=GetAtt(redis_resource, 'RedisEndpoint.Address')
+            Description='The configuration endpoint host of the Redis cluster',
+            Value=GetAtt(redis_resource, 'ConfigurationEndPoint.Address')
         )
     )
 
@@ -55,8 +77,8 @@ def create_redis_port_output(template, redis_resource):
     return template.add_output(
         Output(
             'RedisPort',
-            Description='The port of the Redis instance',
-            Value=GetAtt(redis_resource, 'RedisEndpoint.Port')
+            Description='The configuration endpoint port of the Redis cluster',
+            Value=GetAtt(redis_resource, 'ConfigurationEndPoint.Port')
         )
     )
 
@@ -81,6 +103,26 @@ def create_notifications_queue_output(template, notifications_queue_name_variabl
     )
 
 
+def create_dead_letter_queue_output(template, queue, dead_letter_queue_name_variable):
+    return template.add_output(
+        Output(
+            '{}DeadLetterQueue'.format(queue.title()),
+            Description='The name of the {} dead-letter queue, watch its depth for failed jobs'.format(queue),
+            Value=dead_letter_queue_name_variable
+        )
+    )
+
+
+def create_cache_table_output(template, cache_table_resource):
+    return template.add_output(
+        Output(
+            'CacheTable',
+            Description='The name of the DynamoDB table for the cache and sessions',
+            Value=Ref(cache_table_resource)
+        )
+    )
+
+
 def create_load_balancer_domain_output(template, load_balancer_resource):
     return template.add_output(
         Output(
@@ -120,3 +162,44 @@ def create_docker_cluster_name_output(template, ecs_cluster_resource):
             Value=Ref(ecs_cluster_resource)
         )
     )
+
+
+def create_cdn_domain_output(template, has_cdn_condition, cdn_resource):
+    return template.add_output(
+        Output(
+            'CdnDomain',
+            Description='The domain name of the CloudFront distribution, to point the API domain at',
+            Condition=has_cdn_condition,
+            Value=GetAtt(cdn_resource, 'DomainName')
+        )
+    )
+
+
+def create_access_logs_bucket_output(template, access_logs_bucket_resource):
+    return template.add_output(
+        Output(
+            'AccessLogsBucket',
+            Description='The name of the bucket the load balancer access logs are written to',
+            Value=Ref(access_logs_bucket_resource)
+        )
+    )
+
+
+def create_access_logs_table_output(template, access_logs_database_resource, access_logs_table_resource):
+    return template.add_output(
+        Output(
+            'AccessLogsTable',
+            Description='The Athena table (database.table) for querying the load balancer access logs',
+            Value=Join('.', [Ref(access_logs_database_resource), Ref(access_logs_table_resource)])
+        )
+    )
+
+
+def create_alarm_topic_output(template, alarm_topic_resource):
+    return template.add_output(
+        Output(
+            'AlarmTopic',
+            Description='The ARN of the SNS topic alarms are published to, for on-call to subscribe to',
+            Value=Ref(alarm_topic_resource)
+        )
+    )
@@ -35,6 +35,28 @@ def create_certificate_arn_parameter(template):
     )
 
 
+def create_api_domain_name_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiDomainName',
+            Type='String',
+            Default='',
+            Description='The public domain name of the API, served through CloudFront (leave blank to disable CloudFront).'
+        )
+    )
+
+
+def create_cdn_certificate_arn_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'CdnCertificateArn',
+            Type='String',
+            Default='',
+            Description='The ARN for the CloudFront SSL certificate, which must be in us-east-1 (leave blank to disable CloudFront).'
+        )
+    )
+
+
 def create_vpc_parameter(template):
     return template.add_parameter(
         Parameter(
@@ -55,6 +77,30 @@ def create_subnets_parameter(template):
     )
 
 
+def create_route_tables_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'RouteTables',
+            Type='CommaDelimitedList',
+            Default='',
+            Description='The route table IDs used by the subnets, required for the S3 gateway endpoint.'
+        )
+    )
+
+
+def create_vpc_endpoint_parameter(template, name, service_label):
+    return template.add_parameter(
+        Parameter(
+            '{}VpcEndpoint'.format(name),
+            Description='Whether to route {} traffic through a VPC endpoint.'.format(service_label),
+            Type='String',
+            Default='disabled',
+            AllowedValues=['enabled', 'disabled'],
+            ConstraintDescription='Must be either enabled or disabled.'
+        )
+    )
+
+
 def create_database_password_parameter(template):
     return template.add_parameter(
         Parameter(
@@ -74,16 +120,23 @@ def create_database_class_parameter(template):
     return template.add_parameter(
         Parameter(
             'DatabaseClass',
-            Description='The database instance class.',
+            Description='The database instance class (leave blank to use the performance profile).',
             Type='String',
-            Default='db.t3.micro',
+            Default='',
             AllowedValues=[
+                '',
                 'db.t3.micro',
                 'db.t3.small',
                 'db.t3.medium',
                 'db.t3.large',
                 'db.t3.xlarge',
-                'db.t3.2xlarge'
+                'db.t3.2xlarge',
+                'db.m5.large',
+                'db.m5.xlarge',
+                'db.m5.2xlarge',
+                'db.r5.large',
+                'db.r5.xlarge',
+                'db.r5.2xlarge'
             ],
             ConstraintDescription='Must select a valid database instance type.'
         )
@@ -95,11 +148,246 @@ def create_database_allocated_storage_parameter(template):
         Parameter(
             'DatabaseAllocatedStorage',
             Description='The size of the database (GiB).',
-            Default='10',
+            Default='20',
             Type='Number',
-            MinValue='5',
+            MinValue='20',
             MaxValue='1024',
-            ConstraintDescription='Must be between 5 and 1024 GiB.'
+            ConstraintDescription='Must be between 20 and 1024 GiB.'
+        )
+    )
+
+
+def create_database_max_allocated_storage_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseMaxAllocatedStorage',
+            Description='The size (GiB) the database storage can autoscale up to, must exceed the allocated storage.',
+            Default='100',
+            Type='Number',
+            MinValue='21',
+            MaxValue='16384',
+            ConstraintDescription='Must be between 21 and 16384 GiB.'
+        )
+    )
+
+
+def create_database_iops_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseIops',
+            Description='The provisioned gp3 IOPS (leave blank for the 3000 baseline, requires 400 GiB or more).',
+            Default='',
+            Type='String',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_database_storage_throughput_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseStorageThroughput',
+            Description='The provisioned gp3 throughput (MiB/s) (leave blank for the 125 baseline, requires 400 GiB or more).',
+            Default='',
+            Type='String',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_database_read_replica_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseReadReplicaCount',
+            Description='The number of database read replicas to run.',
+            Type='Number',
+            Default='0',
+            AllowedValues=['0', '1', '2', '3'],
+            ConstraintDescription='Must be between 0 and 3.'
+        )
+    )
+
+
+def create_database_read_replica_class_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseReadReplicaClass',
+            Description='The database read replica instance class (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedValues=[
+                '',
+                'db.t3.micro',
+                'db.t3.small',
+                'db.t3.medium',
+                'db.t3.large',
+                'db.t3.xlarge',
+                'db.t3.2xlarge',
+                'db.m5.large',
+                'db.m5.xlarge',
+                'db.m5.2xlarge',
+                'db.r5.large',
+                'db.r5.xlarge',
+                'db.r5.2xlarge'
+            ],
+            ConstraintDescription='Must select a valid database instance type.'
+        )
+    )
+
+
+def create_database_engine_mode_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseEngineMode',
+            Description='Whether to run the database as a single MySQL instance or an Aurora MySQL cluster.',
+            Type='String',
+            Default='mysql',
+            AllowedValues=['mysql', 'aurora-mysql'],
+            ConstraintDescription='Must be either mysql or aurora-mysql.'
+        )
+    )
+
+
+def create_database_cluster_instance_class_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseClusterInstanceClass',
+            Description='The Aurora writer and reader instance class (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedValues=[
+                '',
+                'db.t3.medium',
+                'db.t3.large',
+                'db.r5.large',
+                'db.r5.xlarge',
+                'db.r5.2xlarge',
+                'db.r5.4xlarge'
+            ],
+            ConstraintDescription='Must select a valid Aurora instance type.'
+        )
+    )
+
+
+def create_database_cluster_reader_min_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseClusterReaderMinCount',
+            Description='The minimum number of Aurora readers to scale in to.',
+            Type='Number',
+            Default='1',
+            MinValue='0',
+            MaxValue='15',
+            ConstraintDescription='Must be between 0 and 15.'
+        )
+    )
+
+
+def create_database_cluster_reader_max_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseClusterReaderMaxCount',
+            Description='The maximum number of Aurora readers to scale out to.',
+            Type='Number',
+            Default='4',
+            MinValue='1',
+            MaxValue='15',
+            ConstraintDescription='Must be between 1 and 15.'
+        )
+    )
+
+
+def create_database_cluster_reader_scaling_metric_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseClusterReaderScalingMetric',
+            Description='The metric Aurora readers are scaled on.',
+            Type='String',
+            Default='RDSReaderAverageCPUUtilization',
+            AllowedValues=['RDSReaderAverageCPUUtilization', 'RDSReaderAverageDatabaseConnections'],
+            ConstraintDescription='Must select a valid Aurora reader metric.'
+        )
+    )
+
+
+def create_database_cluster_reader_target_value_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseClusterReaderTargetValue',
+            Description='The average reader CPU utilisation (%) or connection count to keep the Aurora readers at.',
+            Type='Number',
+            Default='70',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_database_max_connections_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseMaxConnections',
+            Description='The maximum number of database connections (leave blank to use the performance profile).',
+            Default='',
+            Type='String',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_database_innodb_buffer_pool_percentage_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseInnodbBufferPoolPercentage',
+            Description='The percentage of the MySQL instance memory to give to the InnoDB buffer pool.',
+            Type='Number',
+            Default='75',
+            MinValue='10',
+            MaxValue='90',
+            ConstraintDescription='Must be between 10 and 90.'
+        )
+    )
+
+
+def create_database_long_query_time_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseLongQueryTime',
+            Description='The duration (seconds) after which a query is written to the slow query log.',
+            Type='Number',
+            Default='1',
+            MinValue='0',
+            MaxValue='60',
+            ConstraintDescription='Must be between 0 and 60 seconds.'
+        )
+    )
+
+
+def create_database_performance_insights_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabasePerformanceInsights',
+            Description='Whether to enable Performance Insights (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedValues=['', 'true', 'false'],
+            ConstraintDescription='Must be blank, true or false.'
+        )
+    )
+
+
+def create_database_monitoring_interval_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseMonitoringInterval',
+            Description='The enhanced monitoring interval (seconds), or 0 to disable enhanced monitoring.',
+            Type='Number',
+            Default='60',
+            AllowedValues=['0', '1', '5', '10', '15', '30', '60'],
+            ConstraintDescription='Must select a valid monitoring interval.'
         )
     )
 
@@ -108,28 +396,51 @@ def create_redis_node_class_parameter(template):
     return template.add_parameter(
         Parameter(
             'RedisNodeClass',
-            Description='The Redis node class.',
+            Description='The Redis node class (leave blank to use the performance profile).',
             Type='String',
-            Default='cache.t2.micro',
+            Default='',
             AllowedValues=[
+                '',
                 'cache.t2.micro',
                 'cache.t2.small',
-                'cache.t2.medium'
+                'cache.t2.medium',
+                'cache.t3.micro',
+                'cache.t3.small',
+                'cache.t3.medium',
+                'cache.m5.large',
+                'cache.m5.xlarge',
+                'cache.r5.large',
+                'cache.r5.xlarge'
             ],
             ConstraintDescription='Must select a valid Redis node type.'
         )
     )
 
 
-def create_redis_nodes_count_parameter(template):
+def create_redis_shards_count_parameter(template):
     return template.add_parameter(
         Parameter(
-            'RedisNodesCount',
-            Description='The number of Redis nodes to have in the cluster.',
-            Default='1',
-            Type='Number',
-            MinValue='1',
-            ConstraintDescription='Must be 1 or more.'
+            'RedisShardsCount',
+            Description='The number of Redis shards (node groups) to partition the cluster into, between 1 and 90 '
+                        '(leave blank to use the performance profile).',
+            Default='',
+            Type='String',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_redis_replicas_per_shard_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'RedisReplicasPerShard',
+            Description='The number of Redis read replicas to have in each shard, between 0 and 5 (leave blank to '
+                        'use the performance profile).',
+            Default='',
+            Type='String',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
         )
     )
 
@@ -138,68 +449,169 @@ def create_api_instance_class_parameter(template):
     return template.add_parameter(
         Parameter(
             'ApiInstanceClass',
-            Description='The API EC2 instance class.',
+            Description='The API EC2 instance class (leave blank to use the performance profile).',
             Type='String',
-            Default='t3.micro',
+            Default='',
             AllowedValues=[
+                '',
                 't3.nano',
                 't3.micro',
                 't3.small',
                 't3.medium',
                 't3.large',
                 't3.xlarge',
-                't3.2xlarge'
+                't3.2xlarge',
+                'c5.large',
+                'c5.xlarge',
+                'c5.2xlarge',
+                'm5.large',
+                'm5.xlarge',
+                'm5.2xlarge',
+                'r5.large',
+                'r5.xlarge'
             ],
             ConstraintDescription='Must select a valid API instance type.'
         )
     )
 
 
-def create_api_instance_count_parameter(template):
+def create_api_instance_min_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiInstanceMinCount',
+            Description='The minimum number of API EC2 instances to scale in to (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_api_instance_max_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiInstanceMaxCount',
+            Description='The maximum number of API EC2 instances to scale out to (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_api_instance_target_capacity_parameter(template):
     return template.add_parameter(
         Parameter(
-            'ApiInstanceCount',
-            Description='The number of API EC2 instances to load balance between.',
+            'ApiInstanceTargetCapacity',
+            Description='The percentage of API EC2 instance capacity to keep in use by tasks.',
             Type='Number',
-            Default='2',
+            Default='90',
             MinValue='1',
-            ConstraintDescription='Must be 1 or more.'
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
         )
     )
 
 
-def create_api_task_count_parameter(template):
+def create_api_image_id_parameter(template):
     return template.add_parameter(
         Parameter(
-            'ApiTaskCount',
-            Description='The number of API containers to run.',
+            'ApiImageId',
+            Description='The SSM parameter to resolve the ECS-optimised AMI for the API instances from.',
+            Type='AWS::SSM::Parameter::Value<AWS::EC2::Image::Id>',
+            Default='/aws/service/ecs/optimized-ami/amazon-linux-2023/recommended/image_id'
+        )
+    )
+
+
+def create_api_image_pull_behavior_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiImagePullBehavior',
+            Description='The ECS agent image pull behaviour (only use once/prefer-cached with immutable image tags).',
+            Type='String',
+            Default='default',
+            AllowedValues=['default', 'always', 'once', 'prefer-cached'],
+            ConstraintDescription='Must select a valid image pull behaviour.'
+        )
+    )
+
+
+def create_api_instance_warm_pool_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiInstanceWarmPool',
+            Description='Whether to keep a warm pool of stopped, pre-initialised API EC2 instances.',
+            Type='String',
+            Default='disabled',
+            AllowedValues=['enabled', 'disabled'],
+            ConstraintDescription='Must be either enabled or disabled.'
+        )
+    )
+
+
+def create_api_instance_warm_pool_min_size_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiInstanceWarmPoolMinSize',
+            Description='The minimum number of API EC2 instances to keep in the warm pool.',
             Type='Number',
-            Default='0',
+            Default='1',
             MinValue='0',
             ConstraintDescription='Must be 0 or more.'
         )
     )
 
 
-def create_scheduler_task_count_parameter(template):
+def create_api_volume_size_parameter(template):
     return template.add_parameter(
         Parameter(
-            'SchedulerTaskCount',
-            Description='The number of scheduler containers to run.',
+            'ApiVolumeSize',
+            Description='The size of the root volume (which also holds Docker storage) of each API instance (GiB).',
             Type='Number',
-            Default='0',
-            MinValue='0',
-            MaxValue='1',
-            ConstraintDescription='Must be either 0 or 1.'
+            Default='30',
+            MinValue='30',
+            MaxValue='1024',
+            ConstraintDescription='Must be between 30 and 1024 GiB.'
+        )
+    )
+
+
+def create_api_volume_iops_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiVolumeIops',
+            Description='The provisioned IOPS for each API instance gp3 volume.',
+            Type='Number',
+            Default='3000',
+            MinValue='3000',
+            MaxValue='16000',
+            ConstraintDescription='Must be between 3000 and 16000.'
+        )
+    )
+
+
+def create_api_volume_throughput_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiVolumeThroughput',
+            Description='The provisioned throughput (MiB/s) for each API instance gp3 volume.',
+            Type='Number',
+            Default='125',
+            MinValue='125',
+            MaxValue='1000',
+            ConstraintDescription='Must be between 125 and 1000 MiB/s.'
         )
     )
 
 
-def create_queue_worker_task_count_parameter(template):
+def create_api_task_count_parameter(template):
     return template.add_parameter(
         Parameter(
-            'QueueWorkerTaskCount',
-            Description='The number of queue worker containers to run.',
+            'ApiTaskCount',
+            Description='The number of API containers to run.',
             Type='Number',
             Default='0',
             MinValue='0',
@@ -208,30 +620,987 @@ def create_queue_worker_task_count_parameter(template):
     )
 
 
-def create_elasticsearch_instance_class_parameter(template):
+def create_api_task_min_count_parameter(template):
     return template.add_parameter(
         Parameter(
-            'ElasticsearchInstanceClass',
-            Description='The Elasticseach instance class.',
+            'ApiTaskMinCount',
+            Description='The minimum number of API containers to scale in to (leave blank to use the performance profile).',
             Type='String',
-            Default='t2.small.elasticsearch',
-            AllowedValues=[
-                't2.small.elasticsearch',
-                't2.medium.elasticsearch'
-            ],
-            ConstraintDescription='Must select a valid Elasticsearch instance type.'
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
         )
     )
 
 
-def create_elasticsearch_instance_count_parameter(template):
+def create_api_task_max_count_parameter(template):
     return template.add_parameter(
         Parameter(
-            'ElasticsearchInstanceCount',
-            Description='The number of Elasticsearch nodes to run.',
+            'ApiTaskMaxCount',
+            Description='The maximum number of API containers to scale out to (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_api_task_target_request_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskTargetRequestCount',
+            Description='The number of load balancer requests per minute each API container should handle before scaling.',
             Type='Number',
-            Default='1',
+            Default='1000',
             MinValue='1',
             ConstraintDescription='Must be 1 or more.'
         )
     )
+
+
+def create_api_task_target_cpu_utilisation_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskTargetCpuUtilisation',
+            Description='The average CPU utilisation (%) to keep the API containers at.',
+            Type='Number',
+            Default='70',
+            MinValue='1',
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
+        )
+    )
+
+
+def create_api_task_target_memory_utilisation_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskTargetMemoryUtilisation',
+            Description='The average memory utilisation (%) to keep the API containers at.',
+            Type='Number',
+            Default='80',
+            MinValue='1',
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
+        )
+    )
+
+
+def create_scheduler_task_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerTaskCount',
+            Description='The number of scheduler containers to run.',
+            Type='Number',
+            Default='0',
+            MinValue='0',
+            MaxValue='1',
+            ConstraintDescription='Must be either 0 or 1.'
+        )
+    )
+
+
+def create_scheduler_mode_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerMode',
+            Description='Whether to run the scheduler as a long-running service or as EventBridge scheduled tasks.',
+            Type='String',
+            Default='service',
+            AllowedValues=['service', 'eventbridge'],
+            ConstraintDescription='Must be either service or eventbridge.'
+        )
+    )
+
+
+def create_scheduler_schedule_expression_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerScheduleExpression',
+            Description='The EventBridge schedule expression to run the scheduler task at (eventbridge mode only).',
+            Type='String',
+            Default='rate(1 minute)',
+            MinLength='1',
+            ConstraintDescription='Must be a valid schedule expression.'
+        )
+    )
+
+
+def create_queue_worker_task_count_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerTaskCount'.format(queue.title()),
+            Description='The number of {} queue worker containers to run.'.format(queue),
+            Type='Number',
+            Default='0',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_queue_worker_task_min_count_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerTaskMinCount'.format(queue.title()),
+            Description='The minimum number of {} queue worker containers to scale in to '
+                        '(leave blank to use the performance profile).'.format(queue),
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_queue_worker_task_max_count_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerTaskMaxCount'.format(queue.title()),
+            Description='The maximum number of {} queue worker containers to scale out to '
+                        '(leave blank to use the performance profile).'.format(queue),
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_queue_worker_memory_reservation_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerMemoryReservation'.format(queue.title()),
+            Description='The memory (MiB) to reserve for each {} queue worker container.'.format(queue),
+            Type='Number',
+            Default='256',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_queue_worker_sleep_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerSleep'.format(queue.title()),
+            Description='The number of seconds the {} queue worker sleeps when no job is available.'.format(queue),
+            Type='Number',
+            Default='3',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_queue_worker_delay_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerDelay'.format(queue.title()),
+            Description='The number of seconds a failed {} queue job waits before it is retried.'.format(queue),
+            Type='Number',
+            Default='30',
+            MinValue='0',
+            MaxValue='43200',
+            ConstraintDescription='Must be between 0 and 43200 seconds.'
+        )
+    )
+
+
+def create_queue_worker_timeout_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerTimeout'.format(queue.title()),
+            Description='The number of seconds a {} queue job can run before the worker is killed.'.format(queue),
+            Type='Number',
+            Default='60',
+            AllowedValues=['30', '60', '90', '120', '180', '300', '600', '900', '1800', '3600'],
+            ConstraintDescription='Must select a valid timeout.'
+        )
+    )
+
+
+def create_queue_receive_wait_time_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueReceiveWaitTime'.format(queue.title()),
+            Description='The number of seconds a receive on the {} queue long polls for messages.'.format(queue),
+            Type='Number',
+            Default='20',
+            MinValue='0',
+            MaxValue='20',
+            ConstraintDescription='Must be between 0 and 20 seconds.'
+        )
+    )
+
+
+def create_queue_visibility_timeout_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueVisibilityTimeout'.format(queue.title()),
+            Description='The seconds a received {} message stays hidden (must be above the worker '
+                        'timeout).'.format(queue),
+            Type='Number',
+            Default='90',
+            AllowedValues=['30', '60', '90', '120', '180', '300', '600', '900', '1200', '1800', '3600', '7200',
+                           '43200'],
+            ConstraintDescription='Must select a valid visibility timeout.'
+        )
+    )
+
+
+def create_queue_message_retention_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueMessageRetention'.format(queue.title()),
+            Description='The number of seconds the {} queue keeps a message before deleting it.'.format(queue),
+            Type='Number',
+            Default='345600',
+            MinValue='60',
+            MaxValue='1209600',
+            ConstraintDescription='Must be between 60 and 1209600 seconds.'
+        )
+    )
+
+
+def create_queue_max_receive_count_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueMaxReceiveCount'.format(queue.title()),
+            Description='The number of {} receives before a message moves to the dead-letter queue.'.format(queue),
+            Type='Number',
+            Default='3',
+            MinValue='1',
+            MaxValue='1000',
+            ConstraintDescription='Must be between 1 and 1000.'
+        )
+    )
+
+
+def create_queue_worker_memory_limit_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerMemoryLimit'.format(queue.title()),
+            Description='The memory (MB) the {} queue worker can use before it is restarted.'.format(queue),
+            Type='Number',
+            Default='128',
+            MinValue='32',
+            ConstraintDescription='Must be 32 MB or more.'
+        )
+    )
+
+
+def create_queue_worker_cpu_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerCpu'.format(queue.title()),
+            Description='The CPU units to reserve for each {} queue worker container.'.format(queue),
+            Type='Number',
+            Default='128',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_queue_worker_memory_hard_limit_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerMemoryHardLimit'.format(queue.title()),
+            Description='The memory (MiB) each {} queue worker container is killed at '
+                        '(must not be below the reservation).'.format(queue),
+            Type='Number',
+            Default='512',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_queue_worker_nofile_limit_parameter(template, queue):
+    return template.add_parameter(
+        Parameter(
+            '{}QueueWorkerNofileLimit'.format(queue.title()),
+            Description='The open file descriptor limit for each {} queue worker container.'.format(queue),
+            Type='Number',
+            Default='4096',
+            MinValue='1024',
+            ConstraintDescription='Must be 1024 or more.'
+        )
+    )
+
+
+def create_queue_worker_target_backlog_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'QueueWorkerTargetBacklog',
+            Description='The number of visible messages per running queue worker to target before more are added.',
+            Type='Number',
+            Default='100',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_queue_worker_max_message_age_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'QueueWorkerMaxMessageAge',
+            Description='The age (seconds) of the oldest message on a queue before more queue workers are added.',
+            Type='Number',
+            Default='300',
+            MinValue='60',
+            ConstraintDescription='Must be 60 seconds or more.'
+        )
+    )
+
+
+def create_elasticsearch_instance_class_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchInstanceClass',
+            Description='The Elasticseach instance class (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedValues=[
+                '',
+                't2.small.elasticsearch',
+                't2.medium.elasticsearch',
+                'c5.large.elasticsearch',
+                'c5.xlarge.elasticsearch',
+                'm5.large.elasticsearch',
+                'm5.xlarge.elasticsearch',
+                'r5.large.elasticsearch',
+                'r5.xlarge.elasticsearch'
+            ],
+            ConstraintDescription='Must select a valid Elasticsearch instance type.'
+        )
+    )
+
+
+def create_elasticsearch_volume_type_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchVolumeType',
+            Description='The Elasticsearch EBS volume type (gp3 needs a supported instance class and version).',
+            Type='String',
+            Default='gp2',
+            AllowedValues=['gp2', 'gp3'],
+            ConstraintDescription='Must be either gp2 or gp3.'
+        )
+    )
+
+
+def create_elasticsearch_volume_size_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchVolumeSize',
+            Description='The size of the EBS volume attached to each Elasticsearch node (GiB).',
+            Type='Number',
+            Default='10',
+            MinValue='10',
+            MaxValue='1024',
+            ConstraintDescription='Must be between 10 and 1024 GiB.'
+        )
+    )
+
+
+def create_elasticsearch_volume_iops_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchVolumeIops',
+            Description='The provisioned IOPS for each Elasticsearch gp3 volume.',
+            Type='Number',
+            Default='3000',
+            MinValue='3000',
+            MaxValue='16000',
+            ConstraintDescription='Must be between 3000 and 16000.'
+        )
+    )
+
+
+def create_elasticsearch_instance_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchInstanceCount',
+            Description='The number of Elasticsearch nodes to run, a multiple of the availability zone count (leave blank to use the performance profile).',
+            Type='String',
+            Default='',
+            AllowedPattern='[0-9]*',
+            ConstraintDescription='Must be blank or a whole number.'
+        )
+    )
+
+
+def create_elasticsearch_availability_zone_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchAvailabilityZoneCount',
+            Description='The number of availability zones to spread the Elasticsearch nodes across.',
+            Type='Number',
+            Default='2',
+            AllowedValues=['1', '2', '3'],
+            ConstraintDescription='Must be 1, 2 or 3.'
+        )
+    )
+
+
+def create_elasticsearch_dedicated_master_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchDedicatedMasterCount',
+            Description='The number of dedicated Elasticsearch master nodes to run (0 to disable).',
+            Type='Number',
+            Default='0',
+            AllowedValues=['0', '3', '5'],
+            ConstraintDescription='Must be 0, 3 or 5.'
+        )
+    )
+
+
+def create_elasticsearch_dedicated_master_class_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchDedicatedMasterClass',
+            Description='The dedicated Elasticsearch master instance class.',
+            Type='String',
+            Default='m5.large.elasticsearch',
+            AllowedValues=[
+                't2.small.elasticsearch',
+                't2.medium.elasticsearch',
+                'c5.large.elasticsearch',
+                'm5.large.elasticsearch',
+                'r5.large.elasticsearch'
+            ],
+            ConstraintDescription='Must select a valid Elasticsearch instance type.'
+        )
+    )
+
+
+def create_performance_profile_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'PerformanceProfile',
+            Description='The profile used to size any capacity parameters left blank.',
+            Type='String',
+            Default='dev',
+            AllowedValues=['dev', 'staging', 'production', 'peak'],
+            ConstraintDescription='Must select a valid performance profile.'
+        )
+    )
+
+
+def create_api_task_cpu_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskCpu',
+            Description='The CPU units to reserve for each API container.',
+            Type='Number',
+            Default='256',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_api_task_memory_reservation_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskMemoryReservation',
+            Description='The memory (MiB) to reserve for each API container.',
+            Type='Number',
+            Default='256',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_api_task_memory_hard_limit_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskMemoryHardLimit',
+            Description='The memory (MiB) each API container is killed at (must not be below the reservation).',
+            Type='Number',
+            Default='768',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_api_task_nofile_limit_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiTaskNofileLimit',
+            Description='The open file descriptor limit for each API container.',
+            Type='Number',
+            Default='65536',
+            MinValue='1024',
+            ConstraintDescription='Must be 1024 or more.'
+        )
+    )
+
+
+def create_api_php_fpm_max_children_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiPhpFpmMaxChildren',
+            Description='The maximum number of PHP-FPM children each API container runs.',
+            Type='Number',
+            Default='5',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_api_opcache_memory_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiOpcacheMemory',
+            Description='The memory (MB) each API container gives OPcache.',
+            Type='Number',
+            Default='128',
+            MinValue='8',
+            ConstraintDescription='Must be 8 MB or more.'
+        )
+    )
+
+
+def create_scheduler_task_cpu_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerTaskCpu',
+            Description='The CPU units to reserve for the scheduler container.',
+            Type='Number',
+            Default='64',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_scheduler_task_memory_reservation_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerTaskMemoryReservation',
+            Description='The memory (MiB) to reserve for the scheduler container.',
+            Type='Number',
+            Default='128',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_scheduler_task_memory_hard_limit_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerTaskMemoryHardLimit',
+            Description='The memory (MiB) the scheduler container is killed at (must not be below the reservation).',
+            Type='Number',
+            Default='256',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_image_worker_task_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ImageWorkerTaskCount',
+            Description='The number of image worker containers to run.',
+            Type='Number',
+            Default='1',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_image_worker_task_cpu_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ImageWorkerTaskCpu',
+            Description='The CPU units to reserve for each image worker container.',
+            Type='Number',
+            Default='128',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_image_worker_task_memory_reservation_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ImageWorkerTaskMemoryReservation',
+            Description='The memory (MiB) to reserve for each image worker container.',
+            Type='Number',
+            Default='256',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_image_worker_task_memory_hard_limit_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ImageWorkerTaskMemoryHardLimit',
+            Description='The memory (MiB) an image worker container is killed at (must not be below the reservation).',
+            Type='Number',
+            Default='512',
+            AllowedValues=['64', '128', '192', '256', '384', '512', '768', '1024', '1536', '2048', '3072', '4096',
+                           '6144', '8192'],
+            ConstraintDescription='Must select a valid memory size.'
+        )
+    )
+
+
+def create_scheduler_task_nofile_limit_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'SchedulerTaskNofileLimit',
+            Description='The open file descriptor limit for the scheduler container.',
+            Type='Number',
+            Default='4096',
+            MinValue='1024',
+            ConstraintDescription='Must be 1024 or more.'
+        )
+    )
+
+
+def create_compute_mode_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ComputeMode',
+            Description='Whether to run Fargate burst services alongside the EC2 base services.',
+            Type='String',
+            Default='ec2',
+            AllowedValues=['ec2', 'ec2-fargate-burst'],
+            ConstraintDescription='Must select a valid compute mode.'
+        )
+    )
+
+
+def create_fargate_burst_task_cpu_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'FargateBurstTaskCpu',
+            Description='The CPU units for each Fargate burst task (must be a valid Fargate pairing with the memory).',
+            Type='String',
+            Default='512',
+            AllowedValues=['256', '512', '1024', '2048', '4096'],
+            ConstraintDescription='Must select a valid Fargate CPU size.'
+        )
+    )
+
+
+def create_fargate_burst_task_memory_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'FargateBurstTaskMemory',
+            Description='The memory (MiB) for each Fargate burst task (must be a valid Fargate pairing with the CPU).',
+            Type='String',
+            Default='1024',
+            AllowedValues=['512', '1024', '2048', '3072', '4096', '8192'],
+            ConstraintDescription='Must select a valid Fargate memory size.'
+        )
+    )
+
+
+def create_fargate_burst_spot_weight_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'FargateBurstSpotWeight',
+            Description='The number of Fargate Spot burst tasks to launch for each on-demand Fargate burst task.',
+            Type='Number',
+            Default='3',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_fargate_burst_traffic_percentage_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'FargateBurstTrafficPercentage',
+            Description='The percentage of API traffic sent to the Fargate burst service.',
+            Type='String',
+            Default='20',
+            AllowedValues=['10', '20', '30', '40', '50'],
+            ConstraintDescription='Must select a valid percentage.'
+        )
+    )
+
+
+def create_api_health_check_path_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiHealthCheckPath',
+            Description='The path the load balancer health checks API containers on.',
+            Type='String',
+            Default='/_php-fpm/ping',
+            AllowedPattern='/.*',
+            ConstraintDescription='Must start with a forward slash.'
+        )
+    )
+
+
+def create_api_health_check_interval_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiHealthCheckInterval',
+            Description='The number of seconds between load balancer health checks of each API container.',
+            Type='Number',
+            Default='10',
+            MinValue='6',
+            MaxValue='300',
+            ConstraintDescription='Must be between 6 and 300.'
+        )
+    )
+
+
+def create_api_healthy_threshold_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiHealthyThresholdCount',
+            Description='The number of passed health checks before an API container receives traffic.',
+            Type='Number',
+            Default='2',
+            MinValue='2',
+            MaxValue='10',
+            ConstraintDescription='Must be between 2 and 10.'
+        )
+    )
+
+
+def create_api_unhealthy_threshold_count_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiUnhealthyThresholdCount',
+            Description='The number of failed health checks before an API container stops receiving traffic.',
+            Type='Number',
+            Default='3',
+            MinValue='2',
+            MaxValue='10',
+            ConstraintDescription='Must be between 2 and 10.'
+        )
+    )
+
+
+def create_api_deregistration_delay_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiDeregistrationDelay',
+            Description='The number of seconds in-flight requests are given to finish before an API container is '
+                        'removed.',
+            Type='Number',
+            Default='30',
+            MinValue='0',
+            MaxValue='3600',
+            ConstraintDescription='Must be between 0 and 3600.'
+        )
+    )
+
+
+def create_api_load_balancing_algorithm_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiLoadBalancingAlgorithm',
+            Description='How the load balancer picks an API container for each request.',
+            Type='String',
+            Default='least_outstanding_requests',
+            AllowedValues=['round_robin', 'least_outstanding_requests'],
+            ConstraintDescription='Must select a valid load balancing algorithm.'
+        )
+    )
+
+
+def create_api_slow_start_duration_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiSlowStartDuration',
+            Description='The number of seconds a new API container is warmed up for, 0 to disable (only applies to '
+                        'round_robin routing).',
+            Type='Number',
+            Default='0',
+            MinValue='0',
+            MaxValue='900',
+            ConstraintDescription='Must be 0, or between 30 and 900.'
+        )
+    )
+
+
+def create_load_balancer_idle_timeout_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'LoadBalancerIdleTimeout',
+            Description='The number of seconds a load balancer connection can be idle before it is closed.',
+            Type='Number',
+            Default='300',
+            MinValue='1',
+            MaxValue='4000',
+            ConstraintDescription='Must be between 1 and 4000.'
+        )
+    )
+
+
+def create_access_logs_retention_days_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'AccessLogsRetentionDays',
+            Description='The number of days load balancer access logs are kept for.',
+            Type='Number',
+            Default='30',
+            MinValue='1',
+            MaxValue='3650',
+            ConstraintDescription='Must be between 1 and 3650.'
+        )
+    )
+
+
+def create_api_latency_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ApiLatencyAlarmThreshold',
+            Description='The p99 API response time (seconds) to alarm at.',
+            Type='Number',
+            Default='2',
+            MinValue='0',
+            ConstraintDescription='Must be 0 or more.'
+        )
+    )
+
+
+def create_api_5xx_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'Api5xxAlarmThreshold',
+            Description='The number of API 5xx responses per minute to alarm at.',
+            Type='Number',
+            Default='10',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_database_cpu_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseCpuAlarmThreshold',
+            Description='The database CPU utilisation (%) to alarm at.',
+            Type='Number',
+            Default='80',
+            MinValue='1',
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
+        )
+    )
+
+
+def create_database_free_storage_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseFreeStorageAlarmThreshold',
+            Description='The free database storage (GiB) to alarm below.',
+            Type='Number',
+            Default='2',
+            MinValue='1',
+            ConstraintDescription='Must be 1 GiB or more.'
+        )
+    )
+
+
+def create_database_replica_lag_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'DatabaseReplicaLagAlarmThreshold',
+            Description='The database read replica lag (seconds) to alarm at.',
+            Type='Number',
+            Default='30',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_redis_cpu_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'RedisCpuAlarmThreshold',
+            Description='The Redis engine CPU utilisation (%) to alarm at.',
+            Type='Number',
+            Default='80',
+            MinValue='1',
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
+        )
+    )
+
+
+def create_redis_evictions_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'RedisEvictionsAlarmThreshold',
+            Description='The number of Redis evictions per 5 minutes to alarm at.',
+            Type='Number',
+            Default='100',
+            MinValue='1',
+            ConstraintDescription='Must be 1 or more.'
+        )
+    )
+
+
+def create_elasticsearch_jvm_pressure_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'ElasticsearchJvmPressureAlarmThreshold',
+            Description='The Elasticsearch JVM memory pressure (%) to alarm at.',
+            Type='Number',
+            Default='80',
+            MinValue='1',
+            MaxValue='100',
+            ConstraintDescription='Must be between 1 and 100.'
+        )
+    )
+
+
+def create_queue_message_age_alarm_threshold_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'QueueMessageAgeAlarmThreshold',
+            Description='The age (seconds) of the oldest queued message to alarm at.',
+            Type='Number',
+            Default='900',
+            MinValue='60',
+            ConstraintDescription='Must be 60 or more.'
+        )
+    )
+
+
+def create_tracing_sidecar_parameter(template):
+    return template.add_parameter(
+        Parameter(
+            'TracingSidecar',
+            Description='Whether to run an OpenTelemetry/X-Ray collector sidecar alongside the API and queue workers.',
+            Type='String',
+            Default='disabled',
+            AllowedValues=['enabled', 'disabled'],
+            ConstraintDescription='Must be either enabled or disabled.'
+        )
+    )
@@ -1,4 +1,5 @@
-from troposphere import GetAtt, Ref, Base64, Join, Sub, Select
+from troposphere import GetAtt, Ref, Base64, Join, Sub, Select, If, NoValue, FindInMap
+from troposphere.policies import UpdatePolicy, AutoScalingRollingUpdate
 import troposphere.ec2 as ec2
 import troposphere.rds as rds
 import troposphere.elasticache as elasticache
@@ -11,6 +12,14 @@ import troposphere.logs as logs
 import troposphere.elasticloadbalancingv2 as elb
 import troposphere.autoscaling as autoscaling
 import troposphere.elasticsearch as elasticsearch
+import troposphere.applicationautoscaling as applicationautoscaling
+import troposphere.cloudwatch as cloudwatch
+import troposphere.cloudfront as cloudfront
+import troposphere.glue as glue
+import troposphere.sns as sns
+import troposphere.dynamodb as dynamodb
+import troposphere.events as events
+import json
 
 
 def create_load_balancer_security_group_resource(template):
@@ -92,6 +101,57 @@ def create_redis_security_group_resource(template, api_security_group_resource):
     )
 
 
+def create_vpc_endpoint_security_group_resource(template, has_interface_vpc_endpoints_condition, vpc_parameter,
+                                                api_security_group_resource):
+    return template.add_resource(
+        ec2.SecurityGroup(
+            'VpcEndpointSecurityGroup',
+            Condition=has_interface_vpc_endpoints_condition,
+            GroupDescription='For connecting to the interface VPC endpoints',
+            VpcId=Ref(vpc_parameter),
+            SecurityGroupIngress=[
+                ec2.SecurityGroupRule(
+                    Description='HTTPS access from the API containers',
+                    IpProtocol='tcp',
+                    FromPort='443',
+                    ToPort='443',
+                    SourceSecurityGroupId=GetAtt(api_security_group_resource, 'GroupId')
+                )
+            ]
+        )
+    )
+
+
+def create_s3_vpc_endpoint_resource(template, s3_vpc_endpoint_enabled_condition, vpc_parameter,
+                                    route_tables_parameter):
+    return template.add_resource(
+        ec2.VPCEndpoint(
+            'S3GatewayEndpoint',
+            Condition=s3_vpc_endpoint_enabled_condition,
+            VpcEndpointType='Gateway',
+            ServiceName=Sub('com.amazonaws.${AWS::Region}.s3'),
+            VpcId=Ref(vpc_parameter),
+            RouteTableIds=Ref(route_tables_parameter)
+        )
+    )
+
+
+def create_interface_vpc_endpoint_resource(template, name, service, vpc_endpoint_enabled_condition, vpc_parameter,
+                                           subnets_parameter, vpc_endpoint_security_group_resource):
+    return template.add_resource(
+        ec2.VPCEndpoint(
+            '{}InterfaceEndpoint'.format(name),
+            Condition=vpc_endpoint_enabled_condition,
+            VpcEndpointType='Interface',
+            ServiceName=Sub('com.amazonaws.${{AWS::Region}}.{}'.format(service)),
+            VpcId=Ref(vpc_parameter),
+            SubnetIds=Ref(subnets_parameter),
+            SecurityGroupIds=[GetAtt(vpc_endpoint_security_group_resource, 'GroupId')],
+            PrivateDnsEnabled=True
+        )
+    )
+
+
 def create_database_subnet_group_resource(template, subnets_parameter):
     return template.add_resource(
         rds.DBSubnetGroup(
@@ -102,26 +162,234 @@ def create_database_subnet_group_resource(template, subnets_parameter):
     )
 
 
+def create_database_parameter_group_resource(template, is_mysql_database_condition,
+                                             database_innodb_buffer_pool_percentage_parameter,
+                                             database_max_connections_variable, database_long_query_time_parameter):
+    return template.add_resource(
+        rds.DBParameterGroup(
+            'DatabaseParameterGroup',
+            Condition=is_mysql_database_condition,
+            Description='Parameters for the RDS instance and read replicas',
+            Family='mysql5.7',
+            Parameters={
+                'innodb_buffer_pool_size': Sub(
+                    '{DBInstanceClassMemory*${Percentage}/100}',
+                    Percentage=Ref(database_innodb_buffer_pool_percentage_parameter)
+                ),
+                'max_connections': database_max_connections_variable,
+                'slow_query_log': '1',
+                'long_query_time': Ref(database_long_query_time_parameter),
+                'log_output': 'FILE'
+            }
+        )
+    )
+
+
+def create_database_cluster_parameter_group_resource(template, is_aurora_database_condition,
+                                                     database_long_query_time_parameter):
+    return template.add_resource(
+        rds.DBClusterParameterGroup(
+            'DatabaseClusterParameterGroup',
+            Condition=is_aurora_database_condition,
+            Description='Parameters for the Aurora cluster',
+            Family='aurora-mysql8.0',
+            Parameters={
+                'slow_query_log': '1',
+                'long_query_time': Ref(database_long_query_time_parameter),
+                'log_output': 'FILE'
+            }
+        )
+    )
+
+
+def create_database_cluster_instance_parameter_group_resource(template, is_aurora_database_condition,
+                                                              database_max_connections_variable):
+    return template.add_resource(
+        rds.DBParameterGroup(
+            'DatabaseClusterInstanceParameterGroup',
+            Condition=is_aurora_database_condition,
+            Description='Parameters for the Aurora writer and readers',
+            Family='aurora-mysql8.0',
+            Parameters={
+                'max_connections': database_max_connections_variable
+            }
+        )
+    )
+
+
+def create_database_monitoring_role_resource(template, has_database_enhanced_monitoring_condition):
+    return template.add_resource(
+        iam.Role(
+            'DatabaseMonitoringRole',
+            Condition=has_database_enhanced_monitoring_condition,
+            AssumeRolePolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 'sts:AssumeRole',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 'monitoring.rds.amazonaws.com'
+                        }
+                    }
+                ]
+            },
+            ManagedPolicyArns=['arn:aws:iam::aws:policy/service-role/AmazonRDSEnhancedMonitoringRole']
+        )
+    )
+
+
 def create_database_resource(template, database_name_variable, database_allocated_storage_parameter,
-                          database_class_parameter, database_username_variable, database_password_parameter,
-                          database_security_group_resource, database_subnet_group_resource):
+                          database_class_variable, database_username_variable, database_password_parameter,
+                          database_security_group_resource, database_subnet_group_resource,
+                          is_mysql_database_condition, database_parameter_group_resource,
+                          database_performance_insights_variable, database_monitoring_interval_parameter,
+                          has_database_enhanced_monitoring_condition, database_monitoring_role_resource,
+                          database_max_allocated_storage_parameter, database_iops_parameter,
+                          database_iops_overridden_condition, database_storage_throughput_parameter,
+                          database_storage_throughput_overridden_condition):
     return template.add_resource(
         rds.DBInstance(
             'Database',
+            Condition=is_mysql_database_condition,
             DBName=database_name_variable,
             AllocatedStorage=Ref(database_allocated_storage_parameter),
-            DBInstanceClass=Ref(database_class_parameter),
+            MaxAllocatedStorage=Ref(database_max_allocated_storage_parameter),
+            StorageType='gp3',
+            Iops=If(database_iops_overridden_condition, Ref(database_iops_parameter), NoValue),
+            StorageThroughput=If(database_storage_throughput_overridden_condition,
+                                 Ref(database_storage_throughput_parameter), NoValue),
+            DBInstanceClass=database_class_variable,
             Engine='MySQL',
             EngineVersion='5.7',
             MasterUsername=database_username_variable,
             MasterUserPassword=Ref(database_password_parameter),
             VPCSecurityGroups=[GetAtt(database_security_group_resource, 'GroupId')],
             DBSubnetGroupName=Ref(database_subnet_group_resource),
+            DBParameterGroupName=Ref(database_parameter_group_resource),
+            EnablePerformanceInsights=database_performance_insights_variable,
+            MonitoringInterval=Ref(database_monitoring_interval_parameter),
+            MonitoringRoleArn=If(has_database_enhanced_monitoring_condition,
+                                 GetAtt(database_monitoring_role_resource, 'Arn'), NoValue),
+            EnableCloudwatchLogsExports=['error', 'slowquery'],
+            PubliclyAccessible=False
+        )
+    )
+
+
+def create_database_read_replica_resource(template, number, database_read_replica_condition, database_resource,
+                                         database_read_replica_class_variable, database_security_group_resource,
+                                         database_parameter_group_resource, database_performance_insights_variable,
+                                         database_monitoring_interval_parameter,
+                                         has_database_enhanced_monitoring_condition,
+                                         database_monitoring_role_resource):
+    return template.add_resource(
+        rds.DBInstance(
+            'DatabaseReadReplica{}'.format(number),
+            Condition=database_read_replica_condition,
+            SourceDBInstanceIdentifier=Ref(database_resource),
+            Engine='MySQL',
+            DBInstanceClass=database_read_replica_class_variable,
+            StorageType='gp3',
+            VPCSecurityGroups=[GetAtt(database_security_group_resource, 'GroupId')],
+            DBParameterGroupName=Ref(database_parameter_group_resource),
+            EnablePerformanceInsights=database_performance_insights_variable,
+            MonitoringInterval=Ref(database_monitoring_interval_parameter),
+            MonitoringRoleArn=If(has_database_enhanced_monitoring_condition,
+                                 GetAtt(database_monitoring_role_resource, 'Arn'), NoValue),
+            EnableCloudwatchLogsExports=['error', 'slowquery'],
+            PubliclyAccessible=False
+        )
+    )
+
+
+def create_database_cluster_resource(template, is_aurora_database_condition, database_name_variable,
+                                  database_username_variable, database_password_parameter,
+                                  database_security_group_resource, database_subnet_group_resource,
+                                  database_cluster_parameter_group_resource):
+    return template.add_resource(
+        rds.DBCluster(
+            'DatabaseCluster',
+            Condition=is_aurora_database_condition,
+            DatabaseName=database_name_variable,
+            Engine='aurora-mysql',
+            EngineVersion='8.0.mysql_aurora.3.10.3',
+            MasterUsername=database_username_variable,
+            MasterUserPassword=Ref(database_password_parameter),
+            VpcSecurityGroupIds=[GetAtt(database_security_group_resource, 'GroupId')],
+            DBSubnetGroupName=Ref(database_subnet_group_resource),
+            DBClusterParameterGroupName=Ref(database_cluster_parameter_group_resource),
+            EnableCloudwatchLogsExports=['error', 'slowquery']
+        )
+    )
+
+
+def create_database_cluster_writer_resource(template, is_aurora_database_condition, database_cluster_resource,
+                                         database_cluster_instance_class_variable, database_subnet_group_resource,
+                                         database_cluster_instance_parameter_group_resource,
+                                         database_performance_insights_variable, database_monitoring_interval_parameter,
+                                         has_database_enhanced_monitoring_condition,
+                                         database_monitoring_role_resource):
+    return template.add_resource(
+        rds.DBInstance(
+            'DatabaseClusterWriter',
+            Condition=is_aurora_database_condition,
+            DBClusterIdentifier=Ref(database_cluster_resource),
+            DBInstanceClass=database_cluster_instance_class_variable,
+            DBSubnetGroupName=Ref(database_subnet_group_resource),
+            DBParameterGroupName=Ref(database_cluster_instance_parameter_group_resource),
+            EnablePerformanceInsights=database_performance_insights_variable,
+            MonitoringInterval=Ref(database_monitoring_interval_parameter),
+            MonitoringRoleArn=If(has_database_enhanced_monitoring_condition,
+                                 GetAtt(database_monitoring_role_resource, 'Arn'), NoValue),
+            Engine='aurora-mysql',
             PubliclyAccessible=False
         )
     )
 
 
+def create_database_cluster_scalable_target_resource(template, is_aurora_database_condition, database_cluster_resource,
+                                                  database_cluster_writer_resource,
+                                                  database_cluster_reader_min_count_parameter,
+                                                  database_cluster_reader_max_count_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalableTarget(
+            'DatabaseClusterScalableTarget',
+            Condition=is_aurora_database_condition,
+            ServiceNamespace='rds',
+            ScalableDimension='rds:cluster:ReadReplicaCount',
+            ResourceId=Join(':', ['cluster', Ref(database_cluster_resource)]),
+            MinCapacity=Ref(database_cluster_reader_min_count_parameter),
+            MaxCapacity=Ref(database_cluster_reader_max_count_parameter),
+            RoleARN=Sub('arn:aws:iam::${AWS::AccountId}:role/aws-service-role/rds.application-autoscaling.amazonaws.com/AWSServiceRoleForApplicationAutoScaling_RDSCluster'),
+            DependsOn=[database_cluster_writer_resource]
+        )
+    )
+
+
+def create_database_cluster_reader_scaling_policy_resource(template, is_aurora_database_condition,
+                                                        database_cluster_scalable_target_resource,
+                                                        database_cluster_reader_scaling_metric_parameter,
+                                                        database_cluster_reader_target_value_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            'DatabaseClusterReaderScalingPolicy',
+            Condition=is_aurora_database_condition,
+            PolicyName='database-cluster-readers',
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(database_cluster_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                PredefinedMetricSpecification=applicationautoscaling.PredefinedMetricSpecification(
+                    PredefinedMetricType=Ref(database_cluster_reader_scaling_metric_parameter)
+                ),
+                TargetValue=Ref(database_cluster_reader_target_value_parameter),
+                ScaleOutCooldown=300,
+                ScaleInCooldown=600
+            )
+        )
+    )
+
+
 def create_redis_subnet_group_resource(template, subnets_parameter):
     return template.add_resource(
         elasticache.SubnetGroup(
@@ -132,59 +400,189 @@ def create_redis_subnet_group_resource(template, subnets_parameter):
     )
 
 
-def create_redis_resource(template, redis_node_class_parameter, redis_nodes_count_parameter, redis_security_group_resource,
-                       redis_subnet_group_resource):
+def create_redis_resource(template, redis_node_class_variable, redis_shards_count_variable,
+                       redis_replicas_per_shard_variable, redis_security_group_resource, redis_subnet_group_resource):
     return template.add_resource(
-        elasticache.CacheCluster(
-            'Redis',
+        elasticache.ReplicationGroup(
+            'RedisReplicationGroup',
+            ReplicationGroupDescription='Redis cluster for the API cache and rate limiting',
             Engine='redis',
-            EngineVersion='4.0',
-            CacheNodeType=Ref(redis_node_class_parameter),
-            NumCacheNodes=Ref(redis_nodes_count_parameter),
-            VpcSecurityGroupIds=[GetAtt(redis_security_group_resource, 'GroupId')],
+            EngineVersion='5.0.6',
+            CacheParameterGroupName='default.redis5.0.cluster.on',
+            CacheNodeType=redis_node_class_variable,
+            NumNodeGroups=redis_shards_count_variable,
+            ReplicasPerNodeGroup=redis_replicas_per_shard_variable,
+            AutomaticFailoverEnabled=True,
+            SecurityGroupIds=[GetAtt(redis_security_group_resource, 'GroupId')],
             CacheSubnetGroupName=Ref(redis_subnet_group_resource)
         )
     )
 
 
-def create_default_queue_resource(template, default_queue_name_variable):
+def create_dead_letter_queue_resource(template, queue, dead_letter_queue_name_variable):
+    return template.add_resource(
+        sqs.Queue(
+            '{}DeadLetterQueue'.format(queue.title()),
+            QueueName=dead_letter_queue_name_variable,
+            MessageRetentionPeriod=1209600
+        )
+    )
+
+
+def create_default_queue_resource(template, default_queue_name_variable, default_queue_receive_wait_time_parameter,
+                                  default_queue_visibility_timeout_parameter, default_queue_message_retention_parameter,
+                                  default_queue_max_receive_count_parameter, default_dead_letter_queue_resource):
     return template.add_resource(
         sqs.Queue(
             'DefaultQueue',
-            QueueName=default_queue_name_variable
+            QueueName=default_queue_name_variable,
+            ReceiveMessageWaitTimeSeconds=Ref(default_queue_receive_wait_time_parameter),
+            VisibilityTimeout=Ref(default_queue_visibility_timeout_parameter),
+            MessageRetentionPeriod=Ref(default_queue_message_retention_parameter),
+            RedrivePolicy=sqs.RedrivePolicy(
+                deadLetterTargetArn=GetAtt(default_dead_letter_queue_resource, 'Arn'),
+                maxReceiveCount=Ref(default_queue_max_receive_count_parameter)
+            )
         )
     )
 
 
-def create_notifications_queue_resource(template, notifications_queue_name_variable):
+def create_notifications_queue_resource(template, notifications_queue_name_variable,
+                                        notifications_queue_receive_wait_time_parameter,
+                                        notifications_queue_visibility_timeout_parameter,
+                                        notifications_queue_message_retention_parameter,
+                                        notifications_queue_max_receive_count_parameter,
+                                        notifications_dead_letter_queue_resource):
     return template.add_resource(
         sqs.Queue(
             'NotificationsQueue',
-            QueueName=notifications_queue_name_variable
+            QueueName=notifications_queue_name_variable,
+            ReceiveMessageWaitTimeSeconds=Ref(notifications_queue_receive_wait_time_parameter),
+            VisibilityTimeout=Ref(notifications_queue_visibility_timeout_parameter),
+            MessageRetentionPeriod=Ref(notifications_queue_message_retention_parameter),
+            RedrivePolicy=sqs.RedrivePolicy(
+                deadLetterTargetArn=GetAtt(notifications_dead_letter_queue_resource, 'Arn'),
+                maxReceiveCount=Ref(notifications_queue_max_receive_count_parameter)
+            )
         )
     )
 
 
-def create_search_queue_resource(template, search_queue_name_variable):
+def create_search_queue_resource(template, search_queue_name_variable, search_queue_receive_wait_time_parameter,
+                                 search_queue_visibility_timeout_parameter, search_queue_message_retention_parameter,
+                                 search_queue_max_receive_count_parameter, search_dead_letter_queue_resource):
     return template.add_resource(
         sqs.Queue(
             'SearchQueue',
-            QueueName=search_queue_name_variable
+            QueueName=search_queue_name_variable,
+            ReceiveMessageWaitTimeSeconds=Ref(search_queue_receive_wait_time_parameter),
+            VisibilityTimeout=Ref(search_queue_visibility_timeout_parameter),
+            MessageRetentionPeriod=Ref(search_queue_message_retention_parameter),
+            RedrivePolicy=sqs.RedrivePolicy(
+                deadLetterTargetArn=GetAtt(search_dead_letter_queue_resource, 'Arn'),
+                maxReceiveCount=Ref(search_queue_max_receive_count_parameter)
+            )
+        )
+    )
+
+
+def create_images_queue_resource(template, images_queue_name_variable, images_queue_receive_wait_time_parameter,
+                                 images_queue_visibility_timeout_parameter, images_queue_message_retention_parameter,
+                                 images_queue_max_receive_count_parameter, images_dead_letter_queue_resource):
+    return template.add_resource(
+        sqs.Queue(
+            'ImagesQueue',
+            QueueName=images_queue_name_variable,
+            ReceiveMessageWaitTimeSeconds=Ref(images_queue_receive_wait_time_parameter),
+            VisibilityTimeout=Ref(images_queue_visibility_timeout_parameter),
+            MessageRetentionPeriod=Ref(images_queue_message_retention_parameter),
+            RedrivePolicy=sqs.RedrivePolicy(
+                deadLetterTargetArn=GetAtt(images_dead_letter_queue_resource, 'Arn'),
+                maxReceiveCount=Ref(images_queue_max_receive_count_parameter)
+            )
+        )
+    )
+
+
+def create_images_queue_policy_resource(template, images_queue_resource, uploads_bucket_name_variable):
+    return template.add_resource(
+        sqs.QueuePolicy(
+            'ImagesQueuePolicy',
+            Queues=[Ref(images_queue_resource)],
+            PolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 'sqs:SendMessage',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 's3.amazonaws.com'
+                        },
+                        'Resource': GetAtt(images_queue_resource, 'Arn'),
+                        'Condition': {
+                            'ArnEquals': {
+                                'aws:SourceArn': Join('', ['arn:aws:s3:::', uploads_bucket_name_variable])
+                            },
+                            'StringEquals': {
+                                'aws:SourceAccount': Ref('AWS::AccountId')
+                            }
+                        }
+                    }
+                ]
+            }
         )
     )
 
 
-def create_uploads_bucket_resource(template, uploads_bucket_name_variable):
+def create_uploads_bucket_resource(template, uploads_bucket_name_variable, images_queue_resource,
+                                   images_queue_policy_resource):
     return template.add_resource(
         s3.Bucket(
             'UploadsBucket',
             BucketName=uploads_bucket_name_variable,
-            AccessControl='Private'
+            AccessControl='Private',
+            NotificationConfiguration=s3.NotificationConfiguration(
+                QueueConfigurations=[s3.QueueConfigurations(
+                    Event='s3:ObjectCreated:*',
+                    Queue=GetAtt(images_queue_resource, 'Arn'),
+                    Filter=s3.Filter(
+                        S3Key=s3.S3Key(
+                            Rules=[s3.Rules(
+                                Name='prefix',
+                                Value='files/'
+                            )]
+                        )
+                    )
+                )]
+            ),
+            DependsOn=[images_queue_policy_resource]
         )
     )
 
 
 
+def create_cache_table_resource(template, cache_table_name_variable):
+    return template.add_resource(
+        dynamodb.Table(
+            'CacheTable',
+            TableName=cache_table_name_variable,
+            BillingMode='PAY_PER_REQUEST',
+            AttributeDefinitions=[dynamodb.AttributeDefinition(
+                AttributeName='key',
+                AttributeType='S'
+            )],
+            KeySchema=[dynamodb.KeySchema(
+                AttributeName='key',
+                KeyType='HASH'
+            )],
+            TimeToLiveSpecification=dynamodb.TimeToLiveSpecification(
+                AttributeName='expires_at',
+                Enabled=True
+            )
+        )
+    )
+
+
 def create_ecs_cluster_role_resource(template):
     return template.add_resource(
         iam.Role(
@@ -218,20 +616,27 @@ def create_ec2_instance_profile_resource(template, ecs_cluster_role_resource):
 def create_ecs_cluster_resource(template):
     return template.add_resource(
         ecs.Cluster(
-            'ApiCluster'
+            'ApiCluster',
+            ClusterSettings=[ecs.ClusterSetting(
+                Name='containerInsights',
+                Value='enabled'
+            )]
         )
     )
 
 
-def create_launch_template_resource(template, api_launch_template_name_variable, api_instance_class_parameter,
-                                 ec2_instance_profile_resource, api_security_group_resource, ecs_cluster_resource):
+def create_launch_template_resource(template, api_launch_template_name_variable, api_instance_class_variable,
+                                 ec2_instance_profile_resource, api_security_group_resource, ecs_cluster_resource,
+                                 api_volume_size_parameter, api_volume_iops_parameter,
+                                 api_volume_throughput_parameter, api_image_id_parameter,
+                                 api_image_pull_behavior_parameter):
     return template.add_resource(
         ec2.LaunchTemplate(
             'LaunchTemplate',
             LaunchTemplateName=api_launch_template_name_variable,
             LaunchTemplateData=ec2.LaunchTemplateData(
-                ImageId='ami-0ae254c8a2d3346a7',
-                InstanceType=Ref(api_instance_class_parameter),
+                ImageId=Ref(api_image_id_parameter),
+                InstanceType=api_instance_class_variable,
                 IamInstanceProfile=ec2.IamInstanceProfile(
                     Arn=GetAtt(ec2_instance_profile_resource, 'Arn')
                 ),
@@ -239,12 +644,14 @@ def create_launch_template_resource(template, api_launch_template_name_variable,
                 Monitoring=ec2.Monitoring(Enabled=True),
                 SecurityGroups=[Ref(api_security_group_resource)],
                 BlockDeviceMappings=[
-                    ec2.BlockDeviceMapping(
-                        DeviceName='/dev/xvdcz',
+                    ec2.LaunchTemplateBlockDeviceMapping(
+                        DeviceName='/dev/xvda',
                         Ebs=ec2.EBSBlockDevice(
                             DeleteOnTermination=True,
-                            VolumeSize=22,
-                            VolumeType='gp2'
+                            VolumeSize=Ref(api_volume_size_parameter),
+                            VolumeType='gp3',
+                            Iops=Ref(api_volume_iops_parameter),
+                            Throughput=Ref(api_volume_throughput_parameter)
                         )
                     )
                 ],
@@ -253,7 +660,17 @@ def create_launch_template_resource(template, api_launch_template_name_variable,
                         '#!/bin/bash\n',
                         'echo ECS_CLUSTER=',
                         Ref(ecs_cluster_resource),
-                        ' >> /etc/ecs/ecs.config;echo ECS_BACKEND_HOST= >> /etc/ecs/ecs.config;'
+                        ' >> /etc/ecs/ecs.config;echo ECS_BACKEND_HOST= >> /etc/ecs/ecs.config;\n',
+                        'echo ECS_IMAGE_PULL_BEHAVIOR=',
+                        Ref(api_image_pull_behavior_parameter),
+                        ' >> /etc/ecs/ecs.config\n',
+                        'echo ECS_WARM_POOLS_CHECK=true >> /etc/ecs/ecs.config\n',
+                        'echo ECS_ENGINE_TASK_CLEANUP_WAIT_DURATION=10m >> /etc/ecs/ecs.config\n',
+                        'echo ECS_IMAGE_CLEANUP_INTERVAL=30m >> /etc/ecs/ecs.config\n',
+                        'echo ECS_IMAGE_MINIMUM_CLEANUP_AGE=30m >> /etc/ecs/ecs.config\n',
+                        '[ -f /etc/docker/daemon.json ] || ',
+                        'echo \'{"max-concurrent-downloads": 10}\' > /etc/docker/daemon.json\n',
+                        'systemctl try-restart docker\n'
                     ])
                 )
             )
@@ -303,14 +720,79 @@ def create_scheduler_log_group_resource(template, scheduler_log_group_name_varia
     )
 
 
+def create_ecs_task_role_resource(template, has_tracing_sidecar_condition):
+    return template.add_resource(
+        iam.Role(
+            'ECSTaskRole',
+            Condition=has_tracing_sidecar_condition,
+            AssumeRolePolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 'sts:AssumeRole',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 'ecs-tasks.amazonaws.com'
+                        }
+                    }
+                ]
+            },
+            ManagedPolicyArns=['arn:aws:iam::aws:policy/AWSXRayDaemonWriteAccess'],
+            Policies=[
+                iam.Policy(
+                    PolicyName='ECSTaskRoleTracingPolicy',
+                    PolicyDocument={
+                        'Statement': [
+                            {
+                                'Effect': 'Allow',
+                                'Action': [
+                                    'logs:CreateLogGroup',
+                                    'logs:CreateLogStream',
+                                    'logs:DescribeLogStreams',
+                                    'logs:PutLogEvents'
+                                ],
+                                'Resource': '*'
+                            }
+                        ]
+                    }
+                )
+            ]
+        )
+    )
+
+
+def create_tracing_sidecar_container_definition(log_group_resource, log_stream_prefix):
+    return ecs.ContainerDefinition(
+        Name='otel-collector',
+        Image='public.ecr.aws/aws-observability/aws-otel-collector:v0.40.0',
+        Command=['--config=/etc/ecs/ecs-default-config.yaml'],
+        Cpu=64,
+        MemoryReservation=128,
+        Essential=False,
+        LogConfiguration=ecs.LogConfiguration(
+            LogDriver='awslogs',
+            Options={
+                'awslogs-group': Ref(log_group_resource),
+                'awslogs-region': Ref('AWS::Region'),
+                'awslogs-stream-prefix': log_stream_prefix
+            }
+        )
+    )
+
+
 def create_api_task_definition_resource(template, api_task_definition_family_variable, docker_repository_resource,
-                                     api_log_group_resource):
+                                     api_log_group_resource, api_task_cpu_parameter,
+                                     api_task_memory_reservation_parameter, api_task_memory_hard_limit_parameter,
+                                     api_task_nofile_limit_parameter, api_php_fpm_max_children_parameter,
+                                     api_opcache_memory_parameter,
+                                     has_tracing_sidecar_condition, ecs_task_role_resource):
     return template.add_resource(
         ecs.TaskDefinition(
             'ApiTaskDefinition',
             Family=api_task_definition_family_variable,
             NetworkMode='bridge',
             RequiresCompatibilities=['EC2'],
+            TaskRoleArn=If(has_tracing_sidecar_condition, GetAtt(ecs_task_role_resource, 'Arn'), NoValue),
             ContainerDefinitions=[ecs.ContainerDefinition(
                 Name='api',
                 Image=Join('.', [
@@ -322,12 +804,54 @@ def create_api_task_definition_resource(template, api_task_definition_family_var
                         Ref(docker_repository_resource)
                     ])
                 ]),
-                MemoryReservation='256',
+                Cpu=Ref(api_task_cpu_parameter),
+                MemoryReservation=Ref(api_task_memory_reservation_parameter),
+                Memory=Ref(api_task_memory_hard_limit_parameter),
+                Ulimits=[ecs.Ulimit(
+                    Name='nofile',
+                    SoftLimit=Ref(api_task_nofile_limit_parameter),
+                    HardLimit=Ref(api_task_nofile_limit_parameter)
+                )],
+                Environment=[
+                    ecs.Environment(
+                        Name='PHP_FPM_PM',
+                        Value='static'
+                    ),
+                    ecs.Environment(
+                        Name='PHP_FPM_PM_MAX_CHILDREN',
+                        Value=Ref(api_php_fpm_max_children_parameter)
+                    ),
+                    ecs.Environment(
+                        Name='PHP_FPM_PM_MAX_REQUESTS',
+                        Value='500'
+                    ),
+                    ecs.Environment(
+                        Name='PHP_OPCACHE_MEMORY_CONSUMPTION',
+                        Value=Ref(api_opcache_memory_parameter)
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='AWS_XRAY_DAEMON_ADDRESS',
+                            Value='otel-collector:2000'
+                        ),
+                        NoValue
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='OTEL_EXPORTER_OTLP_ENDPOINT',
+                            Value='http://otel-collector:4317'
+                        ),
+                        NoValue
+                    )
+                ],
                 PortMappings=[ecs.PortMapping(
                     HostPort='0',
                     ContainerPort='80',
                     Protocol='tcp'
                 )],
+                Links=If(has_tracing_sidecar_condition, ['otel-collector'], NoValue),
                 Essential=True,
                 LogConfiguration=ecs.LogConfiguration(
                     LogDriver='awslogs',
@@ -337,21 +861,30 @@ def create_api_task_definition_resource(template, api_task_definition_family_var
                         'awslogs-stream-prefix': 'ecs'
                     }
                 )
+            ), If(
+                has_tracing_sidecar_condition,
+                create_tracing_sidecar_container_definition(api_log_group_resource, 'otel'),
+                NoValue
             )]
         )
     )
 
 
-def create_queue_worker_task_definition_resource(template, queue_worker_task_definition_family_variable,
+def create_queue_worker_task_definition_resource(template, queue, queue_worker_task_definition_family_variable,
                                               docker_repository_resource, queue_worker_log_group_resource,
-                                              default_queue_name_variable, notifications_queue_name_variable,
-                                              search_queue_name_variable):
+                                              queue_worker_memory_reservation_parameter, queue_worker_sleep_parameter,
+                                              queue_worker_delay_parameter, queue_worker_timeout_parameter,
+                                              queue_worker_memory_limit_parameter,
+                                              queue_worker_cpu_parameter, queue_worker_memory_hard_limit_parameter,
+                                              queue_worker_nofile_limit_parameter,
+                                              has_tracing_sidecar_condition, ecs_task_role_resource):
     return template.add_resource(
         ecs.TaskDefinition(
-            'QueueWorkerTaskDefinition',
+            '{}QueueWorkerTaskDefinition'.format(queue.title()),
             Family=queue_worker_task_definition_family_variable,
             NetworkMode='bridge',
             RequiresCompatibilities=['EC2'],
+            TaskRoleArn=If(has_tracing_sidecar_condition, GetAtt(ecs_task_role_resource, 'Arn'), NoValue),
             ContainerDefinitions=[ecs.ContainerDefinition(
                 Name='api',
                 Image=Join('.', [
@@ -363,22 +896,51 @@ def create_queue_worker_task_definition_resource(template, queue_worker_task_def
                         Ref(docker_repository_resource)
                     ])
                 ]),
-                MemoryReservation='256',
+                Cpu=Ref(queue_worker_cpu_parameter),
+                MemoryReservation=Ref(queue_worker_memory_reservation_parameter),
+                Memory=Ref(queue_worker_memory_hard_limit_parameter),
+                Ulimits=[ecs.Ulimit(
+                    Name='nofile',
+                    SoftLimit=Ref(queue_worker_nofile_limit_parameter),
+                    HardLimit=Ref(queue_worker_nofile_limit_parameter)
+                )],
+                Environment=[
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='AWS_XRAY_DAEMON_ADDRESS',
+                            Value='otel-collector:2000'
+                        ),
+                        NoValue
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='OTEL_EXPORTER_OTLP_ENDPOINT',
+                            Value='http://otel-collector:4317'
+                        ),
+                        NoValue
+                    )
+                ],
+                Links=If(has_tracing_sidecar_condition, ['otel-collector'], NoValue),
                 Essential=True,
                 LogConfiguration=ecs.LogConfiguration(
                     LogDriver='awslogs',
                     Options={
                         'awslogs-group': Ref(queue_worker_log_group_resource),
                         'awslogs-region': Ref('AWS::Region'),
-                        'awslogs-stream-prefix': 'ecs'
+                        'awslogs-stream-prefix': queue
                     }
                 ),
                 Command=[
                     'php',
                     'artisan',
                     'queue:work',
-                    '--tries=1',
-                    '--queue=default,notifications,search'
+                    '--queue={}'.format(queue),
+                    Join('=', ['--sleep', Ref(queue_worker_sleep_parameter)]),
+                    Join('=', ['--delay', Ref(queue_worker_delay_parameter)]),
+                    Join('=', ['--timeout', Ref(queue_worker_timeout_parameter)]),
+                    Join('=', ['--memory', Ref(queue_worker_memory_limit_parameter)])
                 ],
                 WorkingDirectory='/var/www/html',
                 HealthCheck=ecs.HealthCheck(
@@ -390,13 +952,20 @@ def create_queue_worker_task_definition_resource(template, queue_worker_task_def
                     Retries=3,
                     Timeout=5
                 )
+            ), If(
+                has_tracing_sidecar_condition,
+                create_tracing_sidecar_container_definition(queue_worker_log_group_resource, '{}-otel'.format(queue)),
+                NoValue
             )]
         )
     )
 
 
 def create_scheduler_task_definition_resource(template, scheduler_task_definition_family_variable,
-                                           docker_repository_name_variable, scheduler_log_group_resource):
+                                           docker_repository_name_variable, scheduler_log_group_resource,
+                                           scheduler_task_cpu_parameter, scheduler_task_memory_reservation_parameter,
+                                           scheduler_task_memory_hard_limit_parameter,
+                                           scheduler_task_nofile_limit_parameter, is_scheduler_eventbridge_condition):
     return template.add_resource(
         ecs.TaskDefinition(
             'SchedulerTaskDefinition',
@@ -414,7 +983,14 @@ def create_scheduler_task_definition_resource(template, scheduler_task_definitio
                         docker_repository_name_variable
                     ])
                 ]),
-                MemoryReservation='256',
+                Cpu=Ref(scheduler_task_cpu_parameter),
+                MemoryReservation=Ref(scheduler_task_memory_reservation_parameter),
+                Memory=Ref(scheduler_task_memory_hard_limit_parameter),
+                Ulimits=[ecs.Ulimit(
+                    Name='nofile',
+                    SoftLimit=Ref(scheduler_task_nofile_limit_parameter),
+                    HardLimit=Ref(scheduler_task_nofile_limit_parameter)
+                )],
                 Essential=True,
                 LogConfiguration=ecs.LogConfiguration(
                     LogDriver='awslogs',
@@ -424,10 +1000,64 @@ def create_scheduler_task_definition_resource(template, scheduler_task_definitio
                         'awslogs-stream-prefix': 'ecs'
                     }
                 ),
+                Command=If(
+                    is_scheduler_eventbridge_condition,
+                    ['php', 'artisan', 'schedule:run'],
+                    ['php', 'artisan', 'hlp:run-scheduler']
+                ),
+                WorkingDirectory='/var/www/html',
+                HealthCheck=ecs.HealthCheck(
+                    Command=[
+                        'CMD-SHELL',
+                        'php -v || exit 1'
+                    ],
+                    Interval=30,
+                    Retries=3,
+                    Timeout=5
+                )
+            )]
+        )
+    )
+
+
+def create_image_worker_task_definition_resource(template, image_worker_task_definition_family_variable,
+                                              docker_repository_resource, queue_worker_log_group_resource,
+                                              image_worker_task_cpu_parameter,
+                                              image_worker_task_memory_reservation_parameter,
+                                              image_worker_task_memory_hard_limit_parameter):
+    return template.add_resource(
+        ecs.TaskDefinition(
+            'ImageWorkerTaskDefinition',
+            Family=image_worker_task_definition_family_variable,
+            NetworkMode='bridge',
+            RequiresCompatibilities=['EC2'],
+            ContainerDefinitions=[ecs.ContainerDefinition(
+                Name='api',
+                Image=Join('.', [
+                    Ref('AWS::AccountId'),
+                    'dkr.ecr',
+                    Ref('AWS::Region'),
+                    Join('/', [
+                        'amazonaws.com',
+                        Ref(docker_repository_resource)
+                    ])
+                ]),
+                Cpu=Ref(image_worker_task_cpu_parameter),
+                MemoryReservation=Ref(image_worker_task_memory_reservation_parameter),
+                Memory=Ref(image_worker_task_memory_hard_limit_parameter),
+                Essential=True,
+                LogConfiguration=ecs.LogConfiguration(
+                    LogDriver='awslogs',
+                    Options={
+                        'awslogs-group': Ref(queue_worker_log_group_resource),
+                        'awslogs-region': Ref('AWS::Region'),
+                        'awslogs-stream-prefix': 'images'
+                    }
+                ),
                 Command=[
                     'php',
                     'artisan',
-                    'hlp:run-scheduler'
+                    'hlp:process-image-uploads'
                 ],
                 WorkingDirectory='/var/www/html',
                 HealthCheck=ecs.HealthCheck(
@@ -444,48 +1074,505 @@ def create_scheduler_task_definition_resource(template, scheduler_task_definitio
     )
 
 
-def create_load_balancer_resource(template, load_balancer_security_group_resource, subnets_parameter):
+def create_ecs_task_execution_role_resource(template, has_fargate_burst_condition):
     return template.add_resource(
-        elb.LoadBalancer(
-            'LoadBalancer',
-            Scheme='internet-facing',
-            SecurityGroups=[GetAtt(load_balancer_security_group_resource, 'GroupId')],
-            Subnets=Ref(subnets_parameter),
+        iam.Role(
+            'ECSTaskExecutionRole',
+            Condition=has_fargate_burst_condition,
+            AssumeRolePolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 'sts:AssumeRole',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 'ecs-tasks.amazonaws.com'
+                        }
+                    }
+                ]
+            },
+            ManagedPolicyArns=['arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy']
         )
     )
 
 
-def create_api_tarcreate_group_resource(template, vpc_parameter, load_balancer_resource):
+def create_api_burst_task_definition_resource(template, has_fargate_burst_condition,
+                                           api_burst_task_definition_family_variable, docker_repository_resource,
+                                           api_log_group_resource, ecs_task_execution_role_resource,
+                                           fargate_burst_task_cpu_parameter, fargate_burst_task_memory_parameter,
+                                           api_task_nofile_limit_parameter, api_php_fpm_max_children_parameter,
+                                           api_opcache_memory_parameter,
+                                           has_tracing_sidecar_condition, ecs_task_role_resource):
     return template.add_resource(
-        elb.TargetGroup(
-            'ApiTargetGroup',
-            HealthCheckIntervalSeconds=30,
-            HealthCheckPath='/',
-            HealthCheckPort='traffic-port',
-            HealthCheckProtocol='HTTP',
-            HealthCheckTimeoutSeconds=5,
-            HealthyThresholdCount=5,
-            UnhealthyThresholdCount=2,
-            Port=80,
-            Protocol='HTTP',
-            TargetType='instance',
-            VpcId=Ref(vpc_parameter),
-            DependsOn=[load_balancer_resource]
+        ecs.TaskDefinition(
+            'ApiBurstTaskDefinition',
+            Condition=has_fargate_burst_condition,
+            Family=api_burst_task_definition_family_variable,
+            NetworkMode='awsvpc',
+            RequiresCompatibilities=['FARGATE'],
+            Cpu=Ref(fargate_burst_task_cpu_parameter),
+            Memory=Ref(fargate_burst_task_memory_parameter),
+            ExecutionRoleArn=GetAtt(ecs_task_execution_role_resource, 'Arn'),
+            TaskRoleArn=If(has_tracing_sidecar_condition, GetAtt(ecs_task_role_resource, 'Arn'), NoValue),
+            ContainerDefinitions=[ecs.ContainerDefinition(
+                Name='api',
+                Image=Join('.', [
+                    Ref('AWS::AccountId'),
+                    'dkr.ecr',
+                    Ref('AWS::Region'),
+                    Join('/', [
+                        'amazonaws.com',
+                        Ref(docker_repository_resource)
+                    ])
+                ]),
+                Ulimits=[ecs.Ulimit(
+                    Name='nofile',
+                    SoftLimit=Ref(api_task_nofile_limit_parameter),
+                    HardLimit=Ref(api_task_nofile_limit_parameter)
+                )],
+                Environment=[
+                    ecs.Environment(
+                        Name='PHP_FPM_PM',
+                        Value='static'
+                    ),
+                    ecs.Environment(
+                        Name='PHP_FPM_PM_MAX_CHILDREN',
+                        Value=Ref(api_php_fpm_max_children_parameter)
+                    ),
+                    ecs.Environment(
+                        Name='PHP_FPM_PM_MAX_REQUESTS',
+                        Value='500'
+                    ),
+                    ecs.Environment(
+                        Name='PHP_OPCACHE_MEMORY_CONSUMPTION',
+                        Value=Ref(api_opcache_memory_parameter)
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='AWS_XRAY_DAEMON_ADDRESS',
+                            Value='127.0.0.1:2000'
+                        ),
+                        NoValue
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='OTEL_EXPORTER_OTLP_ENDPOINT',
+                            Value='http://127.0.0.1:4317'
+                        ),
+                        NoValue
+                    )
+                ],
+                PortMappings=[ecs.PortMapping(
+                    ContainerPort='80',
+                    Protocol='tcp'
+                )],
+                Essential=True,
+                LogConfiguration=ecs.LogConfiguration(
+                    LogDriver='awslogs',
+                    Options={
+                        'awslogs-group': Ref(api_log_group_resource),
+                        'awslogs-region': Ref('AWS::Region'),
+                        'awslogs-stream-prefix': 'burst'
+                    }
+                )
+            ), If(
+                has_tracing_sidecar_condition,
+                create_tracing_sidecar_container_definition(api_log_group_resource, 'burst-otel'),
+                NoValue
+            )]
+        )
+    )
+
+
+def create_queue_worker_burst_task_definition_resource(template, queue, has_fargate_burst_condition,
+                                                    queue_worker_burst_task_definition_family_variable,
+                                                    docker_repository_resource, queue_worker_log_group_resource,
+                                                    ecs_task_execution_role_resource, fargate_burst_task_cpu_parameter,
+                                                    fargate_burst_task_memory_parameter, queue_worker_sleep_parameter,
+                                                    queue_worker_delay_parameter, queue_worker_timeout_parameter,
+                                                    queue_worker_memory_limit_parameter,
+                                                    queue_worker_nofile_limit_parameter,
+                                                    has_tracing_sidecar_condition, ecs_task_role_resource):
+    return template.add_resource(
+        ecs.TaskDefinition(
+            '{}QueueWorkerBurstTaskDefinition'.format(queue.title()),
+            Condition=has_fargate_burst_condition,
+            Family=queue_worker_burst_task_definition_family_variable,
+            NetworkMode='awsvpc',
+            RequiresCompatibilities=['FARGATE'],
+            Cpu=Ref(fargate_burst_task_cpu_parameter),
+            Memory=Ref(fargate_burst_task_memory_parameter),
+            ExecutionRoleArn=GetAtt(ecs_task_execution_role_resource, 'Arn'),
+            TaskRoleArn=If(has_tracing_sidecar_condition, GetAtt(ecs_task_role_resource, 'Arn'), NoValue),
+            ContainerDefinitions=[ecs.ContainerDefinition(
+                Name='api',
+                Image=Join('.', [
+                    Ref('AWS::AccountId'),
+                    'dkr.ecr',
+                    Ref('AWS::Region'),
+                    Join('/', [
+                        'amazonaws.com',
+                        Ref(docker_repository_resource)
+                    ])
+                ]),
+                Ulimits=[ecs.Ulimit(
+                    Name='nofile',
+                    SoftLimit=Ref(queue_worker_nofile_limit_parameter),
+                    HardLimit=Ref(queue_worker_nofile_limit_parameter)
+                )],
+                Environment=[
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='AWS_XRAY_DAEMON_ADDRESS',
+                            Value='127.0.0.1:2000'
+                        ),
+                        NoValue
+                    ),
+                    If(
+                        has_tracing_sidecar_condition,
+                        ecs.Environment(
+                            Name='OTEL_EXPORTER_OTLP_ENDPOINT',
+                            Value='http://127.0.0.1:4317'
+                        ),
+                        NoValue
+                    )
+                ],
+                Essential=True,
+                LogConfiguration=ecs.LogConfiguration(
+                    LogDriver='awslogs',
+                    Options={
+                        'awslogs-group': Ref(queue_worker_log_group_resource),
+                        'awslogs-region': Ref('AWS::Region'),
+                        'awslogs-stream-prefix': '{}-burst'.format(queue)
+                    }
+                ),
+                Command=[
+                    'php',
+                    'artisan',
+                    'queue:work',
+                    '--queue={}'.format(queue),
+                    Join('=', ['--sleep', Ref(queue_worker_sleep_parameter)]),
+                    Join('=', ['--delay', Ref(queue_worker_delay_parameter)]),
+                    Join('=', ['--timeout', Ref(queue_worker_timeout_parameter)]),
+                    Join('=', ['--memory', Ref(queue_worker_memory_limit_parameter)])
+                ],
+                WorkingDirectory='/var/www/html',
+                HealthCheck=ecs.HealthCheck(
+                    Command=[
+                        'CMD-SHELL',
+                        'php -v || exit 1'
+                    ],
+                    Interval=30,
+                    Retries=3,
+                    Timeout=5
+                )
+            ), If(
+                has_tracing_sidecar_condition,
+                create_tracing_sidecar_container_definition(queue_worker_log_group_resource,
+                                                            '{}-burst-otel'.format(queue)),
+                NoValue
+            )]
+        )
+    )
+
+
+def create_access_logs_bucket_resource(template, access_logs_bucket_name_variable,
+                                       access_logs_retention_days_parameter):
+    return template.add_resource(
+        s3.Bucket(
+            'AccessLogsBucket',
+            BucketName=access_logs_bucket_name_variable,
+            LifecycleConfiguration=s3.LifecycleConfiguration(
+                Rules=[s3.LifecycleRule(
+                    Id='expire-access-logs',
+                    Status='Enabled',
+                    ExpirationInDays=Ref(access_logs_retention_days_parameter)
+                )]
+            )
+        )
+    )
+
+
+def create_access_logs_bucket_policy_resource(template, access_logs_bucket_resource, elb_account_ids_mapping):
+    return template.add_resource(
+        s3.BucketPolicy(
+            'AccessLogsBucketPolicy',
+            Bucket=Ref(access_logs_bucket_resource),
+            PolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 's3:PutObject',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'AWS': Join(':', [
+                                'arn:aws:iam:',
+                                FindInMap(elb_account_ids_mapping, Ref('AWS::Region'), 'AccountId'),
+                                'root'
+                            ])
+                        },
+                        'Resource': Join('/', [
+                            GetAtt(access_logs_bucket_resource, 'Arn'),
+                            'api/AWSLogs',
+                            Ref('AWS::AccountId'),
+                            '*'
+                        ])
+                    }
+                ]
+            }
+        )
+    )
+
+
+def create_access_logs_database_resource(template, access_logs_database_name_variable):
+    return template.add_resource(
+        glue.Database(
+            'AccessLogsDatabase',
+            CatalogId=Ref('AWS::AccountId'),
+            DatabaseInput=glue.DatabaseInput(
+                Name=access_logs_database_name_variable,
+                Description='Load balancer access logs'
+            )
+        )
+    )
+
+
+def create_access_logs_table_resource(template, access_logs_database_resource, access_logs_bucket_resource):
+    location = Join('/', [
+        Join('', ['s3://', Ref(access_logs_bucket_resource)]),
+        'api/AWSLogs',
+        Ref('AWS::AccountId'),
+        'elasticloadbalancing',
+        Ref('AWS::Region')
+    ])
+
+    return template.add_resource(
+        glue.Table(
+            'AccessLogsTable',
+            CatalogId=Ref('AWS::AccountId'),
+            DatabaseName=Ref(access_logs_database_resource),
+            TableInput=glue.TableInput(
+                Name='alb_logs',
+                Description='Load balancer access logs, partitioned by day (yyyy/MM/dd)',
+                TableType='EXTERNAL_TABLE',
+                Parameters={
+                    'EXTERNAL': 'TRUE',
+                    'projection.enabled': 'true',
+                    'projection.day.type': 'date',
+                    'projection.day.range': '2020/01/01,NOW',
+                    'projection.day.format': 'yyyy/MM/dd',
+                    'projection.day.interval': '1',
+                    'projection.day.interval.unit': 'DAYS',
+                    'storage.location.template': Join('/', [location, '${day}'])
+                },
+                PartitionKeys=[glue.Column(Name='day', Type='string')],
+                StorageDescriptor=glue.StorageDescriptor(
+                    Columns=[
+                        glue.Column(Name='type', Type='string'),
+                        glue.Column(Name='time', Type='string'),
+                        glue.Column(Name='elb', Type='string'),
+                        glue.Column(Name='client_ip', Type='string'),
+                        glue.Column(Name='client_port', Type='int'),
+                        glue.Column(Name='target_ip', Type='string'),
+                        glue.Column(Name='target_port', Type='int'),
+                        glue.Column(Name='request_processing_time', Type='double'),
+                        glue.Column(Name='target_processing_time', Type='double'),
+                        glue.Column(Name='response_processing_time', Type='double'),
+                        glue.Column(Name='elb_status_code', Type='int'),
+                        glue.Column(Name='target_status_code', Type='string'),
+                        glue.Column(Name='received_bytes', Type='bigint'),
+                        glue.Column(Name='sent_bytes', Type='bigint'),
+                        glue.Column(Name='request_verb', Type='string'),
+                        glue.Column(Name='request_url', Type='string'),
+                        glue.Column(Name='request_proto', Type='string'),
+                        glue.Column(Name='user_agent', Type='string'),
+                        glue.Column(Name='ssl_cipher', Type='string'),
+                        glue.Column(Name='ssl_protocol', Type='string'),
+                        glue.Column(Name='target_group_arn', Type='string'),
+                        glue.Column(Name='trace_id', Type='string'),
+                        glue.Column(Name='domain_name', Type='string'),
+                        glue.Column(Name='chosen_cert_arn', Type='string'),
+                        glue.Column(Name='matched_rule_priority', Type='string'),
+                        glue.Column(Name='request_creation_time', Type='string'),
+                        glue.Column(Name='actions_executed', Type='string'),
+                        glue.Column(Name='redirect_url', Type='string'),
+                        glue.Column(Name='lambda_error_reason', Type='string'),
+                        glue.Column(Name='target_port_list', Type='string'),
+                        glue.Column(Name='target_status_code_list', Type='string'),
+                        glue.Column(Name='classification', Type='string'),
+                        glue.Column(Name='classification_reason', Type='string'),
+                        glue.Column(Name='traceability_id', Type='string')
+                    ],
+                    Location=location,
+                    InputFormat='org.apache.hadoop.mapred.TextInputFormat',
+                    OutputFormat='org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat',
+                    SerdeInfo=glue.SerdeInfo(
+                        SerializationLibrary='org.apache.hadoop.hive.serde2.RegexSerDe',
+                        Parameters={
+                            'serialization.format': '1',
+                            'input.regex': '([^ ]*) ([^ ]*) ([^ ]*) ([^ ]*):([0-9]*) ([^ ]*)[:-]([0-9]*) ([-.0-9]*) '
+                                           '([-.0-9]*) ([-.0-9]*) (|[-0-9]*) (-|[-0-9]*) ([-0-9]*) ([-0-9]*) '
+                                           '"([^ ]*) (.*) (- |[^ ]*)" "([^"]*)" ([A-Z0-9-_]+) ([A-Za-z0-9.-]*) '
+                                           '([^ ]*) "([^"]*)" "([^"]*)" "([^"]*)" ([-.0-9]*) ([^ ]*) "([^"]*)" '
+                                           '"([^"]*)" "([^ ]*)" "([^\\s]+?)" "([^\\s]+)" "([^ ]*)" "([^ ]*)" '
+                                           '?([^ ]*)?'
+                        }
+                    )
+                )
+            )
+        )
+    )
+
+
+def create_load_balancer_resource(template, load_balancer_security_group_resource, subnets_parameter,
+                                  load_balancer_idle_timeout_parameter, access_logs_bucket_resource,
+                                  access_logs_bucket_policy_resource):
+    return template.add_resource(
+        elb.LoadBalancer(
+            'LoadBalancer',
+            Scheme='internet-facing',
+            SecurityGroups=[GetAtt(load_balancer_security_group_resource, 'GroupId')],
+            Subnets=Ref(subnets_parameter),
+            LoadBalancerAttributes=[
+                elb.LoadBalancerAttributes(
+                    Key='idle_timeout.timeout_seconds',
+                    Value=Ref(load_balancer_idle_timeout_parameter)
+                ),
+                elb.LoadBalancerAttributes(
+                    Key='routing.http2.enabled',
+                    Value='true'
+                ),
+                elb.LoadBalancerAttributes(
+                    Key='access_logs.s3.enabled',
+                    Value='true'
+                ),
+                elb.LoadBalancerAttributes(
+                    Key='access_logs.s3.bucket',
+                    Value=Ref(access_logs_bucket_resource)
+                ),
+                elb.LoadBalancerAttributes(
+                    Key='access_logs.s3.prefix',
+                    Value='api'
+                )
+            ],
+            DependsOn=[access_logs_bucket_policy_resource]
+        )
+    )
+
+
+def create_api_tarcreate_group_resource(template, vpc_parameter, load_balancer_resource,
+                                     api_health_check_path_parameter, api_health_check_interval_parameter,
+                                     api_healthy_threshold_count_parameter, api_unhealthy_threshold_count_parameter,
+                                     api_deregistration_delay_parameter,
+                                     api_load_balancing_algorithm_parameter, api_slow_start_duration_parameter,
+                                     is_api_round_robin_condition):
+    return template.add_resource(
+        elb.TargetGroup(
+            'ApiTargetGroup',
+            HealthCheckIntervalSeconds=Ref(api_health_check_interval_parameter),
+            HealthCheckPath=Ref(api_health_check_path_parameter),
+            HealthCheckPort='traffic-port',
+            HealthCheckProtocol='HTTP',
+            HealthCheckTimeoutSeconds=5,
+            HealthyThresholdCount=Ref(api_healthy_threshold_count_parameter),
+            UnhealthyThresholdCount=Ref(api_unhealthy_threshold_count_parameter),
+            Port=80,
+            Protocol='HTTP',
+            TargetGroupAttributes=[
+                elb.TargetGroupAttribute(
+                    Key='deregistration_delay.timeout_seconds',
+                    Value=Ref(api_deregistration_delay_parameter)
+                ),
+                elb.TargetGroupAttribute(
+                    Key='load_balancing.algorithm.type',
+                    Value=Ref(api_load_balancing_algorithm_parameter)
+                ),
+                elb.TargetGroupAttribute(
+                    Key='slow_start.duration_seconds',
+                    Value=If(is_api_round_robin_condition, Ref(api_slow_start_duration_parameter), '0')
+                )
+            ],
+            TargetType='instance',
+            VpcId=Ref(vpc_parameter),
+            DependsOn=[load_balancer_resource]
+        )
+    )
+
+
+def create_api_burst_tarcreate_group_resource(template, has_fargate_burst_condition, vpc_parameter,
+                                           load_balancer_resource, api_health_check_path_parameter,
+                                           api_health_check_interval_parameter, api_healthy_threshold_count_parameter,
+                                           api_unhealthy_threshold_count_parameter, api_deregistration_delay_parameter,
+                                           api_load_balancing_algorithm_parameter, api_slow_start_duration_parameter,
+                                           is_api_round_robin_condition):
+    return template.add_resource(
+        elb.TargetGroup(
+            'ApiBurstTargetGroup',
+            Condition=has_fargate_burst_condition,
+            HealthCheckIntervalSeconds=Ref(api_health_check_interval_parameter),
+            HealthCheckPath=Ref(api_health_check_path_parameter),
+            HealthCheckPort='traffic-port',
+            HealthCheckProtocol='HTTP',
+            HealthCheckTimeoutSeconds=5,
+            HealthyThresholdCount=Ref(api_healthy_threshold_count_parameter),
+            UnhealthyThresholdCount=Ref(api_unhealthy_threshold_count_parameter),
+            Port=80,
+            Protocol='HTTP',
+            TargetGroupAttributes=[
+                elb.TargetGroupAttribute(
+                    Key='deregistration_delay.timeout_seconds',
+                    Value=Ref(api_deregistration_delay_parameter)
+                ),
+                elb.TargetGroupAttribute(
+                    Key='load_balancing.algorithm.type',
+                    Value=Ref(api_load_balancing_algorithm_parameter)
+                ),
+                elb.TargetGroupAttribute(
+                    Key='slow_start.duration_seconds',
+                    Value=If(is_api_round_robin_condition, Ref(api_slow_start_duration_parameter), '0')
+                )
+            ],
+            TargetType='ip',
+            VpcId=Ref(vpc_parameter),
+            DependsOn=[load_balancer_resource]
         )
     )
 
 
 def create_load_balancer_listener_resource(template, load_balancer_resource, api_tarcreate_group_resource,
-                                        certificate_arn_parameter):
+                                        certificate_arn_parameter, has_fargate_burst_condition,
+                                        api_burst_tarcreate_group_resource, ec2_traffic_weight_variable,
+                                        fargate_traffic_weight_variable):
     return template.add_resource(
         elb.Listener(
             'LoadBalancerListener',
             LoadBalancerArn=Ref(load_balancer_resource),
             Port=443,
             Protocol='HTTPS',
-            DefaultActions=[elb.Action(
-                Type='forward',
-                TargetGroupArn=Ref(api_tarcreate_group_resource)
+            DefaultActions=[If(
+                has_fargate_burst_condition,
+                elb.Action(
+                    Type='forward',
+                    ForwardConfig=elb.ForwardConfig(
+                        TargetGroups=[
+                            elb.TargetGroupTuple(
+                                TargetGroupArn=Ref(api_tarcreate_group_resource),
+                                Weight=ec2_traffic_weight_variable
+                            ),
+                            elb.TargetGroupTuple(
+                                TargetGroupArn=Ref(api_burst_tarcreate_group_resource),
+                                Weight=fargate_traffic_weight_variable
+                            )
+                        ]
+                    )
+                ),
+                elb.Action(
+                    Type='forward',
+                    TargetGroupArn=Ref(api_tarcreate_group_resource)
+                )
             )],
             Certificates=[
                 elb.Certificate(
@@ -562,7 +1649,8 @@ def create_ecs_service_role_resource(template):
 
 
 def create_api_service_resource(template, ecs_cluster_resource, api_task_definition_resource, api_task_count_parameter,
-                             api_tarcreate_group_resource, ecs_service_role_resource, load_balancer_listener_resource):
+                             api_tarcreate_group_resource, ecs_service_role_resource, load_balancer_listener_resource,
+                             ecs_capacity_provider_resource, ecs_cluster_capacity_provider_associations_resource):
     return template.add_resource(
         ecs.Service(
             'ApiService',
@@ -574,24 +1662,109 @@ def create_api_service_resource(template, ecs_cluster_resource, api_task_definit
                 MaximumPercent=200
             ),
             DesiredCount=Ref(api_task_count_parameter),
-            LaunchType='EC2',
+            CapacityProviderStrategy=[ecs.CapacityProviderStrategyItem(
+                CapacityProvider=Ref(ecs_capacity_provider_resource),
+                Weight=1
+            )],
             LoadBalancers=[ecs.LoadBalancer(
                 ContainerName='api',
                 ContainerPort=80,
                 TargetGroupArn=Ref(api_tarcreate_group_resource)
             )],
             Role=Ref(ecs_service_role_resource),
-            DependsOn=[load_balancer_listener_resource]
+            DependsOn=[load_balancer_listener_resource, ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_api_scalable_target_resource(template, ecs_cluster_resource, api_service_resource,
+                                        api_task_min_count_variable, api_task_max_count_variable):
+    return template.add_resource(
+        applicationautoscaling.ScalableTarget(
+            'ApiScalableTarget',
+            ServiceNamespace='ecs',
+            ScalableDimension='ecs:service:DesiredCount',
+            ResourceId=Join('/', ['service', Ref(ecs_cluster_resource), GetAtt(api_service_resource, 'Name')]),
+            MinCapacity=api_task_min_count_variable,
+            MaxCapacity=api_task_max_count_variable,
+            RoleARN=Sub('arn:aws:iam::${AWS::AccountId}:role/aws-service-role/ecs.application-autoscaling.amazonaws.com/AWSServiceRoleForApplicationAutoScaling_ECSService')
+        )
+    )
+
+
+def create_api_request_count_scaling_policy_resource(template, api_scalable_target_resource,
+                                                     api_task_target_request_count_parameter, load_balancer_resource,
+                                                     api_tarcreate_group_resource):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            'ApiRequestCountScalingPolicy',
+            PolicyName='api-request-count',
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(api_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                PredefinedMetricSpecification=applicationautoscaling.PredefinedMetricSpecification(
+                    PredefinedMetricType='ALBRequestCountPerTarget',
+                    ResourceLabel=Join('/', [
+                        GetAtt(load_balancer_resource, 'LoadBalancerFullName'),
+                        GetAtt(api_tarcreate_group_resource, 'TargetGroupFullName')
+                    ])
+                ),
+                TargetValue=Ref(api_task_target_request_count_parameter),
+                ScaleOutCooldown=60,
+                ScaleInCooldown=300
+            )
+        )
+    )
+
+
+def create_api_cpu_scaling_policy_resource(template, api_scalable_target_resource,
+                                           api_task_target_cpu_utilisation_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            'ApiCpuScalingPolicy',
+            PolicyName='api-cpu-utilisation',
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(api_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                PredefinedMetricSpecification=applicationautoscaling.PredefinedMetricSpecification(
+                    PredefinedMetricType='ECSServiceAverageCPUUtilization'
+                ),
+                TargetValue=Ref(api_task_target_cpu_utilisation_parameter),
+                ScaleOutCooldown=60,
+                ScaleInCooldown=300
+            )
+        )
+    )
+
+
+def create_api_memory_scaling_policy_resource(template, api_scalable_target_resource,
+                                              api_task_target_memory_utilisation_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            'ApiMemoryScalingPolicy',
+            PolicyName='api-memory-utilisation',
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(api_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                PredefinedMetricSpecification=applicationautoscaling.PredefinedMetricSpecification(
+                    PredefinedMetricType='ECSServiceAverageMemoryUtilization'
+                ),
+                TargetValue=Ref(api_task_target_memory_utilisation_parameter),
+                ScaleOutCooldown=60,
+                ScaleInCooldown=300
+            )
         )
     )
 
 
-def create_queue_worker_service_resource(template, ecs_cluster_resource, queue_worker_task_definition_resource,
-                                      queue_worker_task_count_parameter):
+def create_queue_worker_service_resource(template, queue, queue_worker_service_name_variable, ecs_cluster_resource,
+                                      queue_worker_task_definition_resource, queue_worker_task_count_parameter,
+                                      ecs_capacity_provider_resource,
+                                      ecs_cluster_capacity_provider_associations_resource):
     return template.add_resource(
         ecs.Service(
-            'QueueWorkerService',
-            ServiceName='queue-worker',
+            '{}QueueWorkerService'.format(queue.title()),
+            ServiceName=queue_worker_service_name_variable,
             Cluster=Ref(ecs_cluster_resource),
             TaskDefinition=Ref(queue_worker_task_definition_resource),
             DeploymentConfiguration=ecs.DeploymentConfiguration(
@@ -599,16 +1772,321 @@ def create_queue_worker_service_resource(template, ecs_cluster_resource, queue_w
                 MaximumPercent=100
             ),
             DesiredCount=Ref(queue_worker_task_count_parameter),
-            LaunchType='EC2'
+            CapacityProviderStrategy=[ecs.CapacityProviderStrategyItem(
+                CapacityProvider=Ref(ecs_capacity_provider_resource),
+                Weight=1
+            )],
+            DependsOn=[ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_queue_worker_scalable_target_resource(template, queue, ecs_cluster_resource, queue_worker_service_resource,
+                                                 queue_worker_task_min_count_variable,
+                                                 queue_worker_task_max_count_variable):
+    return template.add_resource(
+        applicationautoscaling.ScalableTarget(
+            '{}QueueWorkerScalableTarget'.format(queue.title()),
+            ServiceNamespace='ecs',
+            ScalableDimension='ecs:service:DesiredCount',
+            ResourceId=Join('/', ['service', Ref(ecs_cluster_resource), GetAtt(queue_worker_service_resource, 'Name')]),
+            MinCapacity=queue_worker_task_min_count_variable,
+            MaxCapacity=queue_worker_task_max_count_variable,
+            RoleARN=Sub('arn:aws:iam::${AWS::AccountId}:role/aws-service-role/ecs.application-autoscaling.amazonaws.com/AWSServiceRoleForApplicationAutoScaling_ECSService')
+        )
+    )
+
+
+def create_queue_backlog_per_task_metric_specification(queue_resource, ecs_cluster_resource,
+                                                      queue_worker_service_resource):
+    # Visible messages divided by the running workers (counting 0 as 1, so an idle service still scales out).
+    return applicationautoscaling.CustomizedMetricSpecification(
+        Metrics=[
+            applicationautoscaling.TargetTrackingMetricDataQuery(
+                Id='visible',
+                MetricStat=applicationautoscaling.TargetTrackingMetricStat(
+                    Metric=applicationautoscaling.TargetTrackingMetric(
+                        Namespace='AWS/SQS',
+                        MetricName='ApproximateNumberOfMessagesVisible',
+                        Dimensions=[applicationautoscaling.TargetTrackingMetricDimension(
+                            Name='QueueName',
+                            Value=GetAtt(queue_resource, 'QueueName')
+                        )]
+                    ),
+                    Stat='Average'
+                ),
+                ReturnData=False
+            ),
+            applicationautoscaling.TargetTrackingMetricDataQuery(
+                Id='running',
+                MetricStat=applicationautoscaling.TargetTrackingMetricStat(
+                    Metric=applicationautoscaling.TargetTrackingMetric(
+                        Namespace='ECS/ContainerInsights',
+                        MetricName='RunningTaskCount',
+                        Dimensions=[
+                            applicationautoscaling.TargetTrackingMetricDimension(
+                                Name='ClusterName',
+                                Value=Ref(ecs_cluster_resource)
+                            ),
+                            applicationautoscaling.TargetTrackingMetricDimension(
+                                Name='ServiceName',
+                                Value=GetAtt(queue_worker_service_resource, 'Name')
+                            )
+                        ]
+                    ),
+                    Stat='Average'
+                ),
+                ReturnData=False
+            ),
+            applicationautoscaling.TargetTrackingMetricDataQuery(
+                Id='backlog_per_task',
+                Label='Visible messages per running task',
+                Expression='visible / IF(running > 0, running, 1)',
+                ReturnData=True
+            )
+        ]
+    )
+
+
+def create_queue_backlog_scaling_policy_resource(template, queue, queue_resource, queue_worker_scalable_target_resource,
+                                                 ecs_cluster_resource, queue_worker_service_resource,
+                                                 queue_worker_target_backlog_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            '{}QueueBacklogScalingPolicy'.format(queue.title()),
+            PolicyName=Join('-', [GetAtt(queue_resource, 'QueueName'), 'backlog']),
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(queue_worker_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                CustomizedMetricSpecification=create_queue_backlog_per_task_metric_specification(
+                    queue_resource, ecs_cluster_resource, queue_worker_service_resource),
+                TargetValue=Ref(queue_worker_target_backlog_parameter),
+                ScaleOutCooldown=60,
+                ScaleInCooldown=300
+            )
+        )
+    )
+
+
+def create_queue_worker_message_age_scaling_policy_resource(template, queue, queue_worker_scalable_target_resource):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            '{}QueueWorkerMessageAgeScalingPolicy'.format(queue.title()),
+            PolicyName=Join('-', ['queue-worker', queue, 'message-age']),
+            PolicyType='StepScaling',
+            ScalingTargetId=Ref(queue_worker_scalable_target_resource),
+            StepScalingPolicyConfiguration=applicationautoscaling.StepScalingPolicyConfiguration(
+                AdjustmentType='ChangeInCapacity',
+                Cooldown=120,
+                MetricAggregationType='Maximum',
+                StepAdjustments=[applicationautoscaling.StepAdjustment(
+                    MetricIntervalLowerBound=0,
+                    ScalingAdjustment=1
+                )]
+            )
+        )
+    )
+
+
+def create_queue_message_age_alarm_resource(template, queue, queue_resource, queue_worker_max_message_age_parameter,
+                                            queue_worker_message_age_scaling_policy_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            '{}QueueMessageAgeAlarm'.format(queue.title()),
+            AlarmDescription='Add queue workers when the oldest message has been waiting too long',
+            Namespace='AWS/SQS',
+            MetricName='ApproximateAgeOfOldestMessage',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='QueueName',
+                Value=GetAtt(queue_resource, 'QueueName')
+            )],
+            Statistic='Maximum',
+            Period=60,
+            EvaluationPeriods=2,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(queue_worker_max_message_age_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(queue_worker_message_age_scaling_policy_resource)]
+        )
+    )
+
+
+def create_api_burst_service_resource(template, has_fargate_burst_condition, ecs_cluster_resource,
+                                   api_burst_task_definition_resource, api_burst_tarcreate_group_resource,
+                                   api_security_group_resource, subnets_parameter, fargate_burst_spot_weight_parameter,
+                                   load_balancer_listener_resource, ecs_cluster_capacity_provider_associations_resource):
+    return template.add_resource(
+        ecs.Service(
+            'ApiBurstService',
+            Condition=has_fargate_burst_condition,
+            ServiceName='api-burst',
+            Cluster=Ref(ecs_cluster_resource),
+            TaskDefinition=Ref(api_burst_task_definition_resource),
+            DeploymentConfiguration=ecs.DeploymentConfiguration(
+                MinimumHealthyPercent=100,
+                MaximumPercent=200
+            ),
+            CapacityProviderStrategy=[
+                ecs.CapacityProviderStrategyItem(
+                    CapacityProvider='FARGATE',
+                    Base=1,
+                    Weight=1
+                ),
+                ecs.CapacityProviderStrategyItem(
+                    CapacityProvider='FARGATE_SPOT',
+                    Weight=Ref(fargate_burst_spot_weight_parameter)
+                )
+            ],
+            NetworkConfiguration=ecs.NetworkConfiguration(
+                AwsvpcConfiguration=ecs.AwsvpcConfiguration(
+                    AssignPublicIp='ENABLED',
+                    SecurityGroups=[GetAtt(api_security_group_resource, 'GroupId')],
+                    Subnets=Ref(subnets_parameter)
+                )
+            ),
+            LoadBalancers=[ecs.LoadBalancer(
+                ContainerName='api',
+                ContainerPort=80,
+                TargetGroupArn=Ref(api_burst_tarcreate_group_resource)
+            )],
+            DependsOn=[load_balancer_listener_resource, ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_api_burst_scalable_target_resource(template, has_fargate_burst_condition, ecs_cluster_resource,
+                                              api_burst_service_resource, api_task_max_count_variable):
+    return template.add_resource(
+        applicationautoscaling.ScalableTarget(
+            'ApiBurstScalableTarget',
+            Condition=has_fargate_burst_condition,
+            ServiceNamespace='ecs',
+            ScalableDimension='ecs:service:DesiredCount',
+            ResourceId=Join('/', ['service', Ref(ecs_cluster_resource), GetAtt(api_burst_service_resource, 'Name')]),
+            MinCapacity=1,
+            MaxCapacity=api_task_max_count_variable,
+            RoleARN=Sub('arn:aws:iam::${AWS::AccountId}:role/aws-service-role/ecs.application-autoscaling.amazonaws.com/AWSServiceRoleForApplicationAutoScaling_ECSService')
+        )
+    )
+
+
+def create_api_burst_request_count_scaling_policy_resource(template, has_fargate_burst_condition,
+                                                           api_burst_scalable_target_resource,
+                                                           api_task_target_request_count_parameter,
+                                                           load_balancer_resource, api_burst_tarcreate_group_resource):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            'ApiBurstRequestCountScalingPolicy',
+            Condition=has_fargate_burst_condition,
+            PolicyName='api-burst-request-count',
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(api_burst_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                PredefinedMetricSpecification=applicationautoscaling.PredefinedMetricSpecification(
+                    PredefinedMetricType='ALBRequestCountPerTarget',
+                    ResourceLabel=Join('/', [
+                        GetAtt(load_balancer_resource, 'LoadBalancerFullName'),
+                        GetAtt(api_burst_tarcreate_group_resource, 'TargetGroupFullName')
+                    ])
+                ),
+                TargetValue=Ref(api_task_target_request_count_parameter),
+                ScaleOutCooldown=30,
+                ScaleInCooldown=300
+            )
+        )
+    )
+
+
+def create_queue_worker_burst_service_resource(template, queue, has_fargate_burst_condition,
+                                            queue_worker_burst_service_name_variable, ecs_cluster_resource,
+                                            queue_worker_burst_task_definition_resource, api_security_group_resource,
+                                            subnets_parameter, fargate_burst_spot_weight_parameter,
+                                            ecs_cluster_capacity_provider_associations_resource):
+    return template.add_resource(
+        ecs.Service(
+            '{}QueueWorkerBurstService'.format(queue.title()),
+            Condition=has_fargate_burst_condition,
+            ServiceName=queue_worker_burst_service_name_variable,
+            Cluster=Ref(ecs_cluster_resource),
+            TaskDefinition=Ref(queue_worker_burst_task_definition_resource),
+            DeploymentConfiguration=ecs.DeploymentConfiguration(
+                MinimumHealthyPercent=0,
+                MaximumPercent=100
+            ),
+            DesiredCount=0,
+            CapacityProviderStrategy=[
+                ecs.CapacityProviderStrategyItem(
+                    CapacityProvider='FARGATE',
+                    Weight=1
+                ),
+                ecs.CapacityProviderStrategyItem(
+                    CapacityProvider='FARGATE_SPOT',
+                    Weight=Ref(fargate_burst_spot_weight_parameter)
+                )
+            ],
+            NetworkConfiguration=ecs.NetworkConfiguration(
+                AwsvpcConfiguration=ecs.AwsvpcConfiguration(
+                    AssignPublicIp='ENABLED',
+                    SecurityGroups=[GetAtt(api_security_group_resource, 'GroupId')],
+                    Subnets=Ref(subnets_parameter)
+                )
+            ),
+            DependsOn=[ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_queue_worker_burst_scalable_target_resource(template, queue, has_fargate_burst_condition,
+                                                       ecs_cluster_resource, queue_worker_burst_service_resource,
+                                                       queue_worker_task_max_count_variable):
+    return template.add_resource(
+        applicationautoscaling.ScalableTarget(
+            '{}QueueWorkerBurstScalableTarget'.format(queue.title()),
+            Condition=has_fargate_burst_condition,
+            ServiceNamespace='ecs',
+            ScalableDimension='ecs:service:DesiredCount',
+            ResourceId=Join('/', [
+                'service',
+                Ref(ecs_cluster_resource),
+                GetAtt(queue_worker_burst_service_resource, 'Name')
+            ]),
+            MinCapacity=0,
+            MaxCapacity=queue_worker_task_max_count_variable,
+            RoleARN=Sub('arn:aws:iam::${AWS::AccountId}:role/aws-service-role/ecs.application-autoscaling.amazonaws.com/AWSServiceRoleForApplicationAutoScaling_ECSService')
+        )
+    )
+
+
+def create_queue_burst_backlog_scaling_policy_resource(template, queue, has_fargate_burst_condition, queue_resource,
+                                                       queue_worker_burst_scalable_target_resource,
+                                                       ecs_cluster_resource, queue_worker_burst_service_resource,
+                                                       queue_worker_target_backlog_parameter):
+    return template.add_resource(
+        applicationautoscaling.ScalingPolicy(
+            '{}QueueBurstBacklogScalingPolicy'.format(queue.title()),
+            Condition=has_fargate_burst_condition,
+            PolicyName=Join('-', [GetAtt(queue_resource, 'QueueName'), 'burst-backlog']),
+            PolicyType='TargetTrackingScaling',
+            ScalingTargetId=Ref(queue_worker_burst_scalable_target_resource),
+            TargetTrackingScalingPolicyConfiguration=applicationautoscaling.TargetTrackingScalingPolicyConfiguration(
+                CustomizedMetricSpecification=create_queue_backlog_per_task_metric_specification(
+                    queue_resource, ecs_cluster_resource, queue_worker_burst_service_resource),
+                TargetValue=Ref(queue_worker_target_backlog_parameter),
+                ScaleOutCooldown=30,
+                ScaleInCooldown=300
+            )
         )
     )
 
 
 def create_scheduler_service_resource(template, ecs_cluster_resource, scheduler_task_definition_resource,
-                                   scheduler_task_count_parameter):
+                                   scheduler_task_count_parameter, ecs_capacity_provider_resource,
+                                   ecs_cluster_capacity_provider_associations_resource,
+                                   is_scheduler_service_condition):
     return template.add_resource(
         ecs.Service(
             'SchedulerService',
+            Condition=is_scheduler_service_condition,
             ServiceName='scheduler',
             Cluster=Ref(ecs_cluster_resource),
             TaskDefinition=Ref(scheduler_task_definition_resource),
@@ -617,29 +2095,188 @@ def create_scheduler_service_resource(template, ecs_cluster_resource, scheduler_
                 MaximumPercent=100
             ),
             DesiredCount=Ref(scheduler_task_count_parameter),
-            LaunchType='EC2'
+            CapacityProviderStrategy=[ecs.CapacityProviderStrategyItem(
+                CapacityProvider=Ref(ecs_capacity_provider_resource),
+                Weight=1
+            )],
+            DependsOn=[ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_scheduler_events_role_resource(template, ecs_cluster_resource, scheduler_task_definition_resource,
+                                          is_scheduler_eventbridge_condition):
+    return template.add_resource(
+        iam.Role(
+            'SchedulerEventsRole',
+            Condition=is_scheduler_eventbridge_condition,
+            AssumeRolePolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 'sts:AssumeRole',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 'events.amazonaws.com'
+                        }
+                    }
+                ]
+            },
+            Policies=[
+                iam.Policy(
+                    PolicyName='SchedulerEventsRunTaskPolicy',
+                    PolicyDocument={
+                        'Statement': [
+                            {
+                                'Effect': 'Allow',
+                                'Action': 'ecs:RunTask',
+                                'Resource': Ref(scheduler_task_definition_resource),
+                                'Condition': {
+                                    'ArnEquals': {
+                                        'ecs:cluster': GetAtt(ecs_cluster_resource, 'Arn')
+                                    }
+                                }
+                            }
+                        ]
+                    }
+                )
+            ]
+        )
+    )
+
+
+def create_scheduler_rule_resource(template, ecs_cluster_resource, scheduler_task_definition_resource,
+                                   scheduler_events_role_resource, scheduler_schedule_expression_parameter,
+                                   ecs_capacity_provider_resource, is_scheduler_eventbridge_condition):
+    return template.add_resource(
+        events.Rule(
+            'SchedulerRule',
+            Condition=is_scheduler_eventbridge_condition,
+            Description='Runs the scheduler as a short-lived ECS task.',
+            ScheduleExpression=Ref(scheduler_schedule_expression_parameter),
+            State='ENABLED',
+            Targets=[events.Target(
+                Id='scheduler',
+                Arn=GetAtt(ecs_cluster_resource, 'Arn'),
+                RoleArn=GetAtt(scheduler_events_role_resource, 'Arn'),
+                EcsParameters=events.EcsParameters(
+                    TaskDefinitionArn=Ref(scheduler_task_definition_resource),
+                    TaskCount=1,
+                    CapacityProviderStrategy=[events.CapacityProviderStrategyItem(
+                        CapacityProvider=Ref(ecs_capacity_provider_resource),
+                        Weight=1
+                    )]
+                )
+            )]
         )
     )
 
 
-def create_autoscaling_group_resource(template, api_instance_count_parameter, launch_template_resource):
+def create_image_worker_service_resource(template, ecs_cluster_resource, image_worker_task_definition_resource,
+                                      image_worker_task_count_parameter, ecs_capacity_provider_resource,
+                                      ecs_cluster_capacity_provider_associations_resource):
+    return template.add_resource(
+        ecs.Service(
+            'ImageWorkerService',
+            ServiceName='image-worker',
+            Cluster=Ref(ecs_cluster_resource),
+            TaskDefinition=Ref(image_worker_task_definition_resource),
+            DeploymentConfiguration=ecs.DeploymentConfiguration(
+                MinimumHealthyPercent=0,
+                MaximumPercent=100
+            ),
+            DesiredCount=Ref(image_worker_task_count_parameter),
+            CapacityProviderStrategy=[ecs.CapacityProviderStrategyItem(
+                CapacityProvider=Ref(ecs_capacity_provider_resource),
+                Weight=1
+            )],
+            DependsOn=[ecs_cluster_capacity_provider_associations_resource]
+        )
+    )
+
+
+def create_autoscaling_group_resource(template, api_instance_min_count_variable, api_instance_max_count_variable,
+                                      api_instance_min_in_service_variable, launch_template_resource):
     return template.add_resource(
         autoscaling.AutoScalingGroup(
             'AutoScalingGroup',
-            DesiredCapacity=Ref(api_instance_count_parameter),
-            MinSize=Ref(api_instance_count_parameter),
-            MaxSize=Ref(api_instance_count_parameter),
+            MinSize=api_instance_min_count_variable,
+            MaxSize=api_instance_max_count_variable,
+            NewInstancesProtectedFromScaleIn=True,
             LaunchTemplate=autoscaling.LaunchTemplateSpecification(
                 LaunchTemplateId=Ref(launch_template_resource),
                 Version=GetAtt(launch_template_resource, 'LatestVersionNumber')
             ),
-            AvailabilityZones=['eu-west-1a', 'eu-west-1b', 'eu-west-1c']
+            AvailabilityZones=['eu-west-1a', 'eu-west-1b', 'eu-west-1c'],
+            UpdatePolicy=UpdatePolicy(
+                AutoScalingRollingUpdate=AutoScalingRollingUpdate(
+                    MinInstancesInService=api_instance_min_in_service_variable,
+                    MaxBatchSize=1,
+                    PauseTime='PT5M',
+                    SuspendProcesses=['AlarmNotification', 'ScheduledActions', 'AZRebalance']
+                )
+            )
+        )
+    )
+
+
+def create_autoscaling_group_warm_pool_resource(template, autoscaling_group_resource,
+                                                api_instance_warm_pool_min_size_parameter,
+                                                api_instance_warm_pool_enabled_condition):
+    return template.add_resource(
+        autoscaling.WarmPool(
+            'AutoScalingGroupWarmPool',
+            Condition=api_instance_warm_pool_enabled_condition,
+            AutoScalingGroupName=Ref(autoscaling_group_resource),
+            MinSize=Ref(api_instance_warm_pool_min_size_parameter),
+            PoolState='Stopped'
+        )
+    )
+
+
+def create_ecs_capacity_provider_resource(template, autoscaling_group_resource,
+                                       api_instance_target_capacity_parameter):
+    return template.add_resource(
+        ecs.CapacityProvider(
+            'ApiCapacityProvider',
+            AutoScalingGroupProvider=ecs.AutoScalingGroupProvider(
+                AutoScalingGroupArn=Ref(autoscaling_group_resource),
+                ManagedScaling=ecs.ManagedScaling(
+                    Status='ENABLED',
+                    TargetCapacity=Ref(api_instance_target_capacity_parameter),
+                    MinimumScalingStepSize=1,
+                    MaximumScalingStepSize=2
+                ),
+                ManagedTerminationProtection='ENABLED',
+                ManagedDraining='ENABLED'
+            )
+        )
+    )
+
+
+def create_ecs_cluster_capacity_provider_associations_resource(template, ecs_cluster_resource,
+                                                             ecs_capacity_provider_resource,
+                                                             has_fargate_burst_condition):
+    return template.add_resource(
+        ecs.ClusterCapacityProviderAssociations(
+            'ApiClusterCapacityProviderAssociations',
+            Cluster=Ref(ecs_cluster_resource),
+            CapacityProviders=If(
+                has_fargate_burst_condition,
+                [Ref(ecs_capacity_provider_resource), 'FARGATE', 'FARGATE_SPOT'],
+                [Ref(ecs_capacity_provider_resource)]
+            ),
+            DefaultCapacityProviderStrategy=[ecs.CapacityProviderStrategy(
+                CapacityProvider=Ref(ecs_capacity_provider_resource),
+                Weight=1
+            )]
         )
     )
 
 
 def create_api_user_resource(template, api_user_name_variable, uploads_bucket_resource, default_queue_resource,
-                          notifications_queue_resource, search_queue_resource):
+                          notifications_queue_resource, search_queue_resource, images_queue_resource,
+                          cache_table_resource):
     return template.add_resource(
         iam.User(
             'ApiUser',
@@ -672,6 +2309,22 @@ def create_api_user_resource(template, api_user_name_variable, uploads_bucket_re
                                 'Action': 'sqs:*',
                                 'Effect': 'Allow',
                                 'Resource': GetAtt(search_queue_resource, 'Arn')
+                            },
+                            {
+                                'Action': 'sqs:*',
+                                'Effect': 'Allow',
+                                'Resource': GetAtt(images_queue_resource, 'Arn')
+                            },
+                            {
+                                'Action': [
+                                    'dynamodb:BatchGetItem',
+                                    'dynamodb:DeleteItem',
+                                    'dynamodb:GetItem',
+                                    'dynamodb:PutItem',
+                                    'dynamodb:UpdateItem'
+                                ],
+                                'Effect': 'Allow',
+                                'Resource': GetAtt(cache_table_resource, 'Arn')
                             }
                         ]
                     }
@@ -734,8 +2387,15 @@ def create_elasticsearch_security_group_resource(template, api_security_group_re
 
 
 def create_elasticsearch_resource(template, elasticsearch_domain_name_variable,
-                               elasticsearch_instance_count_parameter, elasticsearch_instance_class_parameter,
-                               elasticsearch_security_group_resource, subnets_parameter):
+                               elasticsearch_instance_count_variable, elasticsearch_instance_class_variable,
+                               elasticsearch_security_group_resource, subnets_parameter,
+                               elasticsearch_availability_zone_count_parameter,
+                               elasticsearch_dedicated_master_count_parameter,
+                               elasticsearch_dedicated_master_class_parameter, is_elasticsearch_zone_aware_condition,
+                               has_three_elasticsearch_zones_condition,
+                               has_elasticsearch_dedicated_masters_condition, elasticsearch_volume_type_parameter,
+                               elasticsearch_volume_size_parameter, elasticsearch_volume_iops_parameter,
+                               is_elasticsearch_gp3_condition):
     return template.add_resource(
         elasticsearch.Domain(
             'Elasticsearch',
@@ -756,17 +2416,704 @@ def create_elasticsearch_resource(template, elasticsearch_domain_name_variable,
             DomainName=elasticsearch_domain_name_variable,
             EBSOptions=elasticsearch.EBSOptions(
                 EBSEnabled=True,
-                VolumeSize=10,
-                VolumeType='gp2'
+                VolumeSize=Ref(elasticsearch_volume_size_parameter),
+                VolumeType=Ref(elasticsearch_volume_type_parameter),
+                Iops=If(is_elasticsearch_gp3_condition, Ref(elasticsearch_volume_iops_parameter), NoValue)
             ),
             ElasticsearchClusterConfig=elasticsearch.ElasticsearchClusterConfig(
-                InstanceCount=Ref(elasticsearch_instance_count_parameter),
-                InstanceType=Ref(elasticsearch_instance_class_parameter)
+                InstanceCount=elasticsearch_instance_count_variable,
+                InstanceType=elasticsearch_instance_class_variable,
+                ZoneAwarenessEnabled=If(is_elasticsearch_zone_aware_condition, True, False),
+                ZoneAwarenessConfig=If(
+                    is_elasticsearch_zone_aware_condition,
+                    elasticsearch.ZoneAwarenessConfig(
+                        AvailabilityZoneCount=Ref(elasticsearch_availability_zone_count_parameter)
+                    ),
+                    NoValue
+                ),
+                DedicatedMasterEnabled=If(has_elasticsearch_dedicated_masters_condition, True, False),
+                DedicatedMasterCount=If(has_elasticsearch_dedicated_masters_condition,
+                                        Ref(elasticsearch_dedicated_master_count_parameter), NoValue),
+                DedicatedMasterType=If(has_elasticsearch_dedicated_masters_condition,
+                                       Ref(elasticsearch_dedicated_master_class_parameter), NoValue)
             ),
             ElasticsearchVersion='6.3',
             VPCOptions=elasticsearch.VPCOptions(
                 SecurityGroupIds=[GetAtt(elasticsearch_security_group_resource, 'GroupId')],
-                SubnetIds=[Select(0, Ref(subnets_parameter))]
+                SubnetIds=If(
+                    has_three_elasticsearch_zones_condition,
+                    [Select(0, Ref(subnets_parameter)), Select(1, Ref(subnets_parameter)),
+                     Select(2, Ref(subnets_parameter))],
+                    If(
+                        is_elasticsearch_zone_aware_condition,
+                        [Select(0, Ref(subnets_parameter)), Select(1, Ref(subnets_parameter))],
+                        [Select(0, Ref(subnets_parameter))]
+                    )
+                )
+            )
+        )
+    )
+
+
+def create_api_cache_policy_resource(template, has_cdn_condition, api_cache_policy_name_variable):
+    return template.add_resource(
+        cloudfront.CachePolicy(
+            'ApiCachePolicy',
+            Condition=has_cdn_condition,
+            CachePolicyConfig=cloudfront.CachePolicyConfig(
+                Name=api_cache_policy_name_variable,
+                Comment='Caches API responses for as long as their Cache-Control headers allow',
+                MinTTL=0,
+                DefaultTTL=0,
+                MaxTTL=86400,
+                ParametersInCacheKeyAndForwardedToOrigin=cloudfront.ParametersInCacheKeyAndForwardedToOrigin(
+                    EnableAcceptEncodingGzip=True,
+                    EnableAcceptEncodingBrotli=True,
+                    CookiesConfig=cloudfront.CacheCookiesConfig(
+                        CookieBehavior='none'
+                    ),
+                    HeadersConfig=cloudfront.CacheHeadersConfig(
+                        HeaderBehavior='whitelist',
+                        Headers=['Accept', 'Authorization', 'Host']
+                    ),
+                    QueryStringsConfig=cloudfront.CacheQueryStringsConfig(
+                        QueryStringBehavior='all'
+                    )
+                )
+            )
+        )
+    )
+
+
+def create_uploads_origin_access_control_resource(template, has_cdn_condition,
+                                                 uploads_origin_access_control_name_variable):
+    return template.add_resource(
+        cloudfront.OriginAccessControl(
+            'UploadsOriginAccessControl',
+            Condition=has_cdn_condition,
+            OriginAccessControlConfig=cloudfront.OriginAccessControlConfig(
+                Name=uploads_origin_access_control_name_variable,
+                Description='For CloudFront to read public files from the uploads bucket',
+                OriginAccessControlOriginType='s3',
+                SigningBehavior='always',
+                SigningProtocol='sigv4'
+            )
+        )
+    )
+
+
+def create_cdn_resource(template, has_cdn_condition, api_domain_name_parameter, cdn_certificate_arn_parameter,
+                        load_balancer_resource, uploads_bucket_resource, api_cache_policy_resource,
+                        uploads_origin_access_control_resource):
+    # AWS managed cache and origin request policies.
+    caching_disabled_policy_id = '4135ea2d-6df8-44a3-9df3-4b5a84be39ad'
+    caching_optimized_policy_id = '658327ea-f89d-4fab-a63d-7e88639e58f6'
+    all_viewer_policy_id = '216adef6-5c7f-47e4-b989-5492eafa07d3'
+
+    return template.add_resource(
+        cloudfront.Distribution(
+            'Cdn',
+            Condition=has_cdn_condition,
+            DistributionConfig=cloudfront.DistributionConfig(
+                Comment='Edge cache for the API and public uploads',
+                Enabled=True,
+                Aliases=[Ref(api_domain_name_parameter)],
+                HttpVersion='http2and3',
+                IPV6Enabled=True,
+                PriceClass='PriceClass_100',
+                ViewerCertificate=cloudfront.ViewerCertificate(
+                    AcmCertificateArn=Ref(cdn_certificate_arn_parameter),
+                    MinimumProtocolVersion='TLSv1.2_2021',
+                    SslSupportMethod='sni-only'
+                ),
+                Origins=[
+                    cloudfront.Origin(
+                        Id='api',
+                        DomainName=GetAtt(load_balancer_resource, 'DNSName'),
+                        CustomOriginConfig=cloudfront.CustomOriginConfig(
+                            OriginProtocolPolicy='https-only',
+                            OriginSSLProtocols=['TLSv1.2'],
+                            OriginKeepaliveTimeout=60,
+                            OriginReadTimeout=60
+                        )
+                    ),
+                    cloudfront.Origin(
+                        Id='uploads',
+                        DomainName=GetAtt(uploads_bucket_resource, 'RegionalDomainName'),
+                        OriginAccessControlId=GetAtt(uploads_origin_access_control_resource, 'Id'),
+                        S3OriginConfig=cloudfront.S3OriginConfig(
+                            OriginAccessIdentity=''
+                        )
+                    )
+                ],
+                DefaultCacheBehavior=cloudfront.DefaultCacheBehavior(
+                    TargetOriginId='api',
+                    ViewerProtocolPolicy='redirect-to-https',
+                    AllowedMethods=['GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'POST', 'DELETE'],
+                    CachePolicyId=caching_disabled_policy_id,
+                    OriginRequestPolicyId=all_viewer_policy_id,
+                    Compress=True
+                ),
+                CacheBehaviors=[
+                    cloudfront.CacheBehavior(
+                        PathPattern=path_pattern,
+                        TargetOriginId='api',
+                        ViewerProtocolPolicy='redirect-to-https',
+                        AllowedMethods=['GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'POST', 'DELETE'],
+                        CachedMethods=['GET', 'HEAD'],
+                        CachePolicyId=Ref(api_cache_policy_resource),
+                        OriginRequestPolicyId=all_viewer_policy_id,
+                        Compress=True
+                    ) for path_pattern in [
+                        '/core/v1/services*',
+                        '/core/v1/organisations*',
+                        '/core/v1/collections*',
+                        '/core/v1/taxonomies*'
+                    ]
+                ] + [
+                    cloudfront.CacheBehavior(
+                        PathPattern='/files/public/*',
+                        TargetOriginId='uploads',
+                        ViewerProtocolPolicy='redirect-to-https',
+                        AllowedMethods=['GET', 'HEAD'],
+                        CachedMethods=['GET', 'HEAD'],
+                        CachePolicyId=caching_optimized_policy_id,
+                        Compress=True
+                    )
+                ]
+            )
+        )
+    )
+
+
+def create_uploads_bucket_policy_resource(template, has_cdn_condition, uploads_bucket_resource, cdn_resource):
+    return template.add_resource(
+        s3.BucketPolicy(
+            'UploadsBucketPolicy',
+            Condition=has_cdn_condition,
+            Bucket=Ref(uploads_bucket_resource),
+            PolicyDocument={
+                'Version': '2012-10-17',
+                'Statement': [
+                    {
+                        'Action': 's3:GetObject',
+                        'Effect': 'Allow',
+                        'Principal': {
+                            'Service': 'cloudfront.amazonaws.com'
+                        },
+                        'Resource': Join('/', [GetAtt(uploads_bucket_resource, 'Arn'), 'files/public/*']),
+                        'Condition': {
+                            'StringEquals': {
+                                'AWS:SourceArn': Sub('arn:aws:cloudfront::${AWS::AccountId}:distribution/${Cdn}',
+                                                     Cdn=Ref(cdn_resource))
+                            }
+                        }
+                    }
+                ]
+            }
+        )
+    )
+
+
+def create_dashboard_resource(template, dashboard_name_variable, load_balancer_resource, ecs_cluster_resource,
+                              api_service_resource, is_scheduler_service_condition, scheduler_service_resource,
+                              default_queue_worker_service_resource, notifications_queue_worker_service_resource,
+                              search_queue_worker_service_resource, image_worker_service_resource,
+                              is_aurora_database_condition, database_resource, database_cluster_resource,
+                              redis_resource, elasticsearch_resource, default_queue_resource,
+                              notifications_queue_resource, search_queue_resource, images_queue_resource):
+    def widget(x, y, title, metrics, stat='Average', **properties):
+        return {
+            'type': 'metric',
+            'x': x,
+            'y': y,
+            'width': 8,
+            'height': 6,
+            'properties': dict({
+                'title': title,
+                'region': '${AWS::Region}',
+                'view': 'timeSeries',
+                'stat': stat,
+                'period': 60,
+                'metrics': metrics
+            }, **properties)
+        }
+
+    ecs_services = ['${ApiService}', '${SchedulerService}', '${DefaultQueueWorkerService}',
+                    '${NotificationsQueueWorkerService}', '${SearchQueueWorkerService}', '${ImageWorkerService}']
+    queues = ['${DefaultQueue}', '${NotificationsQueue}', '${SearchQueue}', '${ImagesQueue}']
+    database = ['AWS/RDS', '${DatabaseDimension}', '${DatabaseIdentifier}']
+
+    widgets = [
+        # Load balancer.
+        widget(0, 0, 'Load balancer requests', [
+            ['AWS/ApplicationELB', 'RequestCount', 'LoadBalancer', '${LoadBalancer}']
+        ], stat='Sum'),
+        widget(8, 0, 'Target response time', [
+            ['AWS/ApplicationELB', 'TargetResponseTime', 'LoadBalancer', '${LoadBalancer}', {'stat': 'p50'}],
+            ['...', {'stat': 'p95'}],
+            ['...', {'stat': 'p99'}]
+        ]),
+        widget(16, 0, 'Load balancer 5xx', [
+            ['AWS/ApplicationELB', 'HTTPCode_Target_5XX_Count', 'LoadBalancer', '${LoadBalancer}'],
+            ['.', 'HTTPCode_ELB_5XX_Count', '.', '.']
+        ], stat='Sum'),
+        # ECS.
+        widget(0, 6, 'ECS CPU utilisation', [
+            ['AWS/ECS', 'CPUUtilization', 'ClusterName', '${Cluster}', 'ServiceName', service]
+            for service in ecs_services
+        ]),
+        widget(8, 6, 'ECS memory utilisation', [
+            ['AWS/ECS', 'MemoryUtilization', 'ClusterName', '${Cluster}', 'ServiceName', service]
+            for service in ecs_services
+        ]),
+        # RDS.
+        widget(16, 6, 'Database CPU and connections', [
+            database[:1] + ['CPUUtilization'] + database[1:],
+            database[:1] + ['DatabaseConnections'] + database[1:] + [{'yAxis': 'right'}]
+        ]),
+        widget(0, 12, 'Database read/write latency', [
+            database[:1] + ['ReadLatency'] + database[1:],
+            database[:1] + ['WriteLatency'] + database[1:]
+        ]),
+        widget(8, 12, 'Database read/write IOPS', [
+            database[:1] + ['ReadIOPS'] + database[1:],
+            database[:1] + ['WriteIOPS'] + database[1:]
+        ]),
+        # Redis.
+        widget(16, 12, 'Redis hits, misses and evictions', [
+            [{'expression': "SEARCH('{{AWS/ElastiCache,CacheClusterId,CacheNodeId}} "
+                            "MetricName=\"{}\" ${{Redis}}', 'Sum', 60)".format(metric), 'id': 'e{}'.format(i)}]
+            for i, metric in enumerate(['CacheHits', 'CacheMisses', 'Evictions'])
+        ], stat='Sum'),
+        # Elasticsearch.
+        widget(0, 18, 'Elasticsearch search latency', [
+            ['AWS/ES', 'SearchLatency', 'DomainName', '${Elasticsearch}', 'ClientId', '${AWS::AccountId}']
+        ]),
+        widget(8, 18, 'Elasticsearch JVM memory pressure', [
+            ['AWS/ES', 'JVMMemoryPressure', 'DomainName', '${Elasticsearch}', 'ClientId', '${AWS::AccountId}'],
+            ['.', 'MasterJVMMemoryPressure', '.', '.', '.', '.']
+        ], stat='Maximum'),
+        # SQS.
+        widget(16, 18, 'Queue depth', [
+            ['AWS/SQS', 'ApproximateNumberOfMessagesVisible', 'QueueName', queue] for queue in queues
+        ]),
+        widget(0, 24, 'Queue oldest message age', [
+            ['AWS/SQS', 'ApproximateAgeOfOldestMessage', 'QueueName', queue] for queue in queues
+        ], stat='Maximum')
+    ]
+
+    return template.add_resource(
+        cloudwatch.Dashboard(
+            'Dashboard',
+            DashboardName=dashboard_name_variable,
+            DashboardBody=Sub(
+                json.dumps({'widgets': widgets}),
+                LoadBalancer=GetAtt(load_balancer_resource, 'LoadBalancerFullName'),
+                Cluster=Ref(ecs_cluster_resource),
+                ApiService=GetAtt(api_service_resource, 'Name'),
+                SchedulerService=If(is_scheduler_service_condition, GetAtt(scheduler_service_resource, 'Name'),
+                                    'scheduler'),
+                DefaultQueueWorkerService=GetAtt(default_queue_worker_service_resource, 'Name'),
+                NotificationsQueueWorkerService=GetAtt(notifications_queue_worker_service_resource, 'Name'),
+                SearchQueueWorkerService=GetAtt(search_queue_worker_service_resource, 'Name'),
+                ImageWorkerService=GetAtt(image_worker_service_resource, 'Name'),
+                DatabaseDimension=If(is_aurora_database_condition, 'DBClusterIdentifier', 'DBInstanceIdentifier'),
+                DatabaseIdentifier=If(is_aurora_database_condition, Ref(database_cluster_resource),
+                                      Ref(database_resource)),
+                Redis=Ref(redis_resource),
+                Elasticsearch=Ref(elasticsearch_resource),
+                DefaultQueue=GetAtt(default_queue_resource, 'QueueName'),
+                NotificationsQueue=GetAtt(notifications_queue_resource, 'QueueName'),
+                SearchQueue=GetAtt(search_queue_resource, 'QueueName'),
+                ImagesQueue=GetAtt(images_queue_resource, 'QueueName')
             )
         )
     )
+
+
+def create_alarm_topic_resource(template):
+    return template.add_resource(
+        sns.Topic(
+            'AlarmTopic',
+            DisplayName='API alarms'
+        )
+    )
+
+
+def create_api_latency_alarm_resource(template, load_balancer_resource, api_latency_alarm_threshold_parameter,
+                                      alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'ApiLatencyAlarm',
+            AlarmDescription='The p99 API response time is too high',
+            Namespace='AWS/ApplicationELB',
+            MetricName='TargetResponseTime',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='LoadBalancer',
+                Value=GetAtt(load_balancer_resource, 'LoadBalancerFullName')
+            )],
+            ExtendedStatistic='p99',
+            Period=60,
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(api_latency_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_api_5xx_alarm_resource(template, load_balancer_resource, api_5xx_alarm_threshold_parameter,
+                                  alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'Api5xxAlarm',
+            AlarmDescription='The API is returning too many 5xx responses',
+            Namespace='AWS/ApplicationELB',
+            MetricName='HTTPCode_Target_5XX_Count',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='LoadBalancer',
+                Value=GetAtt(load_balancer_resource, 'LoadBalancerFullName')
+            )],
+            Statistic='Sum',
+            Period=60,
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(api_5xx_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_database_cpu_alarm_resource(template, is_aurora_database_condition, database_resource,
+                                       database_cluster_resource, database_cpu_alarm_threshold_parameter,
+                                       alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'DatabaseCpuAlarm',
+            AlarmDescription='The database CPU utilisation is too high',
+            Namespace='AWS/RDS',
+            MetricName='CPUUtilization',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name=If(is_aurora_database_condition, 'DBClusterIdentifier', 'DBInstanceIdentifier'),
+                Value=If(is_aurora_database_condition, Ref(database_cluster_resource), Ref(database_resource))
+            )],
+            Statistic='Average',
+            Period=60,
+            EvaluationPeriods=10,
+            DatapointsToAlarm=8,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(database_cpu_alarm_threshold_parameter),
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_database_free_storage_alarm_resource(template, is_mysql_database_condition, database_resource,
+                                                database_free_storage_alarm_threshold_parameter,
+                                                alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'DatabaseFreeStorageAlarm',
+            Condition=is_mysql_database_condition,
+            AlarmDescription='The database is running out of storage',
+            Metrics=[
+                cloudwatch.MetricDataQuery(
+                    Id='storage',
+                    MetricStat=cloudwatch.MetricStat(
+                        Metric=cloudwatch.Metric(
+                            Namespace='AWS/RDS',
+                            MetricName='FreeStorageSpace',
+                            Dimensions=[cloudwatch.MetricDimension(
+                                Name='DBInstanceIdentifier',
+                                Value=Ref(database_resource)
+                            )]
+                        ),
+                        Period=300,
+                        Stat='Minimum'
+                    ),
+                    ReturnData=False
+                ),
+                cloudwatch.MetricDataQuery(
+                    Id='storage_gib',
+                    Expression='storage / 1073741824',
+                    Label='Free storage (GiB)',
+                    ReturnData=True
+                )
+            ],
+            EvaluationPeriods=1,
+            ComparisonOperator='LessThanOrEqualToThreshold',
+            Threshold=Ref(database_free_storage_alarm_threshold_parameter),
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_database_read_replica_lag_alarm_resource(template, number, database_read_replica_condition,
+                                                    database_read_replica_resource,
+                                                    database_replica_lag_alarm_threshold_parameter,
+                                                    alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'DatabaseReadReplica{}LagAlarm'.format(number),
+            Condition=database_read_replica_condition,
+            AlarmDescription='The database read replica is lagging too far behind the primary',
+            Namespace='AWS/RDS',
+            MetricName='ReplicaLag',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='DBInstanceIdentifier',
+                Value=Ref(database_read_replica_resource)
+            )],
+            Statistic='Maximum',
+            Period=60,
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(database_replica_lag_alarm_threshold_parameter),
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_database_cluster_replica_lag_alarm_resource(template, is_aurora_database_condition,
+                                                       database_cluster_resource,
+                                                       database_replica_lag_alarm_threshold_parameter,
+                                                       alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'DatabaseClusterReplicaLagAlarm',
+            Condition=is_aurora_database_condition,
+            AlarmDescription='The Aurora readers are lagging too far behind the writer',
+            Metrics=[
+                cloudwatch.MetricDataQuery(
+                    Id='lag',
+                    MetricStat=cloudwatch.MetricStat(
+                        Metric=cloudwatch.Metric(
+                            Namespace='AWS/RDS',
+                            MetricName='AuroraReplicaLagMaximum',
+                            Dimensions=[cloudwatch.MetricDimension(
+                                Name='DBClusterIdentifier',
+                                Value=Ref(database_cluster_resource)
+                            )]
+                        ),
+                        Period=60,
+                        Stat='Maximum'
+                    ),
+                    ReturnData=False
+                ),
+                cloudwatch.MetricDataQuery(
+                    Id='lag_seconds',
+                    Expression='lag / 1000',
+                    Label='Replica lag (seconds)',
+                    ReturnData=True
+                )
+            ],
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(database_replica_lag_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_redis_node_metric_data_queries(redis_resource, shard, metric_name, stat, period):
+    # Cluster mode node IDs follow <group>-<shard>-<node>, and a shard has a primary and up to 5 replicas.
+    return [
+        cloudwatch.MetricDataQuery(
+            Id='node_{}'.format(node),
+            MetricStat=cloudwatch.MetricStat(
+                Metric=cloudwatch.Metric(
+                    Namespace='AWS/ElastiCache',
+                    MetricName=metric_name,
+                    Dimensions=[cloudwatch.MetricDimension(
+                        Name='CacheClusterId',
+                        Value=Sub('${{{}}}-{:04d}-{:03d}'.format(redis_resource.title, shard, node))
+                    )]
+                ),
+                Period=period,
+                Stat=stat
+            ),
+            ReturnData=False
+        )
+        for node in range(1, 7)
+    ]
+
+
+def create_redis_cpu_alarm_resources(template, has_redis_shard_conditions, redis_resource,
+                                     redis_cpu_alarm_threshold_parameter, alarm_topic_resource):
+    # Alarms hold at most 10 metrics, so each shard gets its own alarm, created only when the shard exists.
+    alarms = []
+    for shard, has_redis_shard_condition in enumerate(has_redis_shard_conditions, start=1):
+        alarm = cloudwatch.Alarm(
+            'RedisShard{}CpuAlarm'.format(shard),
+            AlarmDescription='A Redis shard {} node engine CPU utilisation is too high'.format(shard),
+            Metrics=create_redis_node_metric_data_queries(redis_resource, shard, 'EngineCPUUtilization', 'Average',
+                                                          60) + [
+                cloudwatch.MetricDataQuery(
+                    Id='cpu',
+                    Expression='MAX(METRICS())',
+                    Label='Highest node engine CPU utilisation',
+                    ReturnData=True
+                )
+            ],
+            EvaluationPeriods=10,
+            DatapointsToAlarm=8,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(redis_cpu_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+        if has_redis_shard_condition is not None:
+            alarm.Condition = has_redis_shard_condition
+        alarms.append(template.add_resource(alarm))
+
+    return alarms
+
+
+def create_redis_evictions_alarm_resources(template, has_redis_shard_conditions, redis_resource,
+                                           redis_evictions_alarm_threshold_parameter, alarm_topic_resource):
+    alarms = []
+    for shard, has_redis_shard_condition in enumerate(has_redis_shard_conditions, start=1):
+        alarm = cloudwatch.Alarm(
+            'RedisShard{}EvictionsAlarm'.format(shard),
+            AlarmDescription='Redis shard {} is evicting keys because it is out of memory'.format(shard),
+            Metrics=create_redis_node_metric_data_queries(redis_resource, shard, 'Evictions', 'Sum', 300) + [
+                cloudwatch.MetricDataQuery(
+                    Id='evictions',
+                    Expression='SUM(METRICS())',
+                    Label='Evictions across the shard nodes',
+                    ReturnData=True
+                )
+            ],
+            EvaluationPeriods=1,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(redis_evictions_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+        if has_redis_shard_condition is not None:
+            alarm.Condition = has_redis_shard_condition
+        alarms.append(template.add_resource(alarm))
+
+    return alarms
+
+
+def create_elasticsearch_jvm_pressure_alarm_resource(template, elasticsearch_resource,
+                                                     elasticsearch_jvm_pressure_alarm_threshold_parameter,
+                                                     alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'ElasticsearchJvmPressureAlarm',
+            AlarmDescription='The Elasticsearch JVM memory pressure is too high',
+            Namespace='AWS/ES',
+            MetricName='JVMMemoryPressure',
+            Dimensions=[
+                cloudwatch.MetricDimension(
+                    Name='DomainName',
+                    Value=Ref(elasticsearch_resource)
+                ),
+                cloudwatch.MetricDimension(
+                    Name='ClientId',
+                    Value=Ref('AWS::AccountId')
+                )
+            ],
+            Statistic='Maximum',
+            Period=60,
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(elasticsearch_jvm_pressure_alarm_threshold_parameter),
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_elasticsearch_cluster_status_alarm_resource(template, elasticsearch_resource, alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            'ElasticsearchClusterStatusAlarm',
+            AlarmDescription='The Elasticsearch cluster status is red',
+            Namespace='AWS/ES',
+            MetricName='ClusterStatus.red',
+            Dimensions=[
+                cloudwatch.MetricDimension(
+                    Name='DomainName',
+                    Value=Ref(elasticsearch_resource)
+                ),
+                cloudwatch.MetricDimension(
+                    Name='ClientId',
+                    Value=Ref('AWS::AccountId')
+                )
+            ],
+            Statistic='Maximum',
+            Period=60,
+            EvaluationPeriods=1,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=1,
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_queue_oldest_message_alarm_resource(template, queue, queue_resource,
+                                               queue_message_age_alarm_threshold_parameter, alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            '{}QueueOldestMessageAlarm'.format(queue.title()),
+            AlarmDescription='The oldest {} queue message has been waiting too long'.format(queue),
+            Namespace='AWS/SQS',
+            MetricName='ApproximateAgeOfOldestMessage',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='QueueName',
+                Value=GetAtt(queue_resource, 'QueueName')
+            )],
+            Statistic='Maximum',
+            Period=60,
+            EvaluationPeriods=5,
+            DatapointsToAlarm=3,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=Ref(queue_message_age_alarm_threshold_parameter),
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
+
+
+def create_dead_letter_queue_alarm_resource(template, queue, dead_letter_queue_resource, alarm_topic_resource):
+    return template.add_resource(
+        cloudwatch.Alarm(
+            '{}DeadLetterQueueAlarm'.format(queue.title()),
+            AlarmDescription='{} queue messages have been moved to the dead-letter queue'.format(queue.title()),
+            Namespace='AWS/SQS',
+            MetricName='ApproximateNumberOfMessagesVisible',
+            Dimensions=[cloudwatch.MetricDimension(
+                Name='QueueName',
+                Value=GetAtt(dead_letter_queue_resource, 'QueueName')
+            )],
+            Statistic='Maximum',
+            Period=300,
+            EvaluationPeriods=1,
+            ComparisonOperator='GreaterThanOrEqualToThreshold',
+            Threshold=1,
+            TreatMissingData='notBreaching',
+            AlarmActions=[Ref(alarm_topic_resource)],
+            OKActions=[Ref(alarm_topic_resource)]
+        )
+    )
@@ -0,0 +1,127 @@
+from troposphere import And, Equals, Not, Or, Ref
+
+
+def create_elasticsearch_instance_count_rule(template, elasticsearch_availability_zone_count_parameter,
+                                            elasticsearch_instance_count_parameter, performance_profile_parameter,
+                                            performance_profiles_mapping, availability_zone_count):
+    name = 'ElasticsearchInstanceCountFor{}Zones'.format(availability_zone_count)
+    instance_counts = [str(count) for count in range(availability_zone_count, 41, availability_zone_count)]
+    profiles = [profile for profile, values in template.mappings[performance_profiles_mapping].items()
+                if values['ElasticsearchInstanceCount'] in instance_counts]
+    template.add_rule(name, {
+        'RuleCondition': Equals(Ref(elasticsearch_availability_zone_count_parameter), str(availability_zone_count)),
+        'Assertions': [
+            {
+                'Assert': Or(
+                    {'Fn::Contains': [instance_counts, Ref(elasticsearch_instance_count_parameter)]},
+                    And(
+                        Equals(Ref(elasticsearch_instance_count_parameter), ''),
+                        {'Fn::Contains': [profiles, Ref(performance_profile_parameter)]}
+                    )
+                ),
+                'AssertDescription': 'The Elasticsearch instance count must be a multiple of the availability zone '
+                                     'count, so each zone holds a copy of every shard.'
+            }
+        ]
+    })
+
+    return name
+
+
+def create_api_slow_start_duration_rule(template, api_slow_start_duration_parameter):
+    name = 'ApiSlowStartDuration'
+    template.add_rule(name, {
+        'Assertions': [
+            {
+                'Assert': {
+                    'Fn::Not': [{
+                        'Fn::Contains': [
+                            [str(duration) for duration in range(1, 30)],
+                            Ref(api_slow_start_duration_parameter)
+                        ]
+                    }]
+                },
+                'AssertDescription': 'The API slow start duration must be 0, or between 30 and 900 seconds.'
+            }
+        ]
+    })
+
+    return name
+
+
+def create_parameter_order_assertions(lower_parameter, upper_parameter, allow_equal, description):
+    # Rules cannot compare numbers, so each allowed lower value lists the upper values that are too small.
+    upper_values = [int(value) for value in upper_parameter.properties['AllowedValues']]
+    assertions = []
+    for lower_value in lower_parameter.properties['AllowedValues']:
+        too_small = [str(value) for value in upper_values
+                     if value < int(lower_value) or (value == int(lower_value) and not allow_equal)]
+        if too_small:
+            assertions.append({
+                'Assert': Or(
+                    Not(Equals(Ref(lower_parameter), lower_value)),
+                    Not({'Fn::Contains': [too_small, Ref(upper_parameter)]})
+                ),
+                'AssertDescription': description
+            })
+
+    return assertions
+
+
+def create_route_tables_rule(template, s3_vpc_endpoint_parameter, route_tables_parameter):
+    name = 'RouteTablesForS3VpcEndpoint'
+    template.add_rule(name, {
+        'RuleCondition': Equals(Ref(s3_vpc_endpoint_parameter), 'enabled'),
+        'Assertions': [
+            {
+                'Assert': Not({'Fn::EachMemberEquals': [Ref(route_tables_parameter), '']}),
+                'AssertDescription': 'The route tables must be set when the S3 VPC endpoint is enabled, so the '
+                                     'subnets route S3 traffic through the gateway endpoint.'
+            }
+        ]
+    })
+
+    return name
+
+
+def create_queue_visibility_timeout_rule(template, queue, queue_worker_timeout_parameter,
+                                         queue_visibility_timeout_parameter):
+    name = '{}QueueVisibilityTimeoutAboveWorkerTimeout'.format(queue.title())
+    template.add_rule(name, {
+        'Assertions': create_parameter_order_assertions(
+            queue_worker_timeout_parameter, queue_visibility_timeout_parameter, False,
+            'The {} queue visibility timeout must be above the worker timeout, so running jobs are not '
+            'delivered twice.'.format(queue)
+        )
+    })
+
+    return name
+
+
+def create_memory_hard_limit_rule(template, name, memory_reservation_parameter, memory_hard_limit_parameter):
+    name = '{}MemoryHardLimitNotBelowReservation'.format(name)
+    template.add_rule(name, {
+        'Assertions': create_parameter_order_assertions(
+            memory_reservation_parameter, memory_hard_limit_parameter, True,
+            'The {} must not be below the {}, or ECS rejects the task definition.'.format(
+                memory_hard_limit_parameter.title, memory_reservation_parameter.title)
+        )
+    })
+
+    return name
+
+
+def create_profiled_parameter_range_rule(template, parameter, min_value, max_value, description):
+    name = '{}Range'.format(parameter.title)
+    template.add_rule(name, {
+        'Assertions': [
+            {
+                'Assert': {
+                    'Fn::Contains': [[''] + [str(value) for value in range(min_value, max_value + 1)], Ref(parameter)]
+                },
+                'AssertDescription': description
+            }
+        ]
+    })
+
+    return name
@@ -1,10 +1,14 @@
-from troposphere import Join, Ref
+from troposphere import Join, Ref, If, FindInMap, Split
 
 
 def create_default_queue_name_variable(environment_parameter, uuid_parameter):
     return Join('-', [Ref(environment_parameter), Ref(uuid_parameter), 'default'])
 
 
+def create_dead_letter_queue_name_variable(queue_name_variable):
+    return Join('-', [queue_name_variable, 'dead-letter'])
+
+
 def create_notifications_queue_name_variable(environment_parameter, uuid_parameter):
     return Join('-', [Ref(environment_parameter), Ref(uuid_parameter), 'notifications'])
 
@@ -17,6 +21,19 @@ def create_uploads_bucket_name_variable(environment_parameter, uuid_parameter):
     return Join('-', ['uploads', Ref(environment_parameter), Ref(uuid_parameter)])
 
 
+def create_cache_table_name_variable(environment_parameter, uuid_parameter):
+    return Join('-', ['cache', Ref(environment_parameter), Ref(uuid_parameter)])
+
+
+def create_access_logs_bucket_name_variable(environment_parameter, uuid_parameter):
+    return Join('-', ['access-logs', Ref(environment_parameter), Ref(uuid_parameter)])
+
+
+def create_access_logs_database_name_variable(environment_parameter, uuid_parameter):
+    # Athena needs backticks around hyphens in database names, so they are swapped for underscores.
+    return Join('_', Split('-', Join('_', ['access_logs', Ref(environment_parameter), Ref(uuid_parameter)])))
+
+
 def create_api_launch_template_name_variable(environment_parameter):
     return Join('-', ['api-launch-template', Ref(environment_parameter)])
 
@@ -41,8 +58,37 @@ def create_api_task_definition_family_variable(environment_parameter):
     return Join('-', ['api', Ref(environment_parameter)])
 
 
-def create_queue_worker_task_definition_family_variable(environment_parameter):
-    return Join('-', ['queue-worker', Ref(environment_parameter)])
+def create_queue_worker_task_definition_family_variable(environment_parameter, queue):
+    return Join('-', ['queue-worker', queue, Ref(environment_parameter)])
+
+
+def create_queue_worker_service_name_variable(queue):
+    return '-'.join(['queue-worker', queue])
+
+
+def create_api_burst_task_definition_family_variable(environment_parameter):
+    return Join('-', ['api-burst', Ref(environment_parameter)])
+
+
+def create_queue_worker_burst_task_definition_family_variable(environment_parameter, queue):
+    return Join('-', ['queue-worker', queue, 'burst', Ref(environment_parameter)])
+
+
+def create_queue_worker_burst_service_name_variable(queue):
+    return '-'.join(['queue-worker', queue, 'burst'])
+
+
+def create_fargate_burst_traffic_weight_variable(fargate_burst_traffic_percentage_parameter,
+                                                 fargate_burst_traffic_weights_mapping, launch_type):
+    return FindInMap(fargate_burst_traffic_weights_mapping, Ref(fargate_burst_traffic_percentage_parameter), launch_type)
+
+
+def create_image_worker_task_definition_family_variable(environment_parameter):
+    return Join('-', ['image-worker', Ref(environment_parameter)])
+
+
+def create_images_queue_name_variable(environment_parameter, uuid_parameter):
+    return Join('-', [Ref(environment_parameter), Ref(uuid_parameter), 'images'])
 
 
 def create_scheduler_task_definition_family_variable(environment_parameter):
@@ -67,3 +113,43 @@ def create_database_username_variable():
 
 def create_elasticsearch_domain_name_variable(environment_parameter):
     return Join('-', ['search', Ref(environment_parameter)])
+
+
+def create_api_cache_policy_name_variable(environment_parameter):
+    return Join('-', ['api', Ref(environment_parameter)])
+
+
+def create_uploads_origin_access_control_name_variable(environment_parameter):
+    return Join('-', ['uploads', Ref(environment_parameter)])
+
+
+def create_profiled_variable(parameter, overridden_condition, performance_profile_parameter,
+                             performance_profiles_mapping):
+    return If(overridden_condition, Ref(parameter),
+              FindInMap(performance_profiles_mapping, Ref(performance_profile_parameter), parameter.title))
+
+
+def create_dashboard_name_variable(environment_parameter):
+    return Join('-', ['api', Ref(environment_parameter)])
+
+
+def create_api_instance_min_in_service_variable(is_api_instance_count_fixed_condition, api_instance_min_count_variable,
+                                                api_instance_min_count_parameter,
+                                                api_instance_min_count_overridden_condition,
+                                                performance_profile_parameter, performance_profiles_mapping,
+                                                instance_counts_mapping):
+    # Rolling updates need an instance in service below the max size, so keep one fewer when min and max are equal.
+    return If(
+        is_api_instance_count_fixed_condition,
+        If(
+            api_instance_min_count_overridden_condition,
+            FindInMap(instance_counts_mapping, Ref(api_instance_min_count_parameter), 'OneFewer'),
+            FindInMap(
+                instance_counts_mapping,
+                FindInMap(performance_profiles_mapping, Ref(performance_profile_parameter),
+                          api_instance_min_count_parameter.title),
+                'OneFewer'
+            )
+        ),
+        api_instance_min_count_variable
+    )
@@ -42,6 +42,13 @@ return [
         'mysql' => [
             'driver' => 'mysql',
             'host' => env('DB_HOST', '127.0.0.1'),
+            'read' => [
+                'host' => explode(',', env('DB_READ_HOST') ?: env('DB_HOST', '127.0.0.1')),
+            ],
+            'write' => [
+                'host' => env('DB_HOST', '127.0.0.1'),
+            ],
+            'sticky' => true,
             'port' => env('DB_PORT', '3306'),
             'database' => env('DB_DATABASE', 'healthy_london_partnership'),
             'username' => env('DB_USERNAME', 'healthy_london_partnership'),
@@ -81,6 +81,11 @@ return [
         350,
     ],
 
+    /*
+     * The queue which receives S3 events for uploaded images to resize.
+     */
+    'image_uploads_queue' => 'images',
+
     /*
      * The NSH API credentials.
      */
@@ -26,7 +26,8 @@ Route::prefix('core/v1')
                 ->only('index', 'show');
 
             // Collection Categories.
-            Route::match(['GET', 'POST'], '/collections/categories/index', 'CollectionCategoryController@index');
+            Route::match(['GET', 'POST'], '/collections/categories/index', 'CollectionCategoryController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::apiResource('/collections/categories', 'CollectionCategoryController')
                 ->parameter('categories', 'collection')
                 ->names([
@@ -35,12 +36,14 @@ Route::prefix('core/v1')
                     'show' => 'collection-categories.show',
                     'update' => 'collection-categories.update',
                     'destroy' => 'collection-categories.destroy',
-                ]);
+                ])
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::get('/collections/categories/{collection}/image.png', 'Collection\\ImageController')
                 ->name('collection-categories.image');
 
             // Collection Personas.
-            Route::match(['GET', 'POST'], '/collections/personas/index', 'CollectionPersonaController@index');
+            Route::match(['GET', 'POST'], '/collections/personas/index', 'CollectionPersonaController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::apiResource('/collections/personas', 'CollectionPersonaController')
                 ->parameter('personas', 'collection')
                 ->names([
@@ -49,7 +52,8 @@ Route::prefix('core/v1')
                     'show' => 'collection-personas.show',
                     'update' => 'collection-personas.update',
                     'destroy' => 'collection-personas.destroy',
-                ]);
+                ])
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::get('/collections/personas/{collection}/image.png', 'Collection\\ImageController')
                 ->name('collection-personas.image');
 
@@ -81,8 +85,10 @@ Route::prefix('core/v1')
                 ->name('organisation-admin-invites.submit');
 
             // Organisations.
-            Route::match(['GET', 'POST'], '/organisations/index', 'OrganisationController@index');
-            Route::apiResource('/organisations', 'OrganisationController');
+            Route::match(['GET', 'POST'], '/organisations/index', 'OrganisationController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
+            Route::apiResource('/organisations', 'OrganisationController')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::get('/organisations/{organisation}/logo.png', 'Organisation\\LogoController')
                 ->name('organisations.logo');
             Route::post('/organisations/import', 'Organisation\\ImportController')
@@ -127,8 +133,10 @@ Route::prefix('core/v1')
                 ->name('service-locations.image');
 
             // Services.
-            Route::match(['GET', 'POST'], '/services/index', 'ServiceController@index');
-            Route::apiResource('/services', 'ServiceController');
+            Route::match(['GET', 'POST'], '/services/index', 'ServiceController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
+            Route::apiResource('/services', 'ServiceController')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::put('/services/{service}/refresh', 'Service\\RefreshController')
                 ->name('services.refresh');
             Route::get('/services/{service}/related', 'Service\\RelatedController')
@@ -157,7 +165,8 @@ Route::prefix('core/v1')
                 ->name('stop-words.update');
 
             // Taxonomy Categories.
-            Route::match(['GET', 'POST'], '/taxonomies/categories/index', 'TaxonomyCategoryController@index');
+            Route::match(['GET', 'POST'], '/taxonomies/categories/index', 'TaxonomyCategoryController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::apiResource('/taxonomies/categories', 'TaxonomyCategoryController')
                 ->parameter('categories', 'taxonomy')
                 ->names([
@@ -166,10 +175,12 @@ Route::prefix('core/v1')
                     'show' => 'taxonomy-categories.show',
                     'update' => 'taxonomy-categories.update',
                     'destroy' => 'taxonomy-categories.destroy',
-                ]);
+                ])
+                ->middleware('cache.guest:public;max_age=60;etag');
 
             // Taxonomy Organisations.
-            Route::match(['GET', 'POST'], '/taxonomies/organisations/index', 'TaxonomyOrganisationController@index');
+            Route::match(['GET', 'POST'], '/taxonomies/organisations/index', 'TaxonomyOrganisationController@index')
+                ->middleware('cache.guest:public;max_age=60;etag');
             Route::apiResource('/taxonomies/organisations', 'TaxonomyOrganisationController')
                 ->parameter('organisations', 'taxonomy')
                 ->names([
@@ -178,7 +189,8 @@ Route::prefix('core/v1')
                     'show' => 'taxonomy-organisations.show',
                     'update' => 'taxonomy-organisations.update',
                     'destroy' => 'taxonomy-organisations.destroy',
-                ]);
+                ])
+                ->middleware('cache.guest:public;max_age=60;etag');
 
             // Thesaurus.
             Route::get('/thesaurus', 'ThesaurusController@index')
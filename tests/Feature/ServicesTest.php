@@ -357,6 +357,30 @@ class ServicesTest extends TestCase
         });
     }
 
+    public function test_list_is_publicly_cacheable()
+    {
+        factory(Service::class)->create();
+
+        $response = $this->json('GET', '/core/v1/services');
+
+        $response->assertStatus(Response::HTTP_OK);
+        $response->assertHeader('Cache-Control', 'max-age=60, public');
+        $this->assertNotNull($response->headers->get('ETag'));
+    }
+
+    public function test_list_is_not_publicly_cacheable_for_authenticated_users()
+    {
+        $service = factory(Service::class)->create();
+        $user = $this->makeServiceWorker(factory(User::class)->create(), $service);
+
+        Passport::actingAs($user);
+
+        $response = $this->json('GET', '/core/v1/services');
+
+        $response->assertStatus(Response::HTTP_OK);
+        $response->assertHeader('Cache-Control', 'no-cache, private');
+    }
+
     public function test_guest_can_sort_by_service_name()
     {
         $serviceOne = factory(Service::class)->create(['name' => 'Service A']);
@@ -942,6 +966,17 @@ class ServicesTest extends TestCase
         });
     }
 
+    public function test_view_one_is_publicly_cacheable()
+    {
+        $service = factory(Service::class)->create();
+
+        $response = $this->json('GET', "/core/v1/services/{$service->id}");
+
+        $response->assertStatus(Response::HTTP_OK);
+        $response->assertHeader('Cache-Control', 'max-age=60, public');
+        $this->assertNotNull($response->headers->get('ETag'));
+    }
+
     /*
      * Update a specific service.
      */
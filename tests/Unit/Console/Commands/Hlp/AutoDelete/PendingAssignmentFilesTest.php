@@ -6,6 +6,7 @@ use App\Console\Commands\Hlp\AutoDelete\PendingAssignmentFilesCommand;
 use App\Models\File;
 use Illuminate\Support\Facades\Artisan;
 use Illuminate\Support\Facades\Date;
+use Illuminate\Support\Facades\Storage;
 use Tests\TestCase;
 
 class PendingAssignmentFilesTest extends TestCase
@@ -31,4 +32,24 @@ class PendingAssignmentFilesTest extends TestCase
         $this->assertDatabaseHas($newPendingAssignmentFile->getTable(), ['id' => $newPendingAssignmentFile->id]);
         $this->assertDatabaseMissing($dueForDeletionFile->getTable(), ['id' => $dueForDeletionFile->id]);
     }
+
+    public function test_auto_delete_removes_resized_versions()
+    {
+        /** @var \App\Models\File $dueForDeletionFile */
+        $dueForDeletionFile = factory(File::class)
+            ->states('pending-assignment')
+            ->create([
+                'filename' => 'image.png',
+                'mime_type' => File::MIME_TYPE_PNG,
+                'created_at' => Date::today()->subDays(File::PEDNING_ASSIGNMENT_AUTO_DELETE_DAYS),
+                'updated_at' => Date::today()->subDays(File::PEDNING_ASSIGNMENT_AUTO_DELETE_DAYS),
+            ]);
+        $dueForDeletionFile->upload(Storage::disk('local')->get('/test-data/image.png'));
+        $resizedFile = $dueForDeletionFile->resizedVersion(100);
+
+        Artisan::call(PendingAssignmentFilesCommand::class);
+
+        $this->assertDatabaseMissing($resizedFile->getTable(), ['id' => $resizedFile->id]);
+        $this->assertFalse(Storage::cloud()->exists($resizedFile->path()));
+    }
 }
@@ -0,0 +1,98 @@
+<?php
+
+namespace Tests\Unit\Console\Commands\Hlp;
+
+use App\Console\Commands\Hlp\ProcessImageUploadsCommand;
+use App\Models\File;
+use Illuminate\Database\Eloquent\ModelNotFoundException;
+use Illuminate\Support\Facades\Storage;
+use Illuminate\Support\Str;
+use Tests\TestCase;
+
+class ProcessImageUploadsCommandTest extends TestCase
+{
+    public function test_resized_versions_created_for_uploaded_image()
+    {
+        /** @var \App\Models\File $file */
+        $file = factory(File::class)->create([
+            'filename' => 'uploaded image.png',
+            'mime_type' => File::MIME_TYPE_PNG,
+        ]);
+        $file->upload(Storage::disk('local')->get('/test-data/image.png'));
+
+        $command = new ProcessImageUploadsCommand();
+        $command->processMessage($this->s3Event($file->path()));
+
+        foreach (config('hlp.cached_image_dimensions') as $maxDimension) {
+            $this->assertEquals(1, File::query()
+                ->whereRaw('`meta`->>"$.type" = ?', [File::META_TYPE_RESIZED_IMAGE])
+                ->whereRaw('`meta`->>"$.data.file_id" = ?', [$file->id])
+                ->whereRaw('`meta`->>"$.data.max_dimension" = ?', [$maxDimension])
+                ->count());
+        }
+    }
+
+    public function test_resized_versions_not_created_for_non_image()
+    {
+        /** @var \App\Models\File $file */
+        $file = factory(File::class)->create();
+
+        $command = new ProcessImageUploadsCommand();
+        $command->processMessage($this->s3Event($file->path()));
+
+        $this->assertEquals(0, File::query()
+            ->whereRaw('`meta`->>"$.type" = ?', [File::META_TYPE_RESIZED_IMAGE])
+            ->whereRaw('`meta`->>"$.data.file_id" = ?', [$file->id])
+            ->count());
+    }
+
+    public function test_resized_images_are_not_resized_again()
+    {
+        /** @var \App\Models\File $file */
+        $file = factory(File::class)->create([
+            'filename' => 'image.png',
+            'mime_type' => File::MIME_TYPE_PNG,
+        ]);
+        $file->upload(Storage::disk('local')->get('/test-data/image.png'));
+        $resizedFile = $file->resizedVersion(100);
+
+        $command = new ProcessImageUploadsCommand();
+        $command->processMessage($this->s3Event($resizedFile->path()));
+
+        $this->assertEquals(0, File::query()
+            ->whereRaw('`meta`->>"$.type" = ?', [File::META_TYPE_RESIZED_IMAGE])
+            ->whereRaw('`meta`->>"$.data.file_id" = ?', [$resizedFile->id])
+            ->count());
+    }
+
+    public function test_exception_thrown_for_uncommitted_file()
+    {
+        $this->expectException(ModelNotFoundException::class);
+
+        $command = new ProcessImageUploadsCommand();
+        $command->processMessage($this->s3Event('/files/public/' . Str::uuid() . '-image.png'));
+    }
+
+    /**
+     * @param string $path
+     * @return string
+     */
+    protected function s3Event(string $path): string
+    {
+        // S3 event keys keep their slashes and form encode each segment, so spaces become "+".
+        $key = implode('/', array_map('urlencode', explode('/', ltrim($path, '/'))));
+
+        return json_encode([
+            'Records' => [
+                [
+                    'eventName' => 'ObjectCreated:Put',
+                    's3' => [
+                        'object' => [
+                            'key' => $key,
+                        ],
+                    ],
+                ],
+            ],
+        ]);
+    }
+}